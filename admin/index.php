@@ -10,18 +10,781 @@ if ($rootDir === false) {
 
 $manifestPath = $rootDir . '/manifest.json';
 $checksDir = $rootDir . '/checks';
+$cacheDir = $rootDir . '/.cache/admin';
+$journalPath = $manifestPath . '.journal';
+$manifestLockPath = $manifestPath . '.lock';
+$queueDir = $rootDir . '/.queue';
+
+const LIST_PAGE_SIZE = 50;
+const CHECK_LEVELS = ['FATAL_ERROR', 'ERROR', 'WARNING', 'INFORMATION'];
+const WORKER_HEARTBEAT_TIMEOUT = 10;
+// Versions du manifeste gardées pour les deltas, comme DEFAULT_HISTORY dans docs_cc/manifest_versions.py.
+const MANIFEST_HISTORY = 5;
+// Regroupement des niveaux, comme LEVEL_GROUPS dans docs_cc/manifest_versions.py.
+const MANIFEST_LEVEL_GROUPS = [
+    'FATAL' => 'fatal_error',
+    'FATAL_ERROR' => 'fatal_error',
+    'ERROR' => 'error',
+    'WARNING' => 'warning',
+    'INFO' => 'information',
+    'INFORMATION' => 'information',
+];
+// Texte de la ligne « Statut en cas d'échec », comme STATUS_LABELS dans generate_checks_docs.py.
+const CHECK_STATUS_LABELS = [
+    'FATAL_ERROR' => ['fr' => 'Blocage critique (FATAL_ERROR)', 'en' => 'Blocking failure (FATAL_ERROR)'],
+    'ERROR' => ['fr' => 'Échec majeur (ERROR)', 'en' => 'Major failure (ERROR)'],
+    'WARNING' => ['fr' => 'Avertissement à résoudre (WARNING)', 'en' => 'Warning to address (WARNING)'],
+    'INFORMATION' => ['fr' => 'Information (INFORMATION)', 'en' => 'Information (INFORMATION)'],
+];
 
-function loadManifest(string $path): array
+const EXPLANATION_QUERY = "//section[contains(concat(' ', normalize-space(@class), ' '), ' content-section ')]"
+    . "[h2[contains(@data-fr, 'Explications') or contains(@data-en, 'Overview')]]"
+    . "//*[(@data-fr or @data-en) and not(self::h2)]";
+const RESOLUTION_QUERY = "//section[contains(concat(' ', normalize-space(@class), ' '), ' content-section ')]"
+    . "[h2[contains(@data-fr, 'Résolution') or contains(@data-en, 'Remediation')]]"
+    . "//*[(@data-fr or @data-en) and not(self::h2)]";
+
+/**
+ * Manifeste lu sur disque : [] s'il n'existe pas, null s'il est illisible ou
+ * invalide (la compaction ne doit alors pas le remplacer par le seul journal).
+ */
+function readManifestFile(string $path): ?array
 {
     if (!is_file($path)) {
         return [];
     }
     $contents = file_get_contents($path);
     if ($contents === false) {
-        return [];
+        return null;
     }
     $data = json_decode($contents, true);
-    return is_array($data) ? $data : [];
+    return is_array($data) && array_is_list($data) ? $data : null;
+}
+
+function loadManifest(string $path): array
+{
+    return readManifestFile($path) ?? [];
+}
+
+function apcuAvailable(): bool
+{
+    return function_exists('apcu_fetch') && function_exists('apcu_enabled') && apcu_enabled();
+}
+
+function cacheKey(string $cacheDir, string $name): string
+{
+    return 'cc-admin:' . md5($cacheDir) . ':' . $name;
+}
+
+/**
+ * Cache en mémoire partagée (APCu) si disponible, sinon fichier PHP généré
+ * par var_export() que l'opcache garde compilé entre les requêtes.
+ */
+function cacheFetch(string $cacheDir, string $name, string $signature): ?array
+{
+    if (apcuAvailable()) {
+        $cached = apcu_fetch(cacheKey($cacheDir, $name));
+    } else {
+        $cacheFile = $cacheDir . '/' . $name . '.php';
+        $cached = is_file($cacheFile) ? @include $cacheFile : null;
+    }
+
+    if (!is_array($cached) || ($cached['signature'] ?? null) !== $signature || !is_array($cached['value'] ?? null)) {
+        return null;
+    }
+
+    return $cached['value'];
+}
+
+function cacheStore(string $cacheDir, string $name, string $signature, array $value): void
+{
+    $payload = ['signature' => $signature, 'value' => $value];
+    if (apcuAvailable()) {
+        apcu_store(cacheKey($cacheDir, $name), $payload);
+        return;
+    }
+
+    if (!is_dir($cacheDir) && !@mkdir($cacheDir, 0775, true) && !is_dir($cacheDir)) {
+        return;
+    }
+    $cacheFile = $cacheDir . '/' . $name . '.php';
+    $temporaryFile = @tempnam($cacheDir, $name);
+    if ($temporaryFile === false) {
+        return;
+    }
+    $code = '<?php return ' . var_export($payload, true) . ';' . PHP_EOL;
+    if (file_put_contents($temporaryFile, $code) === false || !@rename($temporaryFile, $cacheFile)) {
+        @unlink($temporaryFile);
+        return;
+    }
+    if (function_exists('opcache_invalidate')) {
+        opcache_invalidate($cacheFile, true);
+    }
+}
+
+function cacheDelete(string $cacheDir, string $name): void
+{
+    if (apcuAvailable()) {
+        apcu_delete(cacheKey($cacheDir, $name));
+        return;
+    }
+
+    $cacheFile = $cacheDir . '/' . $name . '.php';
+    if (is_file($cacheFile)) {
+        @unlink($cacheFile);
+    }
+    if (function_exists('opcache_invalidate')) {
+        opcache_invalidate($cacheFile, true);
+    }
+}
+
+function writeFileAtomically(string $path, string $contents): bool
+{
+    $temporaryFile = @tempnam(dirname($path), basename($path));
+    if ($temporaryFile === false) {
+        return false;
+    }
+    $mode = is_file($path) ? (fileperms($path) & 0777) : 0644;
+    if (file_put_contents($temporaryFile, $contents) === false || !@chmod($temporaryFile, $mode) || !@rename($temporaryFile, $path)) {
+        @unlink($temporaryFile);
+        return false;
+    }
+
+    return true;
+}
+
+/**
+ * Les sauvegardes ajoutent une opération par check au journal sous un verrou
+ * court ; compactManifest() les reporte ensuite dans manifest.json.
+ */
+function appendManifestJournal(string $journalPath, array $operations): bool
+{
+    $lines = '';
+    foreach ($operations as $operation) {
+        $line = json_encode($operation, JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE);
+        if ($line === false) {
+            return false;
+        }
+        $lines .= $line . "\n";
+    }
+
+    $handle = @fopen($journalPath, 'ab');
+    if ($handle === false) {
+        return false;
+    }
+    $written = false;
+    if (flock($handle, LOCK_EX)) {
+        $written = fwrite($handle, $lines) === strlen($lines) && fflush($handle);
+        flock($handle, LOCK_UN);
+    }
+    fclose($handle);
+
+    return $written;
+}
+
+function readManifestJournal(string $journalPath): array
+{
+    if (!is_file($journalPath)) {
+        return [[], 0];
+    }
+    $handle = @fopen($journalPath, 'rb');
+    if ($handle === false) {
+        return [[], 0];
+    }
+    flock($handle, LOCK_SH);
+    $contents = (string) stream_get_contents($handle);
+    flock($handle, LOCK_UN);
+    fclose($handle);
+
+    $end = strrpos($contents, "\n");
+    if ($end === false) {
+        return [[], 0];
+    }
+
+    $operations = [];
+    foreach (explode("\n", substr($contents, 0, $end)) as $line) {
+        $operation = json_decode($line, true);
+        if (is_array($operation) && is_array($operation['entry'] ?? null)) {
+            $operations[] = $operation;
+        }
+    }
+
+    return [$operations, $end + 1];
+}
+
+function moveManifestLookup(array &$lookup, string $old, string $new, int $index): void
+{
+    if ($old !== '' && ($lookup[$old] ?? null) === $index) {
+        unset($lookup[$old]);
+    }
+    if ($new !== '') {
+        $lookup[$new] ??= $index;
+    }
+}
+
+function applyManifestOperations(array $manifest, array $operations): array
+{
+    if (!$operations) {
+        return $manifest;
+    }
+
+    $byFile = [];
+    $byId = [];
+    foreach ($manifest as $index => $entry) {
+        if (!is_array($entry)) {
+            continue;
+        }
+        if (isset($entry['file'])) {
+            $byFile[(string) $entry['file']] ??= $index;
+        }
+        if (($entry['id'] ?? '') !== '') {
+            $byId[(string) $entry['id']] ??= $index;
+        }
+    }
+
+    foreach ($operations as $operation) {
+        $matchFile = (string) ($operation['match_file'] ?? '');
+        $matchId = (string) ($operation['match_id'] ?? '');
+        $index = $matchFile !== '' ? ($byFile[$matchFile] ?? null) : null;
+        if ($index === null && $matchId !== '') {
+            $index = $byId[$matchId] ?? null;
+        }
+
+        $previous = $index !== null && is_array($manifest[$index]) ? $manifest[$index] : [];
+        $entry = array_merge($previous, $operation['entry']);
+        if ($index === null) {
+            $manifest[] = $entry;
+            $index = array_key_last($manifest);
+        } else {
+            $manifest[$index] = $entry;
+        }
+
+        moveManifestLookup($byFile, (string) ($previous['file'] ?? ''), (string) ($entry['file'] ?? ''), $index);
+        moveManifestLookup($byId, (string) ($previous['id'] ?? ''), (string) ($entry['id'] ?? ''), $index);
+    }
+
+    return array_values($manifest);
+}
+
+function truncateManifestJournal(string $journalPath, int $consumed): void
+{
+    $handle = @fopen($journalPath, 'r+b');
+    if ($handle === false) {
+        return;
+    }
+    if (flock($handle, LOCK_EX)) {
+        fseek($handle, $consumed);
+        $remaining = (string) stream_get_contents($handle);
+        ftruncate($handle, 0);
+        rewind($handle);
+        if ($remaining !== '') {
+            fwrite($handle, $remaining);
+        }
+        fflush($handle);
+        flock($handle, LOCK_UN);
+    }
+    fclose($handle);
+}
+
+/**
+ * JSON indenté de 2 espaces, comme json.dumps(indent=2) côté Python
+ * (JSON_PRETTY_PRINT indente de 4).
+ */
+function encodeIndentedJson(mixed $value): string|false
+{
+    $json = json_encode($value, JSON_PRETTY_PRINT | JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE | JSON_UNESCAPED_LINE_TERMINATORS);
+    if ($json === false) {
+        return false;
+    }
+
+    return preg_replace_callback('/^(?: {4})+/m', static fn (array $match): string => substr($match[0], strlen($match[0]) / 2), $json) . "\n";
+}
+
+/**
+ * Même texte que dump_manifest() (docs_cc/manifest_versions.py) : la version
+ * est un hash de ces octets, une compaction ne doit pas reformater le fichier.
+ */
+function encodeManifest(array $manifest): string|false
+{
+    return encodeIndentedJson($manifest);
+}
+
+function encodeCompactJson(mixed $value): string|false
+{
+    $json = json_encode($value, JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE | JSON_UNESCAPED_LINE_TERMINATORS);
+
+    return $json === false ? false : $json . "\n";
+}
+
+/**
+ * Entrées ajoutées ou modifiées depuis $old et fichiers supprimés, comme
+ * compute_delta() dans docs_cc/manifest_versions.py.
+ */
+function computeManifestDelta(array $old, array $new): array
+{
+    $before = [];
+    foreach ($old as $entry) {
+        if (is_array($entry)) {
+            $before[(string) ($entry['file'] ?? '')] = $entry;
+        }
+    }
+    $after = [];
+    foreach ($new as $entry) {
+        if (is_array($entry)) {
+            $after[(string) ($entry['file'] ?? '')] = $entry;
+        }
+    }
+
+    $delta = ['added' => [], 'changed' => [], 'removed' => [], 'count' => count($after)];
+    foreach ($after as $file => $entry) {
+        if (!array_key_exists($file, $before)) {
+            $delta['added'][] = $entry;
+        } elseif ($before[$file] != $entry) {
+            $delta['changed'][] = $entry;
+        }
+    }
+    foreach (array_keys($before) as $file) {
+        if (!array_key_exists($file, $after)) {
+            $delta['removed'][] = (string) $file;
+        }
+    }
+
+    return $delta;
+}
+
+/**
+ * Ordre des fiches par titre, par langue et par niveau, comme compute_order()
+ * dans docs_cc/manifest_versions.py. null sans les extensions intl et
+ * mbstring : l'index trie alors lui-même.
+ */
+function computeManifestOrder(array $manifest, string $version): ?array
+{
+    if (!class_exists('Normalizer') || !function_exists('mb_convert_case')) {
+        return null;
+    }
+    $titleKey = static function (string $title): string {
+        $decomposed = (string) Normalizer::normalize($title, Normalizer::FORM_KD);
+
+        return mb_convert_case((string) preg_replace('/\p{Mn}+/u', '', $decomposed), MB_CASE_FOLD, 'UTF-8');
+    };
+    $entries = array_values(array_filter($manifest, static fn ($entry): bool => is_array($entry) && !empty($entry['file'])));
+
+    $order = ['version' => $version];
+    foreach (['fr', 'en'] as $lang) {
+        $keyed = array_map(static function (array $entry) use ($lang, $titleKey): array {
+            $title = (string) ($entry['title_' . $lang] ?? '');
+
+            return [$titleKey($title), $title, (string) $entry['file'], (string) ($entry['level'] ?? '')];
+        }, $entries);
+        // strcmp() : ordre des points de code, comme le tri de Python (<=> compare les chaînes numériques en nombres).
+        usort($keyed, static fn (array $a, array $b): int => strcmp($a[0], $b[0]) ?: strcmp($a[1], $b[1]) ?: strcmp($a[2], $b[2]));
+
+        $groups = ['all' => array_column($keyed, 2)];
+        foreach ($keyed as [, , $file, $level]) {
+            $groups[MANIFEST_LEVEL_GROUPS[$level] ?? strtolower($level)][] = $file;
+        }
+        $order[$lang] = $groups;
+    }
+
+    return $order;
+}
+
+/**
+ * Publie la version du manifeste comme write_manifest_versions() dans
+ * docs_cc/manifest_versions.py : instantané manifest-versions/<version>.json,
+ * deltas depuis les versions récentes, ordre des titres, puis
+ * manifest.version.json. Les visiteurs qui gardent une version récente en
+ * cache ne téléchargent que le delta.
+ */
+function updateManifestVersion(string $manifestPath, string $contents): bool
+{
+    $rootDir = dirname($manifestPath);
+    $versionsDir = $rootDir . '/manifest-versions';
+    $versionPath = $rootDir . '/manifest.version.json';
+    $manifest = json_decode($contents, true);
+    if (!is_array($manifest) || (!is_dir($versionsDir) && !@mkdir($versionsDir, 0775, true))) {
+        return false;
+    }
+
+    $version = substr(hash('sha256', $contents), 0, 16);
+    if (!writeFileAtomically($versionsDir . '/' . $version . '.json', $contents)) {
+        return false;
+    }
+    $orderName = null;
+    $order = computeManifestOrder($manifest, $version);
+    $orderJson = $order === null ? false : encodeCompactJson($order);
+    if ($orderJson !== false && writeFileAtomically($versionsDir . '/' . $version . '.order.json', $orderJson)) {
+        $orderName = $version . '.order.json';
+    }
+
+    $previous = json_decode((string) @file_get_contents($versionPath), true);
+    $older = [];
+    foreach (is_array($previous['history'] ?? null) ? $previous['history'] : [] as $old) {
+        $old = (string) $old;
+        if ($old !== $version && !in_array($old, $older, true) && is_file($versionsDir . '/' . $old . '.json')) {
+            $older[] = $old;
+        }
+    }
+    $older = array_slice($older, 0, MANIFEST_HISTORY);
+
+    $deltas = [];
+    foreach ($older as $old) {
+        $name = $old . '-' . $version . '.json';
+        if (!is_file($versionsDir . '/' . $name)) {
+            $oldManifest = json_decode((string) @file_get_contents($versionsDir . '/' . $old . '.json'), true);
+            $deltaJson = encodeCompactJson(['from' => $old, 'to' => $version] + computeManifestDelta(is_array($oldManifest) ? $oldManifest : [], $manifest));
+            if ($deltaJson === false || !writeFileAtomically($versionsDir . '/' . $name, $deltaJson)) {
+                continue;
+            }
+        }
+        $deltas[$old] = 'manifest-versions/' . $name;
+    }
+
+    $kept = array_merge([$version . '.json'], array_map(static fn (string $old): string => $old . '.json', $older), array_map('basename', $deltas));
+    if ($orderName !== null) {
+        $kept[] = $orderName;
+    }
+    foreach (glob($versionsDir . '/*.json') ?: [] as $path) {
+        if (!in_array(basename($path), $kept, true)) {
+            @unlink($path);
+        }
+    }
+
+    $info = ['version' => $version, 'history' => array_merge([$version], $older), 'deltas' => (object) $deltas];
+    if ($orderName !== null) {
+        $info['order'] = 'manifest-versions/' . $orderName;
+    }
+    $json = encodeIndentedJson($info);
+
+    return $json !== false && writeFileAtomically($versionPath, $json);
+}
+
+/**
+ * Reporte le journal dans manifest.json (écriture atomique par renommage).
+ * Rejouer une opération déjà appliquée est sans effet, le journal n'est
+ * donc tronqué qu'après l'écriture du manifeste ; il est conservé tel quel
+ * si manifest.json existe mais ne peut pas être lu.
+ *
+ * Chaque sauvegarde l'appelle après l'envoi de la réponse. Le verrou est pris
+ * sans attendre : si une autre compaction le tient, elle reprendra les
+ * opérations ajoutées entre-temps, puisque le journal est relu après la
+ * libération du verrou.
+ */
+function compactManifest(string $manifestPath, string $journalPath, string $lockPath): bool
+{
+    $lock = @fopen($lockPath, 'cb');
+    if ($lock === false) {
+        return false;
+    }
+
+    $compacted = true;
+    while (flock($lock, LOCK_EX | LOCK_NB)) {
+        while (true) {
+            [$operations, $consumed] = readManifestJournal($journalPath);
+            if ($consumed === 0) {
+                break;
+            }
+            if ($operations) {
+                $manifest = readManifestFile($manifestPath);
+                $manifestJson = $manifest === null ? false : encodeManifest(applyManifestOperations($manifest, $operations));
+                if ($manifestJson === false || !writeFileAtomically($manifestPath, $manifestJson)) {
+                    $compacted = false;
+                    break;
+                }
+                updateManifestVersion($manifestPath, $manifestJson);
+            }
+            truncateManifestJournal($journalPath, $consumed);
+        }
+        flock($lock, LOCK_UN);
+
+        if (!$compacted || readManifestJournal($journalPath)[1] === 0) {
+            break;
+        }
+    }
+    fclose($lock);
+
+    return $compacted;
+}
+
+/**
+ * Compacte le journal une fois la réponse envoyée, pour que la sauvegarde
+ * n'attende pas la réécriture du manifeste.
+ */
+function compactManifestAfterResponse(string $manifestPath, string $journalPath, string $lockPath): void
+{
+    register_shutdown_function(static function () use ($manifestPath, $journalPath, $lockPath): void {
+        if (function_exists('fastcgi_finish_request')) {
+            fastcgi_finish_request();
+        }
+        compactManifest($manifestPath, $journalPath, $lockPath);
+    });
+}
+
+function applyBulkEdit(array $files, array $changes, array $catalogue, string $checksDir, string $cacheDir): array
+{
+    $results = [];
+    $operations = [];
+    $htmlChanges = array_intersect_key($changes, array_flip(['level', 'title_fr', 'title_en']));
+
+    foreach (array_unique(array_map('basename', $files)) as $fileName) {
+        $manifestFile = 'checks/' . $fileName;
+        $entry = $catalogue['manifestByFile'][$manifestFile] ?? null;
+        $path = $checksDir . '/' . $fileName;
+        $result = ['file' => $fileName, 'id' => (string) ($entry['id'] ?? ''), 'status' => 'updated', 'message' => ''];
+
+        if ($entry === null && !is_file($path)) {
+            $results[] = ['status' => 'error', 'message' => 'Check introuvable.'] + $result;
+            continue;
+        }
+
+        if ($htmlChanges && is_file($path)) {
+            $htmlContent = file_get_contents($path);
+            $xpath = $htmlContent !== false ? parseCheckHtml($htmlContent) : null;
+            if (!$xpath) {
+                $results[] = ['status' => 'error', 'message' => 'Impossible de lire le fichier HTML.'] + $result;
+                continue;
+            }
+            if (!writeFileAtomically($path, normalizeNewlines(updateCheckHtml($xpath, $htmlChanges)))) {
+                $results[] = ['status' => 'error', 'message' => 'Impossible d\'écrire le fichier HTML.'] + $result;
+                continue;
+            }
+            $signature = fileSignature($path);
+            if ($signature !== null) {
+                cacheStore($cacheDir, checkTextsCacheName($path), $signature, extractCheckTexts($xpath));
+            }
+        } elseif (!is_file($path)) {
+            $result['message'] = 'Fichier HTML manquant : seul le manifeste est mis à jour.';
+        }
+
+        $operations[] = [
+            'match_file' => $manifestFile,
+            'match_id' => $result['id'],
+            'entry' => $changes + ['file' => $manifestFile],
+        ];
+        $results[] = $result;
+    }
+
+    return [$results, $operations];
+}
+
+/**
+ * Dépose une tâche pour « python -m docs_cc worker », qui reconstruit les
+ * fragments JSON et la navigation des fiches concernées.
+ */
+function enqueueRebuild(string $queueDir, array $files, array $removed = []): bool
+{
+    $pendingDir = $queueDir . '/pending';
+    if (!is_dir($pendingDir) && !@mkdir($pendingDir, 0775, true) && !is_dir($pendingDir)) {
+        return false;
+    }
+    $job = json_encode([
+        'files' => array_values($files),
+        'removed' => array_values($removed),
+        'queued_at' => microtime(true),
+    ], JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE);
+    if ($job === false) {
+        return false;
+    }
+    $name = sprintf('%.0f-%s.json', microtime(true) * 1e9, bin2hex(random_bytes(4)));
+
+    return writeFileAtomically($pendingDir . '/' . $name, $job);
+}
+
+function loadRebuildStatus(string $queueDir): array
+{
+    $status = [];
+    $contents = @file_get_contents($queueDir . '/status.json');
+    if ($contents !== false) {
+        $decoded = json_decode($contents, true);
+        $status = is_array($decoded) ? $decoded : [];
+    }
+    $pending = glob($queueDir . '/pending/*.json');
+    $processing = glob($queueDir . '/processing/*.json');
+    $status['pending'] = $pending === false ? 0 : count($pending);
+    $status['processing'] = $processing === false ? 0 : count($processing);
+    $status['worker_alive'] = isset($status['updated_at'])
+        && microtime(true) - (float) $status['updated_at'] < WORKER_HEARTBEAT_TIMEOUT;
+
+    return $status;
+}
+
+function buildCatalogue(string $manifestPath, string $checksDir, string $journalPath): array
+{
+    [$pendingOperations] = readManifestJournal($journalPath);
+    $manifest = applyManifestOperations(loadManifest($manifestPath), $pendingOperations);
+    $manifestByFile = [];
+    foreach ($manifest as $entry) {
+        if (!is_array($entry) || !isset($entry['file'])) {
+            continue;
+        }
+        $manifestByFile[$entry['file']] = $entry;
+    }
+
+    $checksIndex = [];
+    if (is_dir($checksDir)) {
+        $files = glob($checksDir . '/*.html');
+        if ($files !== false) {
+            foreach ($files as $path) {
+                $fileName = basename($path);
+                $checksIndex[$fileName] = [
+                    'file' => $fileName,
+                    'path' => $path,
+                    'manifest' => $manifestByFile['checks/' . $fileName] ?? null,
+                    'exists' => true,
+                ];
+            }
+        }
+    }
+
+    foreach ($manifestByFile as $file => $entry) {
+        $fileName = basename($file);
+        if (!isset($checksIndex[$fileName])) {
+            $checksIndex[$fileName] = [
+                'file' => $fileName,
+                'path' => $checksDir . '/' . $fileName,
+                'manifest' => $entry,
+                'exists' => is_file($checksDir . '/' . $fileName),
+            ];
+        } else {
+            $checksIndex[$fileName]['manifest'] = $checksIndex[$fileName]['manifest'] ?? $entry;
+        }
+    }
+
+    $checks = array_values($checksIndex);
+    usort($checks, function (array $a, array $b): int {
+        $left = $a['manifest']['id'] ?? $a['file'];
+        $right = $b['manifest']['id'] ?? $b['file'];
+        return strcasecmp($left, $right);
+    });
+
+    return [
+        'manifest' => $manifest,
+        'manifestByFile' => $manifestByFile,
+        'checks' => $checks,
+        'search' => buildSearchIndex($checks),
+    ];
+}
+
+function tokenize(string $value): array
+{
+    $tokens = preg_split('/[^\p{L}\p{N}]+/u', toSearchableString($value), -1, PREG_SPLIT_NO_EMPTY);
+    return is_array($tokens) ? $tokens : [];
+}
+
+function buildSearchIndex(array $checks): array
+{
+    $postings = [];
+    foreach ($checks as $position => $item) {
+        $entry = $item['manifest'] ?? [];
+        $fields = [
+            (string) ($entry['id'] ?? ''),
+            (string) ($entry['title_fr'] ?? ''),
+            (string) ($entry['title_en'] ?? ''),
+            (string) ($entry['script'] ?? ''),
+            (string) ($entry['level'] ?? ''),
+            $item['file'],
+        ];
+        foreach (array_unique(tokenize(implode(' ', $fields))) as $token) {
+            $postings[$token][] = $position;
+        }
+    }
+    ksort($postings, SORT_STRING);
+
+    return [
+        'tokens' => array_map('strval', array_keys($postings)),
+        'postings' => $postings,
+    ];
+}
+
+/**
+ * Positions des checks dont chaque mot de la requête préfixe un token, ou null
+ * pour une requête vide.
+ */
+function searchCatalogue(array $index, string $query): ?array
+{
+    $terms = array_unique(tokenize($query));
+    if (!$terms) {
+        return null;
+    }
+
+    $tokens = $index['tokens'];
+    $count = count($tokens);
+    $result = null;
+    foreach ($terms as $term) {
+        $low = 0;
+        $high = $count;
+        while ($low < $high) {
+            $middle = intdiv($low + $high, 2);
+            if (strcmp($tokens[$middle], $term) < 0) {
+                $low = $middle + 1;
+            } else {
+                $high = $middle;
+            }
+        }
+
+        $matches = [];
+        for ($i = $low; $i < $count && strncmp($tokens[$i], $term, strlen($term)) === 0; $i++) {
+            foreach ($index['postings'][$tokens[$i]] as $position) {
+                $matches[$position] = true;
+            }
+        }
+        $result = $result === null ? $matches : array_intersect_key($result, $matches);
+        if (!$result) {
+            return [];
+        }
+    }
+
+    $positions = array_keys($result);
+    sort($positions);
+    return $positions;
+}
+
+function listChecks(array $catalogue, string $query, int $offset, int $limit): array
+{
+    $positions = searchCatalogue($catalogue['search'], $query);
+    $matched = $positions === null ? count($catalogue['checks']) : count($positions);
+    $offset = max(0, min($offset, $matched));
+
+    if ($positions === null) {
+        $items = array_slice($catalogue['checks'], $offset, $limit);
+    } else {
+        $items = [];
+        foreach (array_slice($positions, $offset, $limit) as $position) {
+            $items[] = $catalogue['checks'][$position];
+        }
+    }
+
+    $end = $offset + count($items);
+    return [
+        'matched' => $matched,
+        'offset' => $offset,
+        'items' => $items,
+        'next_offset' => $end < $matched ? $end : null,
+    ];
+}
+
+function catalogueSignature(string $manifestPath, string $checksDir, string $journalPath): string
+{
+    clearstatcache();
+    $parts = [$checksDir];
+    foreach ([$manifestPath, $journalPath, $checksDir] as $path) {
+        $stat = @stat($path);
+        $parts[] = $stat === false ? '-' : $stat['ino'] . ':' . $stat['mtime'] . ':' . $stat['size'];
+    }
+
+    return implode('|', $parts);
+}
+
+function loadCatalogue(string $manifestPath, string $checksDir, string $journalPath, string $cacheDir): array
+{
+    $signature = catalogueSignature($manifestPath, $checksDir, $journalPath);
+    $catalogue = cacheFetch($cacheDir, 'catalogue', $signature);
+    if ($catalogue === null) {
+        $catalogue = buildCatalogue($manifestPath, $checksDir, $journalPath);
+        cacheStore($cacheDir, 'catalogue', $signature, $catalogue);
+    }
+
+    return $catalogue;
 }
 
 function sanitizeFileName(string $name): string
@@ -185,14 +948,15 @@ function setLocalizedRichContent(DOMElement $element, string $fr, string $en): v
     }
 }
 
-function updateCheckHtml(string $htmlContent, array $data): string
+function parseCheckHtml(string $htmlContent): ?DOMXPath
 {
     $document = createDomDocument($htmlContent);
-    if (!$document instanceof DOMDocument) {
-        return $htmlContent;
-    }
+    return $document instanceof DOMDocument ? new DOMXPath($document) : null;
+}
 
-    $xpath = new DOMXPath($document);
+function updateCheckHtml(DOMXPath $xpath, array $data): string
+{
+    $document = $xpath->document;
 
     $titleFr = trim((string) ($data['title_fr'] ?? ''));
     if ($titleFr !== '') {
@@ -233,6 +997,17 @@ function updateCheckHtml(string $htmlContent, array $data): string
             $levelSpan->setAttribute('class', 'level-pill' . ($normalizedLevel !== '' ? ' level-' . $normalizedLevel : ''));
             $levelSpan->textContent = $level;
         }
+
+        $status = CHECK_STATUS_LABELS[strtoupper($level)] ?? null;
+        $statusCell = getFirstNode(
+            $xpath,
+            "//table[contains(concat(' ', normalize-space(@class), ' '), ' info-table ')]//tr[th[@data-fr=\"Statut en cas d'échec\" or @data-en='Status if failed']]/td"
+        );
+        if ($status && $statusCell) {
+            $statusCell->setAttribute('data-fr', $status['fr']);
+            $statusCell->setAttribute('data-en', $status['en']);
+            $statusCell->textContent = $status['fr'];
+        }
     }
 
     $explanationFr = trim((string) ($data['explanation_fr'] ?? ''));
@@ -240,18 +1015,16 @@ function updateCheckHtml(string $htmlContent, array $data): string
     if ($explanationFr !== '' || $explanationEn !== '') {
         $paragraph = ensureRichContentContainer(
             $xpath,
-            "//section[contains(concat(' ', normalize-space(@class), ' '), ' content-section ')]"
-                . "[h2[contains(@data-fr, 'Explications') or contains(@data-en, 'Overview')]]"
-                . "//*[(@data-fr or @data-en) and not(self::h2)]"
+            EXPLANATION_QUERY
         );
         if ($paragraph) {
             setLocalizedRichContent($paragraph, $explanationFr, $explanationEn);
         }
-    }
 
-    $metaDescription = getFirstNode($xpath, "//meta[@name='description']");
-    if ($metaDescription) {
-        $metaDescription->setAttribute('content', stripText($explanationFr !== '' ? $explanationFr : $explanationEn));
+        $metaDescription = getFirstNode($xpath, "//meta[@name='description']");
+        if ($metaDescription) {
+            $metaDescription->setAttribute('content', stripText($explanationFr !== '' ? $explanationFr : $explanationEn));
+        }
     }
 
     $resolutionFr = trim((string) ($data['resolution_fr'] ?? ''));
@@ -259,9 +1032,7 @@ function updateCheckHtml(string $htmlContent, array $data): string
     if ($resolutionFr !== '' || $resolutionEn !== '') {
         $resolutionParagraph = ensureRichContentContainer(
             $xpath,
-            "//section[contains(concat(' ', normalize-space(@class), ' '), ' content-section ')]"
-                . "[h2[contains(@data-fr, 'Résolution') or contains(@data-en, 'Remediation')]]"
-                . "//*[(@data-fr or @data-en) and not(self::h2)]"
+            RESOLUTION_QUERY
         );
         if ($resolutionParagraph) {
             setLocalizedRichContent($resolutionParagraph, $resolutionFr, $resolutionEn);
@@ -271,21 +1042,9 @@ function updateCheckHtml(string $htmlContent, array $data): string
     return (string) $document->saveHTML();
 }
 
-function extractExplanationTexts(string $htmlContent): array
+function extractLocalizedTexts(DOMXPath $xpath, string $query): array
 {
-    $document = createDomDocument($htmlContent);
-    if (!$document instanceof DOMDocument) {
-        return ['fr' => '', 'en' => ''];
-    }
-
-    $xpath = new DOMXPath($document);
-    $paragraph = getFirstNode(
-        $xpath,
-        "//section[contains(concat(' ', normalize-space(@class), ' '), ' content-section ')]"
-        . "[h2[contains(@data-fr, 'Explications') or contains(@data-en, 'Overview')]]"
-        . "//*[@data-fr or @data-en][not(self::h2)]"
-    );
-
+    $paragraph = getFirstNode($xpath, $query);
     if (!$paragraph) {
         return ['fr' => '', 'en' => ''];
     }
@@ -309,95 +1068,172 @@ function extractExplanationTexts(string $htmlContent): array
     return ['fr' => $fr, 'en' => $en];
 }
 
-function extractResolutionTexts(string $htmlContent): array
+function extractExplanationTexts(DOMXPath $xpath): array
 {
-    $document = createDomDocument($htmlContent);
-    if (!$document instanceof DOMDocument) {
-        return ['fr' => '', 'en' => ''];
-    }
-
-    $xpath = new DOMXPath($document);
-    $paragraph = getFirstNode(
-        $xpath,
-        "//section[contains(concat(' ', normalize-space(@class), ' '), ' content-section ')]"
-        . "[h2[contains(@data-fr, 'Résolution') or contains(@data-en, 'Remediation')]]"
-        . "//*[@data-fr or @data-en][not(self::h2)]"
-    );
-
-    if (!$paragraph) {
-        return ['fr' => '', 'en' => ''];
-    }
+    return extractLocalizedTexts($xpath, EXPLANATION_QUERY);
+}
 
-    $fr = trim((string) $paragraph->getAttribute('data-fr-html'));
-    if ($fr === '') {
-        $fr = trim((string) $paragraph->getAttribute('data-fr'));
-    }
-    if ($fr === '') {
-        $fr = trim($paragraph->textContent);
-    }
+function extractResolutionTexts(DOMXPath $xpath): array
+{
+    return extractLocalizedTexts($xpath, RESOLUTION_QUERY);
+}
 
-    $en = trim((string) $paragraph->getAttribute('data-en-html'));
-    if ($en === '') {
-        $en = trim((string) $paragraph->getAttribute('data-en'));
-    }
-    if ($en === '') {
-        $en = $fr;
-    }
+function extractCheckTexts(DOMXPath $xpath): array
+{
+    return [
+        'explanation' => extractExplanationTexts($xpath),
+        'resolution' => extractResolutionTexts($xpath),
+    ];
+}
 
-    return ['fr' => $fr, 'en' => $en];
+function fileSignature(string $path): ?string
+{
+    clearstatcache(true, $path);
+    $stat = @stat($path);
+    return $stat === false ? null : $stat['ino'] . ':' . $stat['mtime'] . ':' . $stat['size'];
 }
 
-$manifest = loadManifest($manifestPath);
-$manifestByFile = [];
-foreach ($manifest as $entry) {
-    if (!is_array($entry) || !isset($entry['file'])) {
-        continue;
-    }
-    $manifestByFile[$entry['file']] = $entry;
+function checkTextsCacheName(string $path): string
+{
+    return 'texts-' . md5($path);
 }
 
-$checksIndex = [];
-if (is_dir($checksDir)) {
-    $files = glob($checksDir . '/*.html');
-    if ($files !== false) {
-        foreach ($files as $path) {
-            $fileName = basename($path);
-            $checksIndex[$fileName] = [
-                'file' => $fileName,
-                'path' => $path,
-                'manifest' => $manifestByFile['checks/' . $fileName] ?? null,
-                'exists' => true,
-            ];
+function loadCheckTexts(string $path, string $htmlContent, string $cacheDir): array
+{
+    $signature = fileSignature($path);
+    if ($signature !== null) {
+        $texts = cacheFetch($cacheDir, checkTextsCacheName($path), $signature);
+        if ($texts !== null) {
+            return $texts;
         }
     }
-}
 
-foreach ($manifestByFile as $file => $entry) {
-    $fileName = basename($file);
-    if (!isset($checksIndex[$fileName])) {
-        $checksIndex[$fileName] = [
-            'file' => $fileName,
-            'path' => $checksDir . '/' . $fileName,
-            'manifest' => $entry,
-            'exists' => is_file($checksDir . '/' . $fileName),
-        ];
-    } else {
-        $checksIndex[$fileName]['manifest'] = $checksIndex[$fileName]['manifest'] ?? $entry;
+    $xpath = parseCheckHtml($htmlContent);
+    $empty = ['fr' => '', 'en' => ''];
+    $texts = $xpath ? extractCheckTexts($xpath) : ['explanation' => $empty, 'resolution' => $empty];
+    if ($signature !== null) {
+        cacheStore($cacheDir, checkTextsCacheName($path), $signature, $texts);
     }
+
+    return $texts;
 }
 
-$checks = array_values($checksIndex);
-usort($checks, function (array $a, array $b): int {
-    $left = $a['manifest']['id'] ?? $a['file'];
-    $right = $b['manifest']['id'] ?? $b['file'];
-    return strcasecmp($left, $right);
-});
+if ($_SERVER['REQUEST_METHOD'] === 'GET' && ($_GET['action'] ?? '') === 'rebuild-status') {
+    header('Content-Type: application/json; charset=utf-8');
+    header('Cache-Control: no-store');
+    echo json_encode(loadRebuildStatus($queueDir), JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE);
+    exit;
+}
+
+$catalogue = loadCatalogue($manifestPath, $checksDir, $journalPath, $cacheDir);
+$manifest = $catalogue['manifest'];
+$manifestByFile = $catalogue['manifestByFile'];
+$checks = $catalogue['checks'];
 
 $selectedFile = isset($_GET['file']) ? basename((string) $_GET['file']) : '';
 $normalizedNotice = isset($_GET['normalized']);
 $renamedNotice = isset($_GET['renamed']);
 $successNotice = isset($_GET['saved']);
-$hasPost = $_SERVER['REQUEST_METHOD'] === 'POST';
+$isBulk = $_SERVER['REQUEST_METHOD'] === 'POST' && ($_POST['action'] ?? '') === 'bulk';
+$hasPost = $_SERVER['REQUEST_METHOD'] === 'POST' && !$isBulk;
+$bulkResults = null;
+$bulkErrors = [];
+
+// Rapport d'une modification groupée déjà appliquée (redirection après POST).
+$bulkToken = (string) ($_GET['bulk'] ?? '');
+if (!$isBulk && preg_match('/^[0-9a-f]{16}$/', $bulkToken)) {
+    $bulkReport = cacheFetch($cacheDir, 'bulk-' . $bulkToken, $bulkToken);
+    if ($bulkReport !== null) {
+        cacheDelete($cacheDir, 'bulk-' . $bulkToken);
+        $bulkResults = $bulkReport['results'];
+        $bulkErrors = $bulkReport['errors'];
+    }
+}
+
+if ($isBulk) {
+    $bulkFiles = array_values(array_filter(array_map('strval', (array) ($_POST['files'] ?? [])), static fn (string $file): bool => $file !== ''));
+    $bulkChanges = [];
+    $bulkLevel = strtoupper(trim((string) ($_POST['bulk_level'] ?? '')));
+    if ($bulkLevel !== '') {
+        if (in_array($bulkLevel, CHECK_LEVELS, true)) {
+            $bulkChanges['level'] = $bulkLevel;
+        } else {
+            $bulkErrors[] = 'Le niveau choisi est inconnu.';
+        }
+    }
+    foreach (['script' => 'bulk_script', 'title_fr' => 'bulk_title_fr', 'title_en' => 'bulk_title_en'] as $field => $input) {
+        $value = trim((string) ($_POST[$input] ?? ''));
+        if ($value !== '') {
+            $bulkChanges[$field] = $value;
+        }
+    }
+
+    if (!$bulkFiles) {
+        $bulkErrors[] = 'Aucun check sélectionné.';
+    }
+    if (!$bulkChanges && !$bulkErrors) {
+        $bulkErrors[] = 'Indiquez au moins un niveau, un script ou un titre à appliquer.';
+    }
+    if (!is_writable(dirname($manifestPath)) || (is_file($manifestPath) && !is_writable($manifestPath))) {
+        $bulkErrors[] = 'Le fichier manifest.json n\'est pas accessible en écriture.';
+    }
+
+    if (!$bulkErrors) {
+        [$bulkResults, $bulkOperations] = applyBulkEdit($bulkFiles, $bulkChanges, $catalogue, $checksDir, $cacheDir);
+        if ($bulkOperations && !appendManifestJournal($journalPath, $bulkOperations)) {
+            $bulkErrors[] = 'Impossible de mettre à jour manifest.json.';
+            foreach ($bulkResults as &$bulkResult) {
+                if ($bulkResult['status'] === 'updated') {
+                    $bulkResult['status'] = 'error';
+                    $bulkResult['message'] = 'Page mise à jour, manifeste inchangé.';
+                }
+            }
+            unset($bulkResult);
+        } elseif ($bulkOperations) {
+            cacheDelete($cacheDir, 'catalogue');
+            enqueueRebuild($queueDir, array_column(array_filter($bulkResults, static fn (array $item): bool => $item['status'] === 'updated'), 'file'));
+            compactManifestAfterResponse($manifestPath, $journalPath, $manifestLockPath);
+        }
+    }
+
+    if (str_contains((string) ($_SERVER['HTTP_ACCEPT'] ?? ''), 'application/json')) {
+        http_response_code($bulkErrors && $bulkResults === null ? 400 : 200);
+        header('Content-Type: application/json; charset=utf-8');
+        header('Cache-Control: no-store');
+        $bulkResults ??= [];
+        echo json_encode([
+            'errors' => $bulkErrors,
+            'updated' => count(array_filter($bulkResults, static fn (array $item): bool => $item['status'] === 'updated')),
+            'failed' => count(array_filter($bulkResults, static fn (array $item): bool => $item['status'] === 'error')),
+            'results' => $bulkResults,
+        ], JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE);
+        exit;
+    }
+
+    // Recharger la page affiche le rapport sans rejouer la modification.
+    $bulkToken = bin2hex(random_bytes(8));
+    cacheStore($cacheDir, 'bulk-' . $bulkToken, $bulkToken, ['results' => $bulkResults, 'errors' => $bulkErrors]);
+    $query = ['bulk' => $bulkToken] + array_intersect_key($_GET, array_flip(['q', 'offset', 'file']));
+    header('Location: index.php?' . http_build_query($query), true, 303);
+    exit;
+}
+$searchQuery = trim((string) ($_GET['q'] ?? ''));
+$listOffset = max(0, (int) ($_GET['offset'] ?? 0));
+$listing = listChecks($catalogue, $searchQuery, $listOffset, LIST_PAGE_SIZE);
+
+if (!$hasPost && ($_GET['action'] ?? '') === 'list') {
+    header('Content-Type: application/json; charset=utf-8');
+    header('Cache-Control: no-store');
+    echo json_encode([
+        'total' => count($checks),
+        'matched' => $listing['matched'],
+        'offset' => $listing['offset'],
+        'next_offset' => $listing['next_offset'],
+        'html' => renderCheckRows($listing['items'], $selectedFile, $searchQuery),
+    ], JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE);
+    exit;
+}
+
 $errors = [];
 $originalFile = '';
 $formData = [
@@ -458,7 +1294,7 @@ if ($hasPost) {
         $errors[] = 'Le dossier « checks » est introuvable ou non accessible en écriture.';
     }
 
-    if (!is_file($manifestPath) && !is_writable(dirname($manifestPath))) {
+    if (!is_writable(dirname($manifestPath))) {
         $errors[] = 'Impossible de créer ou de mettre à jour le manifest.json.';
     }
     if (is_file($manifestPath) && !is_writable($manifestPath)) {
@@ -480,7 +1316,8 @@ if ($hasPost) {
     ];
     $selectedFile = $sanitizedFileName;
 
-    $updatedHtmlContent = updateCheckHtml($htmlContent, [
+    $checkXpath = parseCheckHtml($htmlContent);
+    $updatedHtmlContent = !$checkXpath ? $htmlContent : updateCheckHtml($checkXpath, [
         'id' => $formData['id'],
         'level' => $formData['level'],
         'title_fr' => $formData['title_fr'],
@@ -498,59 +1335,41 @@ if ($hasPost) {
         if (file_put_contents($targetPath, $htmlToWrite) === false) {
             $errors[] = 'Impossible d\'écrire le fichier HTML.';
         } else {
-            $existingIndex = null;
-            $originalManifestFile = $originalFile !== '' ? 'checks/' . $originalFile : null;
-            if ($originalManifestFile !== null) {
-                foreach ($manifest as $index => $entry) {
-                    if (!is_array($entry)) {
-                        continue;
-                    }
-                    if (($entry['file'] ?? null) === $originalManifestFile) {
-                        $existingIndex = $index;
-                        break;
-                    }
-                }
-            }
-            if ($existingIndex === null && $id !== '') {
-                foreach ($manifest as $index => $entry) {
-                    if (!is_array($entry)) {
-                        continue;
-                    }
-                    if (($entry['id'] ?? null) === $id) {
-                        $existingIndex = $index;
-                        break;
-                    }
-                }
+            $savedSignature = $checkXpath ? fileSignature($targetPath) : null;
+            if ($savedSignature !== null) {
+                cacheStore($cacheDir, checkTextsCacheName($targetPath), $savedSignature, extractCheckTexts($checkXpath));
             }
 
-            $newEntry = $existingIndex !== null && isset($manifest[$existingIndex]) && is_array($manifest[$existingIndex])
-                ? $manifest[$existingIndex]
-                : [];
-
-            $newEntry['id'] = $id;
-            $newEntry['level'] = $level !== '' ? $level : 'FATAL_ERROR';
-            $newEntry['script'] = $script !== '' ? $script : 'N/A';
-            $newEntry['title_fr'] = $titleFr;
-            $newEntry['title_en'] = $titleEn;
-            $newEntry['description_fr'] = $explanationFr;
-            $newEntry['description_en'] = $explanationEn !== '' ? $explanationEn : $explanationFr;
-            $newEntry['file'] = 'checks/' . $sanitizedFileName;
-
-            if ($existingIndex !== null) {
-                $manifest[$existingIndex] = $newEntry;
-            } else {
-                $manifest[] = $newEntry;
-            }
+            $operation = [
+                'match_file' => $originalFile !== '' ? 'checks/' . $originalFile : '',
+                'match_id' => $id,
+                'entry' => [
+                    'id' => $id,
+                    'level' => $level !== '' ? $level : 'FATAL_ERROR',
+                    'script' => $script !== '' ? $script : 'N/A',
+                    'title_fr' => $titleFr,
+                    'title_en' => $titleEn,
+                    'description_fr' => $explanationFr,
+                    'description_en' => $explanationEn !== '' ? $explanationEn : $explanationFr,
+                    'file' => 'checks/' . $sanitizedFileName,
+                ],
+            ];
 
-            $manifestJson = json_encode($manifest, JSON_PRETTY_PRINT | JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE);
-            if ($manifestJson === false || file_put_contents($manifestPath, $manifestJson . PHP_EOL) === false) {
+            if (!appendManifestJournal($journalPath, [$operation])) {
                 $errors[] = 'Impossible de mettre à jour manifest.json.';
             } else {
+                cacheDelete($cacheDir, 'catalogue');
+                enqueueRebuild(
+                    $queueDir,
+                    [$sanitizedFileName],
+                    $originalFile !== '' && $originalFile !== $sanitizedFileName ? [$originalFile] : []
+                );
                 if ($originalFile !== '' && $originalFile !== $sanitizedFileName) {
                     $previousPath = $checksDir . '/' . $originalFile;
                     if (is_file($previousPath)) {
                         @unlink($previousPath);
                     }
+                    cacheDelete($cacheDir, checkTextsCacheName($previousPath));
                 }
                 $query = [
                     'file' => $sanitizedFileName,
@@ -563,6 +1382,7 @@ if ($hasPost) {
                     $query['renamed'] = 1;
                 }
                 header('Location: index.php?' . http_build_query($query));
+                compactManifestAfterResponse($manifestPath, $journalPath, $manifestLockPath);
                 exit;
             }
         }
@@ -585,12 +1405,11 @@ if ($selectedFile && is_file($checksDir . '/' . $selectedFile) && $formData['con
     $fileContent = file_get_contents($checksDir . '/' . $selectedFile);
     if ($fileContent !== false) {
         $formData['content'] = $fileContent;
-        $explanations = extractExplanationTexts($fileContent);
-        $formData['explanation_fr'] = $explanations['fr'];
-        $formData['explanation_en'] = $explanations['en'];
-        $resolutions = extractResolutionTexts($fileContent);
-        $formData['resolution_fr'] = $resolutions['fr'];
-        $formData['resolution_en'] = $resolutions['en'];
+        $texts = loadCheckTexts($checksDir . '/' . $selectedFile, $fileContent, $cacheDir);
+        $formData['explanation_fr'] = $texts['explanation']['fr'];
+        $formData['explanation_en'] = $texts['explanation']['en'];
+        $formData['resolution_fr'] = $texts['resolution']['fr'];
+        $formData['resolution_en'] = $texts['resolution']['en'];
     }
 }
 
@@ -606,6 +1425,47 @@ function h(?string $value): string
     return htmlspecialchars($value ?? '', ENT_QUOTES | ENT_SUBSTITUTE, 'UTF-8');
 }
 
+function renderCheckRows(array $items, string $selectedFile, string $searchQuery): string
+{
+    ob_start();
+    foreach ($items as $item):
+        $isSelected = $selectedFile !== '' && $selectedFile === $item['file'];
+        $entry = $item['manifest'] ?? null;
+        $editQuery = http_build_query(['file' => $item['file'], 'q' => $searchQuery !== '' ? $searchQuery : null]);
+        ?>
+                  <tr
+                    <?= $isSelected ? ' class="selected"' : '' ?>
+                    data-check-row
+                    tabindex="0"
+                  >
+                    <td class="select-cell">
+                      <input type="checkbox" name="files[]" value="<?= h($item['file']) ?>" form="bulk-form" aria-label="Sélectionner <?= h($item['file']) ?>" data-bulk-select />
+                    </td>
+                    <td>
+                      <span class="row-title"><?= h($entry['title_fr'] ?? '—') ?></span>
+                      <span class="row-subtitle" title="<?= h($item['file']) ?>"><?= h($item['file']) ?></span>
+                    </td>
+                    <td>
+                      <?= h($entry['script'] ?? '—') ?>
+                      <?php if (!$item['exists']): ?>
+                        <span class="tag warning">manquant</span>
+                      <?php endif; ?>
+                    </td>
+                    <td>
+                      <a class="ghost-btn edit-btn" data-edit-link href="?<?= h($editQuery) ?>">
+                        <svg aria-hidden="true" focusable="false" viewBox="0 0 20 20">
+                          <path d="M13.586 3.172a2 2 0 0 1 2.828 2.828l-8.49 8.49-3.42.57.57-3.42 8.512-8.468zm-2.121-.707L3.293 10.637a1 1 0 0 0-.263.5l-.98 5.883a1 1 0 0 0 1.147 1.147l5.883-.98a1 1 0 0 0 .5-.263l8.172-8.172a4 4 0 0 0-5.657-5.657z"></path>
+                        </svg>
+                        <span>Modifier</span>
+                      </a>
+                    </td>
+                  </tr>
+        <?php
+    endforeach;
+
+    return (string) ob_get_clean();
+}
+
 ?>
 <!DOCTYPE html>
 <html lang="fr">
@@ -636,6 +1496,18 @@ function h(?string $value): string
         <div class="message success">Le check a été sauvegardé avec succès.</div>
       <?php endif; ?>
 
+      <?php if ($successNotice || $bulkResults): ?>
+        <div
+          class="message info"
+          data-rebuild-status
+          data-pending="Mise à jour des fragments et de la navigation des fiches en cours…"
+          data-done="Fragments et navigation des fiches à jour."
+          data-failed="Échec de la mise à jour des fragments :"
+          data-no-worker="Aucun worker actif : lancez « python -m docs_cc worker » pour mettre à jour les fragments et la navigation."
+          hidden
+        ></div>
+      <?php endif; ?>
+
       <?php if ($normalizedNotice): ?>
         <div class="message info">Le nom du fichier a été normalisé afin de respecter le format attendu.</div>
       <?php endif; ?>
@@ -644,6 +1516,32 @@ function h(?string $value): string
         <div class="message info">L'ancien fichier a été renommé pour refléter le nouveau nom indiqué.</div>
       <?php endif; ?>
 
+      <?php if ($bulkErrors): ?>
+        <div class="message error">
+          <p>Impossible d'appliquer la modification groupée :</p>
+          <ul>
+            <?php foreach ($bulkErrors as $error): ?>
+              <li><?= h($error) ?></li>
+            <?php endforeach; ?>
+          </ul>
+        </div>
+      <?php endif; ?>
+
+      <?php if ($bulkResults): ?>
+        <?php $bulkFailed = array_filter($bulkResults, static fn (array $item): bool => $item['status'] === 'error'); ?>
+        <div class="message <?= $bulkFailed ? 'error' : 'success' ?>">
+          <p>Modification groupée : <?= count($bulkResults) - count($bulkFailed) ?> check(s) mis à jour, <?= count($bulkFailed) ?> en erreur.</p>
+          <ul>
+            <?php foreach ($bulkResults as $item): ?>
+              <li>
+                <strong><?= h($item['file']) ?></strong>
+                — <?= $item['status'] === 'updated' ? 'mis à jour' : 'erreur' ?><?= $item['message'] !== '' ? ' : ' . h($item['message']) : '' ?>
+              </li>
+            <?php endforeach; ?>
+          </ul>
+        </div>
+      <?php endif; ?>
+
       <?php if ($errors): ?>
         <div class="message error">
           <p>Impossible de sauvegarder le check :</p>
@@ -670,79 +1568,97 @@ function h(?string $value): string
                 data-display-plural="%COUNT% checks affichés sur %TOTAL%."
                 data-empty="Aucun check ne correspond à votre recherche."
               >
-                <?= $totalChecks ?> check<?= $checksPlural ?> détecté<?= $checksPlural ?> dans le dossier.
+                <?php if ($searchQuery === '' || !$checks): ?>
+                  <?= $totalChecks ?> check<?= $checksPlural ?> détecté<?= $checksPlural ?> dans le dossier.
+                <?php elseif ($listing['matched'] === 0): ?>
+                  Aucun check ne correspond à votre recherche.
+                <?php else: ?>
+                  <?= $listing['matched'] ?> check<?= $listing['matched'] > 1 ? 's' : '' ?> affiché<?= $listing['matched'] > 1 ? 's' : '' ?> sur <?= $totalChecks ?>.
+                <?php endif; ?>
               </p>
             </div>
             <?php if ($checks): ?>
-              <label class="table-search" for="checks-search">
-                <span class="sr-only">Rechercher un check</span>
-                <input id="checks-search" type="search" placeholder="Rechercher par titre, script ou fichier" autocomplete="off" />
+              <form class="table-search" method="get" role="search" data-search-form>
+                <label class="sr-only" for="checks-search">Rechercher un check</label>
+                <?php if ($selectedFile !== ''): ?>
+                  <input type="hidden" name="file" value="<?= h($selectedFile) ?>" />
+                <?php endif; ?>
+                <input id="checks-search" name="q" type="search" value="<?= h($searchQuery) ?>" placeholder="Rechercher par identifiant, titre, script ou niveau" autocomplete="off" />
                 <svg aria-hidden="true" focusable="false" viewBox="0 0 24 24">
                   <path d="M15.5 14h-.79l-.28-.27a6.471 6.471 0 0 0 1.57-4.23A6.5 6.5 0 1 0 9.5 16c1.61 0 3.09-.59 4.23-1.57l.27.28v.79l5 4.99L20.49 19zm-6 0A4.5 4.5 0 1 1 14 9.5 4.5 4.5 0 0 1 9.5 14z"></path>
                 </svg>
-              </label>
+              </form>
             <?php endif; ?>
           </div>
           <div class="table-wrapper">
             <table>
               <thead>
                 <tr>
+                  <th class="select-cell">
+                    <input type="checkbox" aria-label="Sélectionner les checks affichés" data-bulk-select-all />
+                  </th>
                   <th>Titre (FR)</th>
                   <th>Script</th>
                   <th>Actions</th>
                 </tr>
               </thead>
-              <tbody>
+              <tbody data-check-rows>
                 <?php if (!$checks): ?>
                   <tr class="empty">
-                    <td colspan="3">Aucun check n'a été trouvé dans le dossier « checks ».</td>
+                    <td colspan="4">Aucun check n'a été trouvé dans le dossier « checks ».</td>
                   </tr>
                 <?php else: ?>
-                  <?php foreach ($checks as $item): ?>
-                    <?php
-                      $isSelected = $selectedFile !== '' && $selectedFile === $item['file'];
-                      $entry = $item['manifest'] ?? null;
-                      $filterParts = [
-                        toSearchableString((string) ($entry['title_fr'] ?? '')),
-                        toSearchableString((string) ($entry['title_en'] ?? '')),
-                        toSearchableString((string) ($entry['script'] ?? '')),
-                        toSearchableString($item['file']),
-                      ];
-                      $filterLabel = trim(implode(' ', array_filter($filterParts, static fn (string $part): bool => $part !== '')));
-                    ?>
-                    <tr
-                      <?= $isSelected ? ' class="selected"' : '' ?>
-                      data-check-row
-                      data-filter="<?= h($filterLabel) ?>"
-                      tabindex="0"
-                    >
-                      <td>
-                        <span class="row-title"><?= h($entry['title_fr'] ?? '—') ?></span>
-                        <span class="row-subtitle" title="<?= h($item['file']) ?>"><?= h($item['file']) ?></span>
-                      </td>
-                      <td>
-                        <?= h($entry['script'] ?? '—') ?>
-                        <?php if (!$item['exists']): ?>
-                          <span class="tag warning">manquant</span>
-                        <?php endif; ?>
-                      </td>
-                      <td>
-                        <a class="ghost-btn edit-btn" data-edit-link href="?file=<?= urlencode($item['file']) ?>">
-                          <svg aria-hidden="true" focusable="false" viewBox="0 0 20 20">
-                            <path d="M13.586 3.172a2 2 0 0 1 2.828 2.828l-8.49 8.49-3.42.57.57-3.42 8.512-8.468zm-2.121-.707L3.293 10.637a1 1 0 0 0-.263.5l-.98 5.883a1 1 0 0 0 1.147 1.147l5.883-.98a1 1 0 0 0 .5-.263l8.172-8.172a4 4 0 0 0-5.657-5.657z"></path>
-                          </svg>
-                          <span>Modifier</span>
-                        </a>
-                      </td>
-                    </tr>
-                  <?php endforeach; ?>
+                  <?= renderCheckRows($listing['items'], $selectedFile, $searchQuery) ?>
                 <?php endif; ?>
-                <tr class="empty" data-empty-result style="display: none;">
-                  <td colspan="3">Aucun check ne correspond à votre recherche.</td>
+                <tr class="empty" data-empty-result<?= $checks && $listing['matched'] === 0 ? '' : ' style="display: none;"' ?>>
+                  <td colspan="4">Aucun check ne correspond à votre recherche.</td>
                 </tr>
               </tbody>
             </table>
           </div>
+          <?php if ($listing['next_offset'] !== null): ?>
+            <div class="table-pager">
+              <a
+                class="ghost-btn"
+                data-load-more
+                data-offset="<?= $listing['next_offset'] ?>"
+                href="?<?= h(http_build_query(['q' => $searchQuery !== '' ? $searchQuery : null, 'offset' => $listing['next_offset'], 'file' => $selectedFile !== '' ? $selectedFile : null])) ?>"
+              >Afficher plus de checks</a>
+            </div>
+          <?php endif; ?>
+          <?php if ($checks): ?>
+            <form id="bulk-form" class="bulk-form" method="post" data-bulk-form>
+              <input type="hidden" name="action" value="bulk" />
+              <h3>Modification groupée</h3>
+              <p class="status" data-bulk-count data-empty="Aucun check sélectionné." data-template="%COUNT% check(s) sélectionné(s).">Aucun check sélectionné.</p>
+              <div class="grid">
+                <div class="field">
+                  <label for="bulk-level">Niveau</label>
+                  <select id="bulk-level" name="bulk_level">
+                    <option value="">— Inchangé —</option>
+                    <?php foreach (CHECK_LEVELS as $levelOption): ?>
+                      <option value="<?= h($levelOption) ?>"><?= h($levelOption) ?></option>
+                    <?php endforeach; ?>
+                  </select>
+                </div>
+                <div class="field">
+                  <label for="bulk-script">Script</label>
+                  <input id="bulk-script" name="bulk_script" type="text" placeholder="Inchangé" />
+                </div>
+                <div class="field">
+                  <label for="bulk-title-fr">Titre (FR)</label>
+                  <input id="bulk-title-fr" name="bulk_title_fr" type="text" placeholder="Inchangé" />
+                </div>
+                <div class="field">
+                  <label for="bulk-title-en">Titre (EN)</label>
+                  <input id="bulk-title-en" name="bulk_title_en" type="text" placeholder="Inchangé" />
+                </div>
+              </div>
+              <div class="form-actions">
+                <button class="primary-btn" type="submit" data-bulk-submit>Appliquer à la sélection</button>
+              </div>
+            </form>
+          <?php endif; ?>
         </section>
 
         <section class="card card-editor">
@@ -901,20 +1817,45 @@ function h(?string $value): string
 
     <script>
       (function () {
+        const searchForm = document.querySelector('[data-search-form]');
         const searchInput = document.getElementById('checks-search');
-        if (!searchInput) {
-          return;
-        }
-
-        const rows = Array.prototype.slice.call(document.querySelectorAll('tr[data-check-row]'));
+        const tableBody = document.querySelector('[data-check-rows]');
+        const loadMoreLink = document.querySelector('[data-load-more]');
         const emptyRow = document.querySelector('[data-empty-result]');
         const status = document.querySelector('[data-check-count]');
-        const total = status ? Number(status.getAttribute('data-total')) || rows.length : rows.length;
+        const total = status ? Number(status.getAttribute('data-total')) || 0 : 0;
         const singular = status ? status.getAttribute('data-singular') || '' : '';
         const plural = status ? status.getAttribute('data-plural') || '' : '';
         const displaySingular = status ? status.getAttribute('data-display-singular') || '' : '';
         const displayPlural = status ? status.getAttribute('data-display-plural') || '' : '';
         const emptyMessage = status ? status.getAttribute('data-empty') || '' : '';
+        const selectedFileInput = searchForm ? searchForm.querySelector('input[name="file"]') : null;
+        const searchDelay = 150;
+        let searchTimer = null;
+        let latestRequest = 0;
+        const bulkForm = document.querySelector('[data-bulk-form]');
+        const bulkCount = document.querySelector('[data-bulk-count]');
+        const bulkSelectAll = document.querySelector('[data-bulk-select-all]');
+        const bulkSelection = new Set();
+
+        function updateBulkSelection() {
+          const boxes = tableBody ? Array.prototype.slice.call(tableBody.querySelectorAll('[data-bulk-select]')) : [];
+          boxes.forEach(function (box) {
+            box.checked = bulkSelection.has(box.value);
+          });
+          if (bulkSelectAll) {
+            const checkedCount = boxes.filter(function (box) {
+              return box.checked;
+            }).length;
+            bulkSelectAll.checked = boxes.length > 0 && checkedCount === boxes.length;
+            bulkSelectAll.indeterminate = checkedCount > 0 && checkedCount < boxes.length;
+          }
+          if (bulkCount) {
+            bulkCount.textContent = bulkSelection.size === 0
+              ? bulkCount.getAttribute('data-empty') || ''
+              : (bulkCount.getAttribute('data-template') || '%COUNT%').replace('%COUNT%', String(bulkSelection.size));
+          }
+        }
 
         function updateStatus(visibleCount) {
           if (!status) {
@@ -940,51 +1881,179 @@ function h(?string $value): string
           }
         }
 
-        function updateFilter() {
-          const query = searchInput.value.trim().toLowerCase();
-          let visibleCount = 0;
+        function buildListParams(offset) {
+          const params = new URLSearchParams();
+          const query = searchInput ? searchInput.value.trim() : '';
+          if (query !== '') {
+            params.set('q', query);
+          }
+          if (offset > 0) {
+            params.set('offset', String(offset));
+          }
+          if (selectedFileInput && selectedFileInput.value) {
+            params.set('file', selectedFileInput.value);
+          }
+          return params;
+        }
+
+        function updateLoadMore(nextOffset) {
+          if (!loadMoreLink) {
+            return;
+          }
+          if (nextOffset === null || nextOffset === undefined) {
+            loadMoreLink.setAttribute('hidden', 'hidden');
+            return;
+          }
+          loadMoreLink.removeAttribute('hidden');
+          loadMoreLink.setAttribute('data-offset', String(nextOffset));
+          loadMoreLink.href = '?' + buildListParams(nextOffset).toString();
+        }
+
+        function requestRows(offset, append) {
+          const params = buildListParams(offset);
+          params.set('action', 'list');
+          const requestId = ++latestRequest;
+
+          return fetch('index.php?' + params.toString(), { headers: { Accept: 'application/json' } })
+            .then(function (response) {
+              if (!response.ok) {
+                throw new Error('HTTP ' + response.status);
+              }
+              return response.json();
+            })
+            .then(function (data) {
+              if (requestId !== latestRequest || !tableBody) {
+                return;
+              }
+              if (!append) {
+                tableBody.querySelectorAll('tr[data-check-row]').forEach(function (row) {
+                  row.remove();
+                });
+              }
+              if (emptyRow) {
+                emptyRow.insertAdjacentHTML('beforebegin', data.html || '');
+                emptyRow.style.display = data.matched === 0 ? '' : 'none';
+              } else {
+                tableBody.insertAdjacentHTML('beforeend', data.html || '');
+              }
+              updateStatus(data.matched);
+              updateLoadMore(data.next_offset);
+              updateBulkSelection();
+            });
+        }
+
+        function openRow(row) {
+          const link = row.querySelector('[data-edit-link]');
+          if (link && link.href) {
+            window.location.href = link.href;
+          }
+        }
+
+        if (searchForm && searchInput && tableBody && window.fetch) {
+          searchForm.addEventListener('submit', function (event) {
+            event.preventDefault();
+          });
+
+          searchInput.addEventListener('input', function () {
+            window.clearTimeout(searchTimer);
+            searchTimer = window.setTimeout(function () {
+              const params = buildListParams(0);
+              const search = params.toString();
+              window.history.replaceState(null, '', search ? '?' + search : window.location.pathname);
+              requestRows(0, false).catch(function () {
+                searchForm.submit();
+              });
+            }, searchDelay);
+          });
+
+          if (loadMoreLink) {
+            loadMoreLink.addEventListener('click', function (event) {
+              event.preventDefault();
+              const offset = Number(loadMoreLink.getAttribute('data-offset')) || 0;
+              requestRows(offset, true).catch(function () {
+                window.location.href = loadMoreLink.href;
+              });
+            });
+          }
+        }
 
-          rows.forEach(function (row) {
-            const haystack = row.getAttribute('data-filter') || '';
-            const matches = query === '' || haystack.indexOf(query) !== -1;
-            row.style.display = matches ? '' : 'none';
-            if (matches) {
-              visibleCount += 1;
+        if (tableBody && bulkForm) {
+          tableBody.addEventListener('change', function (event) {
+            const box = event.target;
+            if (!box || !box.matches || !box.matches('[data-bulk-select]')) {
+              return;
             }
+            if (box.checked) {
+              bulkSelection.add(box.value);
+            } else {
+              bulkSelection.delete(box.value);
+            }
+            updateBulkSelection();
           });
 
-          if (emptyRow) {
-            emptyRow.style.display = visibleCount === 0 ? '' : 'none';
+          if (bulkSelectAll) {
+            bulkSelectAll.addEventListener('change', function () {
+              tableBody.querySelectorAll('[data-bulk-select]').forEach(function (box) {
+                if (bulkSelectAll.checked) {
+                  bulkSelection.add(box.value);
+                } else {
+                  bulkSelection.delete(box.value);
+                }
+              });
+              updateBulkSelection();
+            });
           }
 
-          updateStatus(visibleCount);
-        }
+          bulkForm.addEventListener('submit', function () {
+            bulkForm.querySelectorAll('input[data-bulk-hidden]').forEach(function (input) {
+              input.remove();
+            });
+            const visible = new Set();
+            tableBody.querySelectorAll('[data-bulk-select]').forEach(function (box) {
+              visible.add(box.value);
+            });
+            bulkSelection.forEach(function (file) {
+              if (visible.has(file)) {
+                return;
+              }
+              const input = document.createElement('input');
+              input.type = 'hidden';
+              input.name = 'files[]';
+              input.value = file;
+              input.setAttribute('data-bulk-hidden', '');
+              bulkForm.appendChild(input);
+            });
+          });
 
-        searchInput.addEventListener('input', updateFilter);
-        updateFilter();
+          tableBody.querySelectorAll('[data-bulk-select]:checked').forEach(function (box) {
+            bulkSelection.add(box.value);
+          });
+          updateBulkSelection();
+        }
 
-        rows.forEach(function (row) {
-          row.addEventListener('click', function (event) {
-            var target = event.target;
-            if (target && target.closest && target.closest('a')) {
+        if (tableBody) {
+          tableBody.addEventListener('click', function (event) {
+            const target = event.target;
+            if (target && target.closest && target.closest('a, input, label')) {
               return;
             }
-            const link = row.querySelector('[data-edit-link]');
-            if (link && link.href) {
-              window.location.href = link.href;
+            const row = target && target.closest ? target.closest('tr[data-check-row]') : null;
+            if (row) {
+              openRow(row);
             }
           });
 
-          row.addEventListener('keydown', function (event) {
-            if (event.key === 'Enter' || event.key === ' ') {
-              const link = row.querySelector('[data-edit-link]');
-              if (link && link.href) {
-                event.preventDefault();
-                window.location.href = link.href;
-              }
+          tableBody.addEventListener('keydown', function (event) {
+            if (event.key !== 'Enter' && event.key !== ' ') {
+              return;
+            }
+            const row = event.target && event.target.closest ? event.target.closest('tr[data-check-row]') : null;
+            if (row && row === event.target) {
+              event.preventDefault();
+              openRow(row);
             }
           });
-        });
+        }
 
         const toolbars = document.querySelectorAll('[data-toolbar-for]');
         toolbars.forEach(function (toolbar) {
@@ -1038,6 +2107,47 @@ function h(?string $value): string
           });
         });
 
+        const rebuildStatus = document.querySelector('[data-rebuild-status]');
+        if (rebuildStatus && window.fetch) {
+          let rebuildPolls = 0;
+          const maxRebuildPolls = 40;
+
+          const pollRebuildStatus = function () {
+            rebuildPolls += 1;
+            fetch('index.php?action=rebuild-status', { headers: { Accept: 'application/json' } })
+              .then(function (response) {
+                return response.ok ? response.json() : null;
+              })
+              .then(function (status) {
+                if (!status) {
+                  return;
+                }
+                rebuildStatus.removeAttribute('hidden');
+                const busy = status.pending > 0 || status.processing > 0 || status.state === 'running';
+                if (!busy) {
+                  const error = status.last_run && status.last_run.error;
+                  rebuildStatus.textContent = error
+                    ? rebuildStatus.getAttribute('data-failed') + ' ' + error
+                    : rebuildStatus.getAttribute('data-done');
+                  return;
+                }
+                if (!status.worker_alive) {
+                  rebuildStatus.textContent = rebuildStatus.getAttribute('data-no-worker');
+                  return;
+                }
+                rebuildStatus.textContent = rebuildStatus.getAttribute('data-pending');
+                if (rebuildPolls < maxRebuildPolls) {
+                  window.setTimeout(pollRebuildStatus, 1500);
+                }
+              })
+              .catch(function () {
+                rebuildStatus.setAttribute('hidden', 'hidden');
+              });
+          };
+
+          window.setTimeout(pollRebuildStatus, 500);
+        }
+
         const previewButton = document.querySelector('[data-preview-button]');
         const previewOverlay = document.querySelector('[data-preview-overlay]');
         const previewClose = document.querySelector('[data-close-preview]');
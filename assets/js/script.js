@@ -41,7 +41,30 @@ function getLevelGroup(level) {
   }
 }
 
+// Level and sidebar filters are container state: these rules hide the cards of
+// the other groups, so toggling a filter never touches the cards themselves.
+function installLevelFilterRules() {
+  if (document.querySelector('style[data-level-filter-rules]')) {
+    return;
+  }
+  const container = '[data-manifest-container]';
+  const keys = SIDEBAR_GROUPS.map((group) => group.key).filter((key) => key !== 'all');
+  const selectors = keys.flatMap((key) => [
+    `${container}[data-sidebar-group="${key}"] > .check-card:not([data-level="${key}"])`,
+    `${container}[data-filter-levels]:not([data-filter-levels~="${key}"]) > .check-card[data-level="${key}"]`
+  ]);
+  selectors.push(
+    `${container}[data-filter-levels] > .check-card${keys.map((key) => `:not([data-level="${key}"])`).join('')}`
+  );
+  const style = document.createElement('style');
+  style.setAttribute('data-level-filter-rules', '');
+  style.textContent = `${selectors.join(',\n')} {\n  display: none !important;\n}\n`;
+  document.head.appendChild(style);
+}
+
 const STORAGE_KEY = 'precheck-doc-language';
+// Language the generated pages and index.html are pre-filled with.
+const DEFAULT_LANGUAGE = 'fr';
 const DISPLAY_MODE_STORAGE_KEY = 'precheck-display-mode';
 const DISPLAY_MODES = new Set(['grid-6x6', 'grid-4x4', 'grid-list']);
 const LEGACY_DISPLAY_MODES = {
@@ -66,7 +89,48 @@ function getPreferredLanguage() {
   } catch (error) {
     console.warn('Unable to read stored language', error);
   }
-  return 'fr';
+  return DEFAULT_LANGUAGE;
+}
+
+function getCurrentLanguage() {
+  return document.documentElement.getAttribute('lang') === 'en' ? 'en' : 'fr';
+}
+
+function setLocalizedText(element, fr, en) {
+  element.setAttribute('data-fr', fr);
+  element.setAttribute('data-en', en);
+  element.textContent = getCurrentLanguage() === 'en' ? en : fr;
+}
+
+const DETAIL_HASH_PREFIX = '#/checks/';
+
+function getCheckSlug(file) {
+  return (file || '').split('/').pop().replace(/\.html$/, '');
+}
+
+// Single-file offline bundle: manifest and fragments are embedded as JSON blocks.
+const IS_BUNDLE = document.documentElement.hasAttribute('data-bundle');
+
+function readEmbeddedJson(selector) {
+  const block = document.querySelector(selector);
+  return block ? JSON.parse(block.textContent) : null;
+}
+
+function getCheckHref(check) {
+  return IS_BUNDLE ? DETAIL_HASH_PREFIX + encodeURIComponent(getCheckSlug(check.file)) : check.file;
+}
+
+const prefetchedDocuments = new Set();
+
+function prefetchDocument(url) {
+  if (!url || IS_BUNDLE || prefetchedDocuments.has(url)) {
+    return;
+  }
+  prefetchedDocuments.add(url);
+  const link = document.createElement('link');
+  link.rel = 'prefetch';
+  link.href = url;
+  document.head.appendChild(link);
 }
 
 function setPreferredLanguage(lang) {
@@ -125,6 +189,214 @@ function setPreferredDisplayMode(mode) {
   }
 }
 
+// Performance spans: each phase is a performance.measure() from its start mark,
+// visible in the browser's performance panel. When <body> carries
+// data-metrics-endpoint, durations are batched and sent with sendBeacon to the
+// `python -m docs_cc metrics` collector.
+const METRICS_PREFIX = 'precheck:';
+const METRICS_BATCH_SIZE = 50;
+const supportsMetrics = Boolean(
+  window.performance && performance.mark && performance.measure && performance.getEntriesByName
+);
+const metricsQueue = [];
+let metricsCatalogueSize = 0;
+
+function recordMetric(phase, duration) {
+  metricsQueue.push({ phase, ms: Math.round(duration * 10) / 10 });
+  if (metricsQueue.length >= METRICS_BATCH_SIZE) {
+    flushMetrics();
+  }
+}
+
+function startPhase(name) {
+  if (supportsMetrics) {
+    performance.mark(`${METRICS_PREFIX}${name}:start`);
+  }
+}
+
+function endPhase(name) {
+  if (!supportsMetrics) {
+    return;
+  }
+  const measureName = METRICS_PREFIX + name;
+  const startMark = `${measureName}:start`;
+  try {
+    performance.measure(measureName, startMark);
+  } catch (error) {
+    return; // phase was never started
+  }
+  const measures = performance.getEntriesByName(measureName, 'measure');
+  recordMetric(name, measures[measures.length - 1].duration);
+  // Keystroke phases would otherwise grow the performance timeline forever.
+  performance.clearMarks(startMark);
+  performance.clearMeasures(measureName);
+}
+
+// Ends the phase once the update has been painted (the task after the next frame).
+function endPhaseAfterPaint(name) {
+  if (!supportsMetrics || !window.requestAnimationFrame) {
+    endPhase(name);
+    return;
+  }
+  requestAnimationFrame(() => setTimeout(() => endPhase(name), 0));
+}
+
+function flushMetrics() {
+  const endpoint = document.body ? document.body.dataset.metricsEndpoint : '';
+  const metrics = metricsQueue.splice(0);
+  if (!metrics.length || !endpoint || !navigator.sendBeacon) {
+    return;
+  }
+  const payload = JSON.stringify({
+    page: document.body.dataset.page || '',
+    checks: metricsCatalogueSize,
+    metrics
+  });
+  // text/plain keeps the beacon a simple CORS request.
+  navigator.sendBeacon(endpoint, new Blob([payload], { type: 'text/plain;charset=UTF-8' }));
+}
+
+document.addEventListener('visibilitychange', () => {
+  if (document.visibilityState === 'hidden') {
+    flushMetrics();
+  }
+});
+window.addEventListener('pagehide', flushMetrics);
+
+const MANIFEST_VERSION_URL = 'manifest.version.json';
+const MANIFEST_CACHE_KEY = 'precheck-manifest-cache';
+const MANIFEST_DB_NAME = 'precheck-doc';
+const MANIFEST_DB_STORE = 'manifest';
+
+function fetchJson(url, options) {
+  return fetch(url, options).then((response) => {
+    if (!response.ok) {
+      throw new Error('Network response was not ok');
+    }
+    return response.json();
+  });
+}
+
+// The manifest is kept in IndexedDB when available, otherwise in localStorage.
+function openManifestDatabase() {
+  return new Promise((resolve, reject) => {
+    if (!window.indexedDB) {
+      reject(new Error('IndexedDB unavailable'));
+      return;
+    }
+    const request = indexedDB.open(MANIFEST_DB_NAME, 1);
+    request.onupgradeneeded = () => request.result.createObjectStore(MANIFEST_DB_STORE);
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+function readCachedManifest() {
+  return openManifestDatabase()
+    .then(
+      (db) =>
+        new Promise((resolve, reject) => {
+          const request = db
+            .transaction(MANIFEST_DB_STORE, 'readonly')
+            .objectStore(MANIFEST_DB_STORE)
+            .get(MANIFEST_CACHE_KEY);
+          request.onsuccess = () => resolve(request.result || null);
+          request.onerror = () => reject(request.error);
+        })
+    )
+    .catch(() => {
+      try {
+        const stored = window.localStorage ? localStorage.getItem(MANIFEST_CACHE_KEY) : null;
+        return stored ? JSON.parse(stored) : null;
+      } catch (error) {
+        return null;
+      }
+    });
+}
+
+function writeCachedManifest(record) {
+  return openManifestDatabase()
+    .then(
+      (db) =>
+        new Promise((resolve, reject) => {
+          const transaction = db.transaction(MANIFEST_DB_STORE, 'readwrite');
+          transaction.objectStore(MANIFEST_DB_STORE).put(record, MANIFEST_CACHE_KEY);
+          transaction.oncomplete = () => resolve();
+          transaction.onerror = () => reject(transaction.error);
+        })
+    )
+    .catch(() => {
+      try {
+        if (window.localStorage) {
+          localStorage.setItem(MANIFEST_CACHE_KEY, JSON.stringify(record));
+        }
+      } catch (error) {
+        console.warn('Unable to cache the manifest', error);
+      }
+    });
+}
+
+function parseManifestText(text) {
+  startPhase('manifest-parse');
+  const entries = JSON.parse(text);
+  endPhase('manifest-parse');
+  return entries;
+}
+
+function fetchManifest(options) {
+  return fetch('manifest.json', options).then((response) => {
+    if (!response.ok) {
+      throw new Error('Network response was not ok');
+    }
+    return response.text().then(parseManifestText);
+  });
+}
+
+function applyManifestDelta(entries, delta) {
+  const byFile = new Map(entries.map((entry) => [entry.file, entry]));
+  delta.removed.forEach((file) => byFile.delete(file));
+  delta.changed.concat(delta.added).forEach((entry) => byFile.set(entry.file, entry));
+  if (byFile.size !== delta.count) {
+    throw new Error('Manifest delta does not match the cached version');
+  }
+  return Array.from(byFile.values());
+}
+
+// Title order written next to each manifest version; the admin drops it from
+// manifest.version.json when it edits the manifest.
+function fetchManifestOrder(info) {
+  if (!info.order) {
+    return Promise.resolve(null);
+  }
+  return fetchJson(info.order)
+    .then((order) => (order && order.version === info.version ? order : null))
+    .catch(() => null);
+}
+
+// Revalidates manifest.version.json only; the full manifest is downloaded when
+// no cached copy exists or no delta leads from the cached version to the
+// current one.
+function loadVersionedManifest() {
+  return Promise.all([
+    readCachedManifest(),
+    fetchJson(MANIFEST_VERSION_URL, { cache: 'no-cache' })
+  ]).then(([cached, info]) => {
+    if (cached && cached.version === info.version && Array.isArray(cached.entries)) {
+      return { entries: cached.entries, order: cached.order || null };
+    }
+    const deltaUrl = cached && Array.isArray(cached.entries) && info.deltas && info.deltas[cached.version];
+    const update = deltaUrl
+      ? fetchJson(deltaUrl)
+          .then((delta) => applyManifestDelta(cached.entries, delta))
+          .catch(() => fetchManifest({ cache: 'no-cache' }))
+      : fetchManifest({ cache: 'no-cache' });
+    return Promise.all([update, fetchManifestOrder(info)]).then(([entries, order]) => {
+      writeCachedManifest({ version: info.version, entries, order });
+      return { entries, order };
+    });
+  });
+}
+
 function applyLanguage(lang) {
   document.documentElement.setAttribute('lang', lang);
   const targets = document.querySelectorAll('[data-fr][data-en]');
@@ -153,16 +425,118 @@ function switchLanguage(lang) {
   setPreferredLanguage(lang);
 }
 
+// Card enter/exit transitions are queued and applied once per frame: a read
+// pass over the queued cards, then a write pass, so filtering never interleaves
+// layout reads and writes. Large batches, cards outside the viewport and
+// prefers-reduced-motion switch cards without animation.
+const CARD_ANIMATION_LIMIT = 24;
+const CARD_ENTER_CLASS = 'is-entering';
+const CARD_EXIT_CLASS = 'is-hiding';
+const reducedMotionQuery = window.matchMedia
+  ? window.matchMedia('(prefers-reduced-motion: reduce)')
+  : null;
+
+function createCardTransitions(container) {
+  const pending = new Map();
+  let frame = 0;
+
+  function isShown(card) {
+    return !card.hasAttribute('hidden') && !card.classList.contains(CARD_EXIT_CLASS);
+  }
+
+  function flush() {
+    frame = 0;
+    const changes = [];
+    pending.forEach((shouldShow, card) => {
+      if (isShown(card) !== shouldShow) {
+        changes.push({ card, shouldShow, animate: false });
+      }
+    });
+    pending.clear();
+
+    // Read pass. Hidden cards cannot be measured; a card leaving is only
+    // animated while it is on screen, so its animationend is sure to fire.
+    const animate =
+      changes.length <= CARD_ANIMATION_LIMIT && !(reducedMotionQuery && reducedMotionQuery.matches);
+    if (animate) {
+      const viewportHeight = window.innerHeight;
+      changes.forEach((change) => {
+        if (change.shouldShow) {
+          change.animate = true;
+          return;
+        }
+        const rect = change.card.getBoundingClientRect();
+        change.animate = rect.height > 0 && rect.bottom > 0 && rect.top < viewportHeight;
+      });
+    }
+
+    // Write pass.
+    changes.forEach(({ card, shouldShow, animate: play }) => {
+      if (shouldShow) {
+        card.classList.remove(CARD_EXIT_CLASS);
+        card.removeAttribute('hidden');
+        card.classList.toggle(CARD_ENTER_CLASS, play);
+      } else {
+        card.classList.remove(CARD_ENTER_CLASS);
+        if (play) {
+          card.classList.add(CARD_EXIT_CLASS);
+        } else {
+          card.setAttribute('hidden', '');
+        }
+      }
+    });
+  }
+
+  container.addEventListener('animationend', (event) => {
+    const card = event.target;
+    if (!card.classList || !card.classList.contains('check-card')) {
+      return;
+    }
+    if (event.animationName === 'cardExit' && card.classList.contains(CARD_EXIT_CLASS)) {
+      card.classList.remove(CARD_EXIT_CLASS);
+      card.setAttribute('hidden', '');
+    } else if (event.animationName === 'cardEnter') {
+      card.classList.remove(CARD_ENTER_CLASS);
+    }
+  });
+
+  return function setCardVisibility(card, shouldShow) {
+    pending.set(card, shouldShow);
+    if (!window.requestAnimationFrame) {
+      flush();
+    } else if (!frame) {
+      frame = requestAnimationFrame(flush);
+    }
+  };
+}
+
 document.addEventListener('DOMContentLoaded', () => {
+  const staticLang = document.body ? document.body.getAttribute('data-static-lang') : null;
+  if (staticLang === 'fr' || staticLang === 'en') {
+    // Pre-rendered single-language page: the text is already inline and the
+    // language switch is a link, so only remember the language being read.
+    setPreferredLanguage(staticLang);
+    return;
+  }
+
+  // Static markup already carries the default language, so the full-document
+  // pass is only needed when the reader prefers the other one.
   const initialLang = getPreferredLanguage();
-  applyLanguage(initialLang);
+  if (initialLang !== DEFAULT_LANGUAGE) {
+    applyLanguage(initialLang);
+  } else {
+    updateLanguageToggle(initialLang);
+  }
 
   const languageToggle = document.querySelector('[data-language-toggle]');
   if (languageToggle) {
     languageToggle.addEventListener('click', () => {
-      const currentLang = document.documentElement.getAttribute('lang') === 'en' ? 'en' : 'fr';
+      const currentLang = getCurrentLanguage();
       const nextLang = currentLang === 'fr' ? 'en' : 'fr';
+      startPhase('language-switch');
       switchLanguage(nextLang);
+      refreshSidebarLinks();
+      endPhaseAfterPaint('language-switch');
     });
   }
 
@@ -177,10 +551,14 @@ document.addEventListener('DOMContentLoaded', () => {
   const displayModeButtons = Array.from(
     document.querySelectorAll('[data-display-mode-button]')
   );
+  const detailView = document.querySelector('[data-detail-view]');
+  const checksBySlug = new Map();
+  const fragmentRequests = new Map();
   let sidebarButtons = [];
   let activeSidebarLevel = 'all';
-  let filterChecksRef = null;
+  let applyLevelStateRef = null;
   let sidebarState = null;
+  let listScrollPosition = 0;
 
   function applyDisplayMode(mode, options = {}) {
     if (!document.body) {
@@ -243,6 +621,7 @@ document.addEventListener('DOMContentLoaded', () => {
     if (current) {
       current.toggle.classList.add('is-active');
       if (current.panel) {
+        renderSidebarGroup(current, activeSidebarLevel);
         current.panel.hidden = false;
         current.toggle.setAttribute('aria-expanded', 'true');
       }
@@ -264,8 +643,8 @@ document.addEventListener('DOMContentLoaded', () => {
     }
     applySidebarState();
 
-    if (typeof filterChecksRef === 'function') {
-      filterChecksRef();
+    if (typeof applyLevelStateRef === 'function') {
+      applyLevelStateRef();
     }
   }
 
@@ -276,9 +655,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
     const title = document.createElement('h2');
     title.className = 'sidebar-title';
-    title.setAttribute('data-fr', 'Criticité');
-    title.setAttribute('data-en', 'Criticality');
-    title.textContent = 'Criticité';
+    setLocalizedText(title, 'Criticité', 'Criticality');
     sidebar.appendChild(title);
 
     const list = document.createElement('ul');
@@ -297,7 +674,9 @@ document.addEventListener('DOMContentLoaded', () => {
       toggle.dataset.level = group.key;
       toggle.dataset.hasPanel = group.key !== 'all' ? 'true' : 'false';
       toggle.setAttribute('aria-expanded', 'false');
-      toggle.innerHTML = `<span data-fr="${group.label.fr}" data-en="${group.label.en}">${group.label.fr}</span>`;
+      const toggleLabel = document.createElement('span');
+      setLocalizedText(toggleLabel, group.label.fr, group.label.en);
+      toggle.appendChild(toggleLabel);
       listItem.appendChild(toggle);
 
       let panel = null;
@@ -314,22 +693,23 @@ document.addEventListener('DOMContentLoaded', () => {
       }
 
       list.appendChild(listItem);
-      groups.set(group.key, { toggle, panel, linksList, definition: group });
+      groups.set(group.key, { toggle, panel, linksList, definition: group, renderedLang: null });
     });
 
     document.body.appendChild(sidebar);
     sidebarButtons = Array.from(sidebar.querySelectorAll('.sidebar-toggle'));
-    sidebarState = { sidebar, groups };
+    sidebarState = { sidebar, groups, catalogue: null };
 
     sidebarButtons.forEach((button) => {
       button.addEventListener('click', () => {
         const levelKey = button.dataset.level || 'all';
+        startPhase('filter-toggle');
         handleSidebarToggle(levelKey);
+        endPhaseAfterPaint('filter-toggle');
       });
     });
 
     applySidebarState();
-    applyLanguage(getPreferredLanguage());
   }
 
   if (pageType === 'index') {
@@ -349,93 +729,145 @@ document.addEventListener('DOMContentLoaded', () => {
     applyDisplayMode(DEFAULT_DISPLAY_MODE, { skipStorage: true });
   }
 
-  function updateSidebar(checks) {
-    if (!sidebarState) {
+  // Links are only created when a group is expanded, in the title order of the
+  // current language; collapsed groups stay empty until someone opens them.
+  function renderSidebarGroup(group, key) {
+    const lang = getCurrentLanguage();
+    if (!group.linksList || !sidebarState.catalogue || group.renderedLang === lang) {
       return;
     }
 
-    sidebarState.groups.forEach(({ linksList }, key) => {
-      if (!linksList) {
-        return;
-      }
+    const { checks, order } = sidebarState.catalogue;
+    const titleKey = `title_${lang}`;
+    const matches = order
+      ? (order[lang][key] || []).map((file) => checksBySlug.get(getCheckSlug(file)))
+      : checks
+          .filter((check) => getLevelGroup(check.level) === key)
+          .sort((a, b) => (a[titleKey] || '').localeCompare(b[titleKey] || ''));
+
+    const linksList = group.linksList;
+    linksList.textContent = '';
+    group.renderedLang = lang;
+
+    if (!matches.length) {
+      const emptyItem = document.createElement('li');
+      const emptyText = document.createElement('span');
+      emptyText.className = 'sidebar-empty';
+      setLocalizedText(emptyText, 'Aucun contrôle disponible', 'No checks available');
+      emptyItem.appendChild(emptyText);
+      linksList.appendChild(emptyItem);
+      return;
+    }
 
-      linksList.innerHTML = '';
-      const matches = checks
-        .filter((check) => getLevelGroup(check.level) === key)
-        .slice()
-        .sort((a, b) => a.title_fr.localeCompare(b.title_fr));
-
-      if (!matches.length) {
-        const emptyItem = document.createElement('li');
-        const emptyText = document.createElement('span');
-        emptyText.className = 'sidebar-empty';
-        emptyText.setAttribute('data-fr', 'Aucun contrôle disponible');
-        emptyText.setAttribute('data-en', 'No checks available');
-        emptyText.textContent = 'Aucun contrôle disponible';
-        emptyItem.appendChild(emptyText);
-        linksList.appendChild(emptyItem);
-        return;
+    const fragment = document.createDocumentFragment();
+    matches.forEach((check) => {
+      const listItem = document.createElement('li');
+      const link = document.createElement('a');
+      link.className = 'sidebar-link';
+      setLocalizedText(link, check.title_fr, check.title_en);
+
+      if (check.file) {
+        link.href = getCheckHref(check);
+        link.dataset.detailSlug = getCheckSlug(check.file);
+      } else {
+        link.href = '#';
+        link.classList.add('is-disabled');
+        link.setAttribute('aria-disabled', 'true');
+        link.addEventListener('click', (event) => event.preventDefault());
       }
 
-      matches.forEach((check) => {
-        const listItem = document.createElement('li');
-        const link = document.createElement('a');
-        link.className = 'sidebar-link';
-        link.setAttribute('data-fr', check.title_fr);
-        link.setAttribute('data-en', check.title_en);
-        link.textContent = check.title_fr;
+      listItem.appendChild(link);
+      fragment.appendChild(listItem);
+    });
+    linksList.appendChild(fragment);
+  }
 
-        if (check.file) {
-          link.href = check.file;
-        } else {
-          link.href = '#';
-          link.classList.add('is-disabled');
-          link.setAttribute('aria-disabled', 'true');
-          link.addEventListener('click', (event) => event.preventDefault());
-        }
+  function refreshSidebarLinks() {
+    if (!sidebarState) {
+      return;
+    }
+    sidebarState.groups.forEach((group, key) => {
+      if (group.panel && !group.panel.hidden) {
+        renderSidebarGroup(group, key);
+      }
+    });
+  }
 
-        listItem.appendChild(link);
-        linksList.appendChild(listItem);
-      });
+  function updateSidebar(checks, order) {
+    if (!sidebarState) {
+      return;
+    }
+
+    sidebarState.catalogue = { checks, order };
+    sidebarState.groups.forEach((group) => {
+      if (group.linksList) {
+        group.linksList.textContent = '';
+        group.renderedLang = null;
+      }
     });
 
     applySidebarState();
-    applyLanguage(getPreferredLanguage());
   }
 
-  function setupCardInteractions(card) {
-    const updatePressedState = () => {
-      card.setAttribute('aria-pressed', card.classList.contains('is-flipped') ? 'true' : 'false');
-    };
-
-    const shouldToggle = (event) => {
-      if (event.target.closest('.btn')) {
-        return false;
+  // One set of listeners on the container serves every card, including the
+  // ones rendered after a manifest update.
+  function setupCardInteractions() {
+    const getToggledCard = (event) => {
+      const card = event.target.closest('.check-card');
+      if (!card || event.target.closest('.btn')) {
+        return null;
       }
       const mode = document.body ? document.body.getAttribute('data-display-mode') : null;
-      return mode !== 'grid-list';
+      return mode !== 'grid-list' ? card : null;
     };
 
-    card.addEventListener('click', (event) => {
-      if (!shouldToggle(event)) {
-        return;
-      }
+    const toggleCard = (card) => {
       card.classList.toggle('is-flipped');
-      updatePressedState();
+      card.setAttribute('aria-pressed', card.classList.contains('is-flipped') ? 'true' : 'false');
+    };
+
+    manifestContainer.addEventListener('click', (event) => {
+      const card = getToggledCard(event);
+      if (card) {
+        toggleCard(card);
+      }
     });
 
-    card.addEventListener('keydown', (event) => {
-      if (!shouldToggle(event)) {
+    manifestContainer.addEventListener('keydown', (event) => {
+      if (event.key !== 'Enter' && event.key !== ' ' && event.key !== 'Spacebar') {
         return;
       }
-      if (event.key === 'Enter' || event.key === ' ' || event.key === 'Spacebar') {
+      const card = getToggledCard(event);
+      if (card) {
         event.preventDefault();
-        card.classList.toggle('is-flipped');
-        updatePressedState();
+        toggleCard(card);
       }
     });
+
+    const prefetchCard = (event) => {
+      const card = event.target.closest('.check-card');
+      if (!card || (event.relatedTarget && card.contains(event.relatedTarget))) {
+        return;
+      }
+      const link = card.querySelector('[data-detail-slug]');
+      const check = link ? checksBySlug.get(link.dataset.detailSlug) : null;
+      if (!check) {
+        return;
+      }
+      // With the detail view, a click opens the JSON fragment, not the page.
+      if (detailView) {
+        warmFragment(check.file);
+      } else {
+        prefetchDocument(check.file);
+      }
+    };
+    manifestContainer.addEventListener('pointerover', prefetchCard);
+    manifestContainer.addEventListener('focusin', prefetchCard);
   }
 
+  setupCardInteractions();
+  const setCardVisibility = createCardTransitions(manifestContainer);
+
   function renderChecks(checks) {
     manifestContainer.innerHTML = '';
 
@@ -466,21 +898,21 @@ document.addEventListener('DOMContentLoaded', () => {
         fr: check.level || '',
         en: check.level || ''
       };
-      levelPill.setAttribute('data-fr', levelLabel.fr);
-      levelPill.setAttribute('data-en', levelLabel.en);
-      levelPill.textContent = levelLabel.fr;
+      setLocalizedText(levelPill, levelLabel.fr, levelLabel.en);
       front.appendChild(levelPill);
 
       const title = document.createElement('h3');
-      title.setAttribute('data-fr', check.title_fr);
-      title.setAttribute('data-en', check.title_en);
+      setLocalizedText(title, check.title_fr, check.title_en);
       front.appendChild(title);
 
       if (check.description_fr || check.description_en) {
         const description = document.createElement('p');
         description.className = 'card-description';
-        description.setAttribute('data-fr', check.description_fr || '');
-        description.setAttribute('data-en', check.description_en || check.description_fr || '');
+        setLocalizedText(
+          description,
+          check.description_fr || '',
+          check.description_en || check.description_fr || ''
+        );
         front.appendChild(description);
       }
 
@@ -489,25 +921,27 @@ document.addEventListener('DOMContentLoaded', () => {
       cardInner.appendChild(back);
 
       const summary = document.createElement('p');
-      summary.setAttribute('data-fr', check.description_fr || '');
-      summary.setAttribute('data-en', check.description_en || check.description_fr || '');
+      setLocalizedText(
+        summary,
+        check.description_fr || '',
+        check.description_en || check.description_fr || ''
+      );
       back.appendChild(summary);
 
       const button = document.createElement('a');
       button.className = 'btn';
       if (check.file) {
-        button.href = check.file;
+        button.href = getCheckHref(check);
+        button.dataset.detailSlug = getCheckSlug(check.file);
       } else {
         button.href = '#';
         button.setAttribute('aria-disabled', 'true');
         button.classList.add('is-disabled');
       }
-      button.setAttribute('data-fr', 'Consulter la documentation');
-      button.setAttribute('data-en', 'View documentation');
+      setLocalizedText(button, 'Consulter la documentation', 'View documentation');
       back.appendChild(button);
 
       fragment.appendChild(card);
-      setupCardInteractions(card);
 
       const searchableParts = [
         check.title_fr,
@@ -535,101 +969,63 @@ document.addEventListener('DOMContentLoaded', () => {
     });
 
     manifestContainer.appendChild(fragment);
-    applyLanguage(getPreferredLanguage());
 
     return entries;
   }
 
-  function handleFiltering(checks) {
-    const sorted = checks.slice().sort((a, b) => a.title_fr.localeCompare(b.title_fr));
+  // The order written by the generator is only trusted when it lists exactly
+  // the checks of this manifest.
+  function isCompleteOrder(order, checks) {
+    return (
+      !!order &&
+      ['fr', 'en'].every(
+        (lang) =>
+          order[lang] &&
+          Array.isArray(order[lang].all) &&
+          order[lang].all.length === checks.length &&
+          order[lang].all.every((file) => checksBySlug.has(getCheckSlug(file)))
+      )
+    );
+  }
+
+  function handleFiltering(checks, order) {
+    checks.forEach((check) => {
+      if (check.file) {
+        checksBySlug.set(getCheckSlug(check.file), check);
+      }
+    });
+    const titleOrder = isCompleteOrder(order, checks) ? order : null;
+    const sorted = titleOrder
+      ? titleOrder.fr.all.map((file) => checksBySlug.get(getCheckSlug(file)))
+      : checks.slice().sort((a, b) => a.title_fr.localeCompare(b.title_fr));
+    startPhase('render');
     const entries = renderChecks(sorted);
-    updateSidebar(sorted);
+    endPhase('render');
+    startPhase('sidebar');
+    updateSidebar(checks, titleOrder);
+    endPhase('sidebar');
 
     const emptyMessage = document.createElement('p');
     emptyMessage.className = 'empty-state';
-    emptyMessage.setAttribute('data-fr', 'Aucun résultat ne correspond à votre recherche.');
-    emptyMessage.setAttribute('data-en', 'No results match your search.');
+    setLocalizedText(
+      emptyMessage,
+      'Aucun résultat ne correspond à votre recherche.',
+      'No results match your search.'
+    );
     emptyMessage.style.display = 'none';
     manifestContainer.parentNode.insertBefore(emptyMessage, manifestContainer.nextSibling);
-    applyLanguage(getPreferredLanguage());
-
-    function setCardVisibility(element, shouldShow) {
-      const EXIT_CLASS = 'is-hiding';
-      const ENTER_CLASS = 'is-entering';
-      const EXIT_ANIMATION = 'cardExit';
-      const ENTER_ANIMATION = 'cardEnter';
-
-      const detachHandler = (key) => {
-        const handler = element[key];
-        if (typeof handler === 'function') {
-          element.removeEventListener('animationend', handler);
-          delete element[key];
-        }
-      };
-
-      if (shouldShow) {
-        if (!element.hasAttribute('hidden') && !element.classList.contains(EXIT_CLASS)) {
-          return;
-        }
-
-        detachHandler('__cardExitHandler');
-
-        element.classList.remove(EXIT_CLASS);
-        element.removeAttribute('hidden');
-
-        // Force reflow before playing the enter animation
-        void element.offsetWidth; // eslint-disable-line no-unused-expressions
 
-        element.classList.add(ENTER_CLASS);
+    // Cards matching the current text query, per level group: level and
+    // sidebar toggles only need these counts for the empty-state message.
+    const queryMatchCounts = new Map();
 
-        const handleEnter = (event) => {
-          if (event.target !== element || event.animationName !== ENTER_ANIMATION) {
-            return;
-          }
-          element.classList.remove(ENTER_CLASS);
-          detachHandler('__cardEnterHandler');
-        };
-
-        element.__cardEnterHandler = handleEnter;
-        element.addEventListener('animationend', handleEnter);
-        return;
-      }
-
-      if (element.hasAttribute('hidden') || element.classList.contains(EXIT_CLASS)) {
-        return;
-      }
-
-      detachHandler('__cardEnterHandler');
-      element.classList.add(EXIT_CLASS);
-
-      const handleExit = (event) => {
-        if (event.target !== element || event.animationName !== EXIT_ANIMATION) {
-          return;
-        }
-        detachHandler('__cardExitHandler');
-        element.classList.remove(EXIT_CLASS);
-        element.setAttribute('hidden', '');
-      };
-
-      element.__cardExitHandler = handleExit;
-      element.addEventListener('animationend', handleExit);
-    }
-
-    function filterChecks() {
+    function filterByQuery() {
       const rawQuery = searchInput ? searchInput.value : '';
       const normalizedQuery = normalize(rawQuery.trim());
       const fuzzyPrefix = normalizedQuery.slice(0, 3);
-      const activeLevels = filterButtons
-        .filter((button) => button.classList.contains('active'))
-        .map((button) => button.dataset.filterLevel);
-
-      let visibleCount = 0;
-
-      entries.forEach(({ element, level, levelGroup, normalizedText, normalizedWords }) => {
-        const matchesLevel = !activeLevels.length || activeLevels.includes(level);
-        const matchesSidebar =
-          activeSidebarLevel === 'all' || (levelGroup && levelGroup === activeSidebarLevel);
 
+      queryMatchCounts.clear();
+      entries.forEach(({ element, levelGroup, normalizedText, normalizedWords }) => {
         let matchesQuery = !normalizedQuery;
         if (!matchesQuery) {
           const hasExact = normalizedText.includes(normalizedQuery);
@@ -639,46 +1035,286 @@ document.addEventListener('DOMContentLoaded', () => {
           matchesQuery = hasExact || hasPrefix;
         }
 
-        const shouldShow = matchesQuery && matchesLevel && matchesSidebar;
-        setCardVisibility(element, shouldShow);
-        if (shouldShow) {
-          visibleCount += 1;
+        setCardVisibility(element, matchesQuery);
+        if (matchesQuery) {
+          queryMatchCounts.set(levelGroup, (queryMatchCounts.get(levelGroup) || 0) + 1);
         }
       });
+    }
 
+    function applyLevelState() {
+      const activeLevels = filterButtons
+        .filter((button) => button.classList.contains('active'))
+        .map((button) => getLevelGroup(button.dataset.filterLevel));
+
+      manifestContainer.dataset.sidebarGroup = activeSidebarLevel;
+      if (activeLevels.length) {
+        manifestContainer.dataset.filterLevels = activeLevels.join(' ');
+      } else {
+        delete manifestContainer.dataset.filterLevels;
+      }
+
+      let visibleCount = 0;
+      queryMatchCounts.forEach((count, levelGroup) => {
+        const matchesLevel = !activeLevels.length || activeLevels.includes(levelGroup);
+        const matchesSidebar = activeSidebarLevel === 'all' || levelGroup === activeSidebarLevel;
+        if (matchesLevel && matchesSidebar) {
+          visibleCount += count;
+        }
+      });
       emptyMessage.style.display = visibleCount ? 'none' : 'block';
     }
 
+    function filterChecks() {
+      filterByQuery();
+      applyLevelState();
+    }
+
+    installLevelFilterRules();
+    startPhase('first-filter');
     filterChecks();
-    filterChecksRef = filterChecks;
+    endPhase('first-filter');
+    applyLevelStateRef = applyLevelState;
 
     if (searchInput) {
-      searchInput.addEventListener('input', filterChecks);
+      // Keystroke-to-update latency, up to the frame showing the result.
+      searchInput.addEventListener('input', () => {
+        startPhase('filter-input');
+        filterChecks();
+        endPhaseAfterPaint('filter-input');
+      });
     }
 
     filterButtons.forEach((button) => {
       button.addEventListener('click', () => {
+        startPhase('filter-toggle');
         button.classList.toggle('active');
-        filterChecks();
+        applyLevelState();
+        endPhaseAfterPaint('filter-toggle');
       });
     });
 
     applySidebarState();
+    routeFromLocation();
+    if (supportsMetrics) {
+      // Navigation start to an interactive list.
+      performance.mark(`${METRICS_PREFIX}ready`);
+      recordMetric('ready', performance.now());
+    }
   }
 
-  function loadManifest() {
-    function onData(data) {
-      handleFiltering(Array.isArray(data) ? data : []);
+  function loadFragment(file) {
+    const url = file.replace(/\.html$/, '.json');
+    if (!fragmentRequests.has(url)) {
+      const embedded = IS_BUNDLE
+        ? readEmbeddedJson(`script[data-fragment="${CSS.escape(getCheckSlug(file))}"]`)
+        : null;
+      const request = embedded ? Promise.resolve(embedded) : fetchJson(url);
+      request.catch(() => fragmentRequests.delete(url));
+      fragmentRequests.set(url, request);
     }
+    return fragmentRequests.get(url);
+  }
 
-    fetch('manifest.json')
-      .then((response) => {
-        if (!response.ok) {
-          throw new Error('Network response was not ok');
+  function warmFragment(file) {
+    if (!IS_BUNDLE) {
+      loadFragment(file).catch(() => {});
+    }
+  }
+
+  function createLocalized(tagName, fr, en, className) {
+    const element = document.createElement(tagName);
+    if (className) {
+      element.className = className;
+    }
+    setLocalizedText(element, fr, en);
+    return element;
+  }
+
+  // Rich admin content keeps its markup through data-*-html, which
+  // applyLanguage() swaps with innerHTML like on the static detail pages.
+  function createLocalizedBlock(fr, en, frHtml, enHtml) {
+    if (!frHtml && !enHtml) {
+      return createLocalized('p', fr, en);
+    }
+    const block = createLocalized('div', fr, en);
+    const fallback = frHtml || enHtml;
+    block.setAttribute('data-fr-html', frHtml || fallback);
+    block.setAttribute('data-en-html', enHtml || fallback);
+    block.innerHTML = block.getAttribute(`data-${getCurrentLanguage()}-html`);
+    return block;
+  }
+
+  function renderDetail(fragment) {
+    detailView.innerHTML = '';
+
+    const title = createLocalized('h1', fragment.title_fr, fragment.title_en, 'page-title');
+    title.setAttribute('tabindex', '-1');
+    detailView.appendChild(title);
+
+    const table = document.createElement('table');
+    table.className = 'info-table';
+    const body = document.createElement('tbody');
+    table.appendChild(body);
+    const levelPill = document.createElement('span');
+    levelPill.className = `level-pill level-${fragment.level}`;
+    levelPill.textContent = fragment.level;
+    [
+      [['Identifiant', 'Identifier'], document.createTextNode(fragment.id)],
+      [['Script associé', 'Associated script'], document.createTextNode(fragment.script)],
+      [['Niveau de criticité', 'Criticality level'], levelPill],
+      [
+        ["Statut en cas d'échec", 'Status if failed'],
+        createLocalized('span', fragment.status_fr, fragment.status_en)
+      ]
+    ].forEach(([[labelFr, labelEn], value]) => {
+      const row = document.createElement('tr');
+      row.appendChild(createLocalized('th', labelFr, labelEn));
+      const cell = document.createElement('td');
+      cell.appendChild(value);
+      row.appendChild(cell);
+      body.appendChild(row);
+    });
+    detailView.appendChild(table);
+
+    [
+      ['Explications', 'Overview', 'overview'],
+      ['Résolution', 'Remediation', 'remediation']
+    ].forEach(([headingFr, headingEn, name]) => {
+      const section = document.createElement('section');
+      section.className = 'content-section';
+      section.appendChild(createLocalized('h2', headingFr, headingEn));
+      section.appendChild(
+        createLocalizedBlock(
+          fragment[`${name}_fr`],
+          fragment[`${name}_en`],
+          fragment[`${name}_fr_html`],
+          fragment[`${name}_en_html`]
+        )
+      );
+      detailView.appendChild(section);
+    });
+
+    const neighbours = [
+      ['previous', 'prev', 'Contrôle précédent', 'Previous check'],
+      ['next', 'next', 'Contrôle suivant', 'Next check']
+    ].filter(([key]) => fragment[key] && checksBySlug.has(fragment[key]));
+    if (neighbours.length) {
+      const pager = document.createElement('nav');
+      pager.className = 'check-pager';
+      neighbours.forEach(([key, rel, labelFr, labelEn]) => {
+        const neighbour = checksBySlug.get(fragment[key]);
+        warmFragment(neighbour.file);
+        const link = document.createElement('a');
+        link.className = `check-pager-link check-pager-link--${rel}`;
+        link.href = DETAIL_HASH_PREFIX + encodeURIComponent(fragment[key]);
+        link.rel = rel;
+        link.appendChild(createLocalized('span', labelFr, labelEn, 'check-pager-label'));
+        link.appendChild(
+          createLocalized('span', neighbour.title_fr, neighbour.title_en, 'check-pager-title')
+        );
+        pager.appendChild(link);
+      });
+      detailView.appendChild(pager);
+    }
+
+    const back = createLocalized('a', 'Retour à la liste', 'Back to list', 'return-button');
+    back.href = '#';
+    detailView.appendChild(back);
+  }
+
+  function openDetail(check) {
+    if (!detailView) {
+      window.location.href = check.file;
+      return;
+    }
+    loadFragment(check.file)
+      .then((fragment) => {
+        if (!detailView.hidden && detailView.dataset.slug === fragment.slug) {
+          return;
+        }
+        if (detailView.hidden) {
+          listScrollPosition = window.scrollY;
+        }
+        renderDetail(fragment);
+        detailView.dataset.slug = fragment.slug;
+        detailView.hidden = false;
+        document.body.setAttribute('data-view', 'detail');
+        window.scrollTo(0, 0);
+        const heading = detailView.querySelector('h1');
+        if (heading) {
+          heading.focus({ preventScroll: true });
         }
-        return response.json();
       })
-      .then(onData)
+      .catch(() => {
+        // No fragment for this check (e.g. page created from the admin):
+        // fall back to the static detail page.
+        window.location.replace(check.file);
+      });
+  }
+
+  function closeDetail() {
+    if (!detailView || detailView.hidden) {
+      return;
+    }
+    detailView.hidden = true;
+    detailView.innerHTML = '';
+    delete detailView.dataset.slug;
+    document.body.removeAttribute('data-view');
+    window.scrollTo(0, listScrollPosition);
+  }
+
+  function routeFromLocation() {
+    const hash = window.location.hash;
+    if (hash.startsWith(DETAIL_HASH_PREFIX)) {
+      const check = checksBySlug.get(decodeURIComponent(hash.slice(DETAIL_HASH_PREFIX.length)));
+      if (check) {
+        openDetail(check);
+        return;
+      }
+    }
+    closeDetail();
+  }
+
+  if (detailView) {
+    window.addEventListener('hashchange', routeFromLocation);
+
+    document.addEventListener('click', (event) => {
+      const link = event.target.closest('[data-detail-slug]');
+      if (
+        !link ||
+        event.defaultPrevented ||
+        event.button !== 0 ||
+        event.metaKey ||
+        event.ctrlKey ||
+        event.shiftKey ||
+        event.altKey
+      ) {
+        return;
+      }
+      event.preventDefault();
+      window.location.hash = DETAIL_HASH_PREFIX + encodeURIComponent(link.dataset.detailSlug);
+    });
+  }
+
+  function loadManifest() {
+    function onData(data, order = null) {
+      endPhase('manifest-load');
+      const checks = Array.isArray(data) ? data : [];
+      metricsCatalogueSize = checks.length;
+      handleFiltering(checks, order);
+    }
+
+    startPhase('manifest-load');
+    const embedded = document.getElementById('manifest-data');
+    if (embedded) {
+      onData(parseManifestText(embedded.textContent), readEmbeddedJson('#manifest-order'));
+      return;
+    }
+
+    loadVersionedManifest()
+      .catch(() => fetchManifest().then((entries) => ({ entries, order: null })))
+      .then(({ entries, order }) => onData(entries, order))
       .catch(() => {
         const request = new XMLHttpRequest();
         request.overrideMimeType('application/json');
@@ -686,14 +1322,16 @@ document.addEventListener('DOMContentLoaded', () => {
         request.onreadystatechange = function () {
           if (request.readyState === 4) {
             if (request.status === 200 || request.status === 0) {
-              onData(JSON.parse(request.responseText));
+              onData(parseManifestText(request.responseText));
             } else {
               manifestContainer.innerHTML = '';
               const error = document.createElement('p');
-              error.setAttribute('data-fr', 'Impossible de charger la liste des contrôles.');
-              error.setAttribute('data-en', 'Unable to load the list of checks.');
+              setLocalizedText(
+                error,
+                'Impossible de charger la liste des contrôles.',
+                'Unable to load the list of checks.'
+              );
               manifestContainer.appendChild(error);
-              applyLanguage(getPreferredLanguage());
             }
           }
         };
@@ -0,0 +1 @@
+"""Build stages and command line tools for the Consistency Checker documentation."""
@@ -0,0 +1,21 @@
+"""``docs-cc`` command line: ``python -m docs_cc <command> ...``."""
+from __future__ import annotations
+
+import argparse
+
+from docs_cc import deploy, ingest, metrics, query, serve, sync, versions, worker
+
+COMMANDS = (deploy, ingest, metrics, query, serve, sync, versions, worker)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="docs-cc", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in COMMANDS:
+        command.register(subparsers)
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+"""Single-file offline bundle of the documentation.
+
+Field engineers open the docs from ``file://`` on air-gapped servers, where
+``fetch()`` fails and every detail page is another file. The bundle is
+``index.html`` with the stylesheet and script inlined, the manifest embedded as
+``<script type="application/json" id="manifest-data">`` (with its title order
+in ``#manifest-order``) and each detail
+fragment as ``<script type="application/json" data-fragment="<slug>">``. The
+fragments stay unparsed text until ``script.js`` opens the check, so the page
+opens from a single file read without paying for every detail up front.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import json
+import re
+
+from docs_cc.critical_css import strip_inlined_css
+from docs_cc.minify import minify_css, minify_js
+
+BUNDLE_PATH = Path("precheck-docs.html")
+MANIFEST_DATA_ID = "manifest-data"
+MANIFEST_ORDER_ID = "manifest-order"
+
+_STYLESHEET_RE = re.compile(r'[ \t]*<link rel="stylesheet" href="[^"]*style(?:\.min)?\.css" />')
+_SCRIPT_RE = re.compile(r'([ \t]*)<script src="[^"]*script(?:\.min)?\.js"></script>')
+_HTML_RE = re.compile(r"<html([^>]*)>")
+
+
+def _embed_json(value) -> str:
+    text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return text.replace("</", "<\\/")
+
+
+@dataclass
+class BundleReport:
+    path: Path
+    checks: int
+    size: int
+
+    def format(self) -> str:
+        return f"{self.path}: {self.checks} checks in one file, {self.size} bytes"
+
+
+def build_bundle(
+    index_html: str,
+    css: str,
+    script: str,
+    manifest: list[dict],
+    fragments: dict[str, dict],
+    order: dict | None = None,
+) -> str:
+    """Inline assets and data into ``index_html``.
+
+    A ``--critical-css`` index is first brought back to its plain stylesheet
+    link, so the full stylesheet is inlined once and nothing points to
+    ``assets/css`` any more.
+    """
+    markup = _HTML_RE.sub(
+        lambda match: f"<html{match.group(1)} data-bundle>", strip_inlined_css(index_html), count=1
+    )
+    markup = _STYLESHEET_RE.sub(lambda match: f"    <style>\n{css}\n    </style>", markup, count=1)
+
+    inline_script = script.replace("</script", "<\\/script")
+
+    def scripts(match: re.Match[str]) -> str:
+        indent = match.group(1)
+        blocks = [
+            f'{indent}<script type="application/json" id="{MANIFEST_DATA_ID}">'
+            f"{_embed_json(manifest)}</script>"
+        ]
+        if order is not None:
+            blocks.append(
+                f'{indent}<script type="application/json" id="{MANIFEST_ORDER_ID}">'
+                f"{_embed_json(order)}</script>"
+            )
+        blocks.extend(
+            f'{indent}<script type="application/json" data-fragment="{slug}">'
+            f"{_embed_json(fragment)}</script>"
+            for slug, fragment in fragments.items()
+        )
+        blocks.append(f"{indent}<script>\n{inline_script}\n{indent}</script>")
+        return "\n".join(blocks)
+
+    return _SCRIPT_RE.sub(scripts, markup, count=1)
+
+
+def write_bundle(
+    output: Path,
+    index_path: Path,
+    stylesheet: Path,
+    script: Path,
+    manifest: list[dict],
+    fragments: dict[str, dict],
+    minify: bool = False,
+    order: dict | None = None,
+) -> BundleReport:
+    css = stylesheet.read_text(encoding="utf-8")
+    js = script.read_text(encoding="utf-8")
+    if minify:
+        css, js = minify_css(css), minify_js(js)
+    markup = build_bundle(
+        index_path.read_text(encoding="utf-8"), css, js, manifest, fragments, order
+    )
+    output.write_text(markup, encoding="utf-8")
+    return BundleReport(output, len(fragments), len(markup.encode("utf-8")))
@@ -0,0 +1,334 @@
+"""Critical CSS extraction for the generated pages.
+
+The rules of ``assets/css/style.css`` whose selectors can match the markup of a
+page type (``index``, ``detail``) are inlined in ``<head>``; the full stylesheet
+is then loaded asynchronously instead of blocking the first render.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+import gzip
+import re
+
+CRITICAL_MARKER = "data-critical-css"
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_PSEUDO_RE = re.compile(r"::?[\w-]+(\((?:[^()]|\([^()]*\))*\))?")
+_ATTRIBUTE_RE = re.compile(r"\[\s*([\w-]+)[^\]]*\]")
+_TAG_RE = re.compile(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)")
+_KEYFRAMES_RE = re.compile(r"@(?:-webkit-)?keyframes\s+([\w-]+)")
+_SCRIPT_LITERAL_RE = re.compile(r"'([^'\\\n]*)'|`([^`]*)`")
+_DATASET_RE = re.compile(r"dataset\.(\w+)")
+_STYLESHEET_LINK_RE = re.compile(
+    r'(?P<indent>[ \t]*)<link rel="stylesheet" href="(?P<href>[^"]*style(?:\.min)?\.css)" />'
+)
+_INLINED_RE = re.compile(
+    r'<style ' + CRITICAL_MARKER + r'>.*?</style>\s*'
+    r'<link rel="preload" href="(?P<href>[^"]+)" as="style" ' + CRITICAL_MARKER + r'[^>]*>\s*'
+    r'<noscript><link rel="stylesheet" href="[^"]+" /></noscript>',
+    re.S,
+)
+GROUP_AT_RULES = ("@media", "@supports", "@layer", "@container")
+# Link used for the first-render latency estimate (a slow mobile connection).
+ESTIMATE_RTT_MS = 150
+ESTIMATE_KBITS_PER_S = 1600
+
+
+def transfer_ms(size: int) -> float:
+    return size * 8 / ESTIMATE_KBITS_PER_S
+
+
+@dataclass
+class Rule:
+    prelude: str
+    body: str = ""
+    children: list["Rule"] | None = None
+
+    @property
+    def is_group(self) -> bool:
+        return self.children is not None
+
+
+@dataclass
+class PageTokens:
+    tags: set[str] = field(default_factory=set)
+    classes: set[str] = field(default_factory=set)
+    ids: set[str] = field(default_factory=set)
+    attributes: set[str] = field(default_factory=set)
+
+    def update(self, other: "PageTokens") -> None:
+        self.tags |= other.tags
+        self.classes |= other.classes
+        self.ids |= other.ids
+        self.attributes |= other.attributes
+
+
+@dataclass
+class CriticalReport:
+    page_type: str
+    pages: int
+    stylesheet_bytes: int
+    stylesheet_gzip_bytes: int
+    critical_bytes: int
+    critical_gzip_bytes: int
+    rules_total: int
+    rules_kept: int
+
+    @property
+    def blocking_ms(self) -> float:
+        """Estimated first-render delay of the blocking stylesheet: one round trip and its transfer."""
+        return ESTIMATE_RTT_MS + transfer_ms(self.stylesheet_gzip_bytes)
+
+    @property
+    def inline_ms(self) -> float:
+        """Estimated delay added to the document by the inlined rules."""
+        return transfer_ms(self.critical_gzip_bytes)
+
+    def format(self) -> str:
+        return (
+            f"critical-css {self.page_type}: {self.pages} page(s), "
+            f"render-blocking CSS {self.stylesheet_bytes:,} B ({self.stylesheet_gzip_bytes:,} B gzip) "
+            f"in 1 request -> 0 requests, inline {self.critical_bytes:,} B "
+            f"({self.critical_gzip_bytes:,} B gzip), {self.rules_kept}/{self.rules_total} rules; "
+            f"first render ~{self.blocking_ms:.0f} ms -> ~{self.inline_ms:.0f} ms of CSS "
+            f"({ESTIMATE_RTT_MS} ms RTT, {ESTIMATE_KBITS_PER_S} kbit/s)"
+        )
+
+
+class _TokenCollector(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.tokens = PageTokens()
+        self.page_type = ""
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.tokens.tags.add(tag)
+        for name, value in attrs:
+            self.tokens.attributes.add(name)
+            if name == "class" and value:
+                self.tokens.classes.update(value.split())
+            elif name == "id" and value:
+                self.tokens.ids.add(value)
+            elif tag == "body" and name == "data-page" and value:
+                self.page_type = value
+
+    handle_startendtag = handle_starttag
+
+
+def collect_markup_tokens(markup: str) -> tuple[str, PageTokens]:
+    """Return the ``data-page`` type of a document and the tokens it uses."""
+    collector = _TokenCollector()
+    collector.feed(markup)
+    collector.close()
+    return collector.page_type, collector.tokens
+
+
+def collect_script_tokens(script: str) -> PageTokens:
+    """Over-approximate the classes, tags and attributes a script may create."""
+    tokens = PageTokens()
+    for match in _SCRIPT_LITERAL_RE.finditer(script):
+        for word in (match.group(1) or match.group(2) or "").split():
+            if re.fullmatch(r"[\w-]+", word):
+                tokens.tags.add(word.lower())
+                tokens.classes.add(word)
+                tokens.ids.add(word)
+                tokens.attributes.add(word)
+    for name in _DATASET_RE.findall(script):
+        tokens.attributes.add("data-" + re.sub(r"([A-Z])", r"-\1", name).lower())
+    return tokens
+
+
+def parse_stylesheet(css: str) -> list[Rule]:
+    rules, _ = _parse_block(_COMMENT_RE.sub("", css), 0)
+    return rules
+
+
+def _parse_block(css: str, position: int) -> tuple[list[Rule], int]:
+    rules: list[Rule] = []
+    length = len(css)
+    while position < length:
+        while position < length and css[position].isspace():
+            position += 1
+        if position >= length:
+            break
+        if css[position] == "}":
+            return rules, position + 1
+
+        brace = css.find("{", position)
+        semicolon = css.find(";", position)
+        if semicolon != -1 and (brace == -1 or semicolon < brace):
+            rules.append(Rule(prelude=css[position:semicolon + 1].strip()))
+            position = semicolon + 1
+            continue
+        if brace == -1:
+            break
+
+        prelude = " ".join(css[position:brace].split())
+        if prelude.startswith(GROUP_AT_RULES):
+            children, position = _parse_block(css, brace + 1)
+            rules.append(Rule(prelude=prelude, children=children))
+            continue
+
+        depth = 1
+        end = brace + 1
+        while end < length and depth:
+            if css[end] == "{":
+                depth += 1
+            elif css[end] == "}":
+                depth -= 1
+            end += 1
+        rules.append(Rule(prelude=prelude, body=css[brace + 1:end - 1]))
+        position = end
+    return rules, position
+
+
+def split_selectors(prelude: str) -> list[str]:
+    selectors = []
+    depth = 0
+    current = []
+    for char in prelude:
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        if char == "," and depth == 0:
+            selectors.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    selectors.append("".join(current).strip())
+    return [selector for selector in selectors if selector]
+
+
+def selector_matches(selector: str, tokens: PageTokens) -> bool:
+    """Conservatively decide whether ``selector`` can match the page.
+
+    Pseudo-classes are ignored, so a selector is kept as soon as every tag,
+    class, id and attribute name it mentions appears in the page.
+    """
+    simplified = _PSEUDO_RE.sub("", selector)
+    attributes = _ATTRIBUTE_RE.findall(simplified)
+    simplified = _ATTRIBUTE_RE.sub("", simplified)
+    classes = re.findall(r"\.([\w-]+)", simplified)
+    ids = re.findall(r"#([\w-]+)", simplified)
+    tags = [tag.lower() for tag in _TAG_RE.findall(simplified)]
+    return (
+        all(name in tokens.classes for name in classes)
+        and all(name in tokens.ids for name in ids)
+        and all(name in tokens.attributes for name in attributes)
+        and all(name in tokens.tags for name in tags)
+    )
+
+
+def _compact(body: str) -> str:
+    declarations = [part.strip() for part in body.split(";")]
+    return ";".join(" ".join(part.split()) for part in declarations if part)
+
+
+def _select(rules: list[Rule], tokens: PageTokens) -> tuple[list[str], int, int]:
+    output: list[str] = []
+    total = kept = 0
+    keyframes: list[Rule] = []
+    for rule in rules:
+        if rule.is_group:
+            inner, inner_total, inner_kept = _select(rule.children or [], tokens)
+            total += inner_total
+            kept += inner_kept
+            if inner:
+                output.append(f"{rule.prelude}{{{''.join(inner)}}}")
+            continue
+        if rule.prelude.startswith("@"):
+            if _KEYFRAMES_RE.match(rule.prelude):
+                keyframes.append(rule)
+            elif rule.prelude.startswith("@font-face"):
+                output.append(f"{rule.prelude}{{{_compact(rule.body)}}}")
+            continue
+
+        total += 1
+        selectors = [s for s in split_selectors(rule.prelude) if selector_matches(s, tokens)]
+        if selectors:
+            kept += 1
+            output.append(f"{','.join(selectors)}{{{_compact(rule.body)}}}")
+
+    used = "".join(output)
+    for rule in keyframes:
+        name = _KEYFRAMES_RE.match(rule.prelude).group(1)
+        if re.search(rf"\b{re.escape(name)}\b", used):
+            output.append(f"{rule.prelude}{{{' '.join(rule.body.split())}}}")
+    return output, total, kept
+
+
+def extract_critical_css(css: str, tokens: PageTokens) -> tuple[str, int, int]:
+    """Return the rules of ``css`` usable by ``tokens`` and the rule counts."""
+    output, total, kept = _select(parse_stylesheet(css), tokens)
+    return "".join(output), total, kept
+
+
+def strip_inlined_css(markup: str) -> str:
+    """Undo a previous inlining so the stage can run again on the same page."""
+    return _INLINED_RE.sub(
+        lambda match: f'<link rel="stylesheet" href="{match.group("href")}" />', markup
+    )
+
+
+def inline_critical_css(markup: str, critical: str) -> str:
+    def replace(match: re.Match[str]) -> str:
+        indent = match.group("indent")
+        href = match.group("href")
+        return (
+            f"{indent}<style {CRITICAL_MARKER}>{critical}</style>\n"
+            f"{indent}<link rel=\"preload\" href=\"{href}\" as=\"style\" {CRITICAL_MARKER}"
+            f" onload=\"this.onload=null;this.rel='stylesheet'\" />\n"
+            f"{indent}<noscript><link rel=\"stylesheet\" href=\"{href}\" /></noscript>"
+        )
+
+    return _STYLESHEET_LINK_RE.sub(replace, strip_inlined_css(markup), count=1)
+
+
+def _gzip_size(text: str) -> int:
+    return len(gzip.compress(text.encode("utf-8"), mtime=0))
+
+
+def apply_critical_css(
+    pages: list[Path], stylesheet: Path, script: Path | None = None
+) -> list[CriticalReport]:
+    """Inline per-page-type critical CSS into ``pages`` and report the savings.
+
+    Script tokens are added for the index page, whose cards and sidebar are
+    created by ``script.js`` after the manifest has loaded.
+    """
+    css = stylesheet.read_text(encoding="utf-8")
+    script_tokens = collect_script_tokens(script.read_text(encoding="utf-8")) if script else None
+
+    documents: dict[str, list[tuple[Path, str]]] = {}
+    tokens_by_type: dict[str, PageTokens] = {}
+    for page in pages:
+        markup = strip_inlined_css(page.read_text(encoding="utf-8"))
+        page_type, tokens = collect_markup_tokens(markup)
+        page_type = page_type or "other"
+        documents.setdefault(page_type, []).append((page, markup))
+        tokens_by_type.setdefault(page_type, PageTokens()).update(tokens)
+
+    reports = []
+    for page_type, entries in documents.items():
+        tokens = tokens_by_type[page_type]
+        if page_type == "index" and script_tokens is not None:
+            tokens.update(script_tokens)
+        critical, total, kept = extract_critical_css(css, tokens)
+        for page, markup in entries:
+            page.write_text(inline_critical_css(markup, critical), encoding="utf-8")
+        reports.append(
+            CriticalReport(
+                page_type=page_type,
+                pages=len(entries),
+                stylesheet_bytes=len(css.encode("utf-8")),
+                stylesheet_gzip_bytes=_gzip_size(css),
+                critical_bytes=len(critical.encode("utf-8")),
+                critical_gzip_bytes=_gzip_size(critical),
+                rules_total=total,
+                rules_kept=kept,
+            )
+        )
+    return reports
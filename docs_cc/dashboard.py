@@ -0,0 +1,171 @@
+"""Static fleet dashboard built from the aggregate written by ``docs-cc ingest``.
+
+Everything is computed at build time: ``dashboard.json`` holds the compact
+per-level rankings and ``dashboard.html`` is rendered from it, so the page
+does no work in the browser regardless of how many sites reported.
+"""
+from __future__ import annotations
+
+from html import escape
+from pathlib import Path
+import json
+
+from docs_cc.ingest import LEVELS
+
+DEFAULT_TOP = 10
+
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html lang="fr">
+  <head>
+    <meta charset="utf-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+    <title>Tableau de bord de la flotte · Consistency Checker</title>
+    <link rel="stylesheet" href="assets/css/style.css" />
+  </head>
+  <body data-page="dashboard">
+    <header class="primary-header" role="banner">
+      <div class="header-content">
+        <a class="brand" href="index.html">
+          <span class="brand-title">Centre MAESTRIA</span>
+          <span class="brand-subtitle">Consistency Checker</span>
+        </a>
+        <button
+          class="language-switch"
+          type="button"
+          role="switch"
+          data-language-toggle
+          data-aria-label-to-en="Passer l'interface en anglais"
+          data-aria-label-to-fr="Switch interface to French"
+          aria-checked="false"
+          data-active-lang="fr"
+          aria-label="Passer l'interface en anglais"
+          title="Passer l'interface en anglais"
+        >
+          <span class="language-switch-track">
+            <span class="language-switch-option language-switch-option--fr">FR</span>
+            <span class="language-switch-option language-switch-option--en">EN</span>
+            <span class="language-switch-thumb" aria-hidden="true"></span>
+          </span>
+        </button>
+      </div>
+    </header>
+    <main>
+      <h1 class="page-title" data-fr="Tableau de bord de la flotte" data-en="Fleet dashboard">Tableau de bord de la flotte</h1>
+      <section class="content-section">
+        <p data-fr="{summary_fr}" data-en="{summary_en}">{summary_fr}</p>
+      </section>{levels}
+      <a class="return-button" href="index.html" data-fr="Retour à la liste" data-en="Back to list">Retour à la liste</a>
+    </main>
+    <script src="assets/js/script.js"></script>
+  </body>
+</html>
+"""
+
+LEVEL_TEMPLATE = """
+      <div class="table-wrapper">
+        <table class="data-table">
+          <caption><span class="level-pill level-{level}">{level}</span> <span data-fr="{caption_fr}" data-en="{caption_en}">{caption_fr}</span></caption>
+          <thead>
+            <tr>
+              <th data-fr="Contrôle" data-en="Check">Contrôle</th>
+              <th data-fr="Sites en échec" data-en="Failing sites">Sites en échec</th>
+              <th data-fr="Part de la flotte" data-en="Share of fleet">Part de la flotte</th>
+              <th data-fr="Échecs" data-en="Failures">Échecs</th>
+            </tr>
+          </thead>
+          <tbody>{rows}
+          </tbody>
+        </table>
+      </div>"""
+
+ROW_TEMPLATE = """
+            <tr>
+              <td><a href="{file}" data-fr="{title_fr}" data-en="{title_en}">{title_fr}</a> <small>{id}</small></td>
+              <td>{sites_failing}</td>
+              <td>{share:.1f} %</td>
+              <td>{failures}</td>
+            </tr>"""
+
+EMPTY_ROW = """
+            <tr>
+              <td colspan="4" data-fr="Aucun échec remonté." data-en="No failures reported.">Aucun échec remonté.</td>
+            </tr>"""
+
+
+def build_dashboard_data(aggregate: dict, top: int = DEFAULT_TOP) -> dict:
+    """Reduce an ingest aggregate to the top failing checks per level."""
+    sites = int(aggregate.get("sites") or 0)
+    levels = {}
+    for level in LEVELS:
+        failing = [
+            check
+            for check in aggregate.get("checks", [])
+            if check.get("level") == level and check.get("failures")
+        ]
+        failing.sort(key=lambda check: (-check["sites_failing"], -check["failures"], check["id"]))
+        levels[level] = {
+            "failures": aggregate.get("levels", {}).get(level, {}).get("failures", 0),
+            "checks_failing": len(failing),
+            "top": [
+                {
+                    "id": check["id"],
+                    "title_fr": check.get("title_fr", ""),
+                    "title_en": check.get("title_en", ""),
+                    "file": check.get("file", ""),
+                    "sites_failing": check["sites_failing"],
+                    "failures": check["failures"],
+                    "share": round(check["sites_failing"] / sites * 100, 1) if sites else 0.0,
+                }
+                for check in failing[:top]
+            ],
+        }
+    return {"sites": sites, "rows": aggregate.get("rows", 0), "levels": levels}
+
+
+def render_dashboard(data: dict, level_labels: dict[str, dict[str, str]]) -> str:
+    sections = []
+    for level in LEVELS:
+        level_data = data["levels"][level]
+        rows = "".join(
+            ROW_TEMPLATE.format(
+                file=escape(check["file"]),
+                title_fr=escape(check["title_fr"]),
+                title_en=escape(check["title_en"]),
+                id=escape(check["id"]),
+                sites_failing=check["sites_failing"],
+                share=check["share"],
+                failures=check["failures"],
+            )
+            for check in level_data["top"]
+        )
+        labels = level_labels.get(level, {"fr": level, "en": level})
+        sections.append(
+            LEVEL_TEMPLATE.format(
+                level=level,
+                caption_fr=escape(labels["fr"]),
+                caption_en=escape(labels["en"]),
+                rows=rows or EMPTY_ROW,
+            )
+        )
+    return DASHBOARD_TEMPLATE.format(
+        summary_fr=f"{data['sites']} sites, {data['rows']} résultats analysés.",
+        summary_en=f"{data['sites']} sites, {data['rows']} results analysed.",
+        levels="".join(sections),
+    )
+
+
+def write_dashboard(
+    results: Path,
+    output_dir: Path,
+    level_labels: dict[str, dict[str, str]],
+    top: int = DEFAULT_TOP,
+) -> tuple[Path, Path]:
+    aggregate = json.loads(results.read_text(encoding="utf-8"))
+    data = build_dashboard_data(aggregate, top)
+    data_path = output_dir / "dashboard.json"
+    data_path.write_text(
+        json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n", encoding="utf-8"
+    )
+    page_path = output_dir / "dashboard.html"
+    page_path.write_text(render_dashboard(data, level_labels), encoding="utf-8")
+    return page_path, data_path
@@ -0,0 +1,203 @@
+"""Deploy the built documentation to a web root, copying only what changed.
+
+The build inventory (SHA-256 of every deployed file) is compared with the
+inventory of the target. Target hashes are cached in
+``TARGET/.deploy-inventory.json`` and reused while a file's size and
+modification time are unchanged. New and changed files are copied in
+parallel, each through a temporary file and a rename; ``manifest.json`` and
+``manifest.version.json`` are published after the pages they list, and
+orphans (files of a renamed or removed check, stale deltas...) are deleted
+only once the new manifest is live.
+
+Only the paths in :data:`DEPLOY_PATHS` are managed: other files of the target
+(``admin/``, ``.cache/``...) are never copied over nor deleted.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+
+DEPLOY_PATHS = (
+    "index.html",
+    "dashboard.html",
+    "dashboard.json",
+    "catalogue.sqlite3",
+    "assets",
+    "checks",
+    "manifest-versions",
+    "manifest.json",
+    "manifest.version.json",
+)
+# Published last, in this order, once everything they reference is in place.
+MANIFEST_FILES = ("manifest.json", "manifest.version.json")
+INVENTORY_NAME = ".deploy-inventory.json"
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _managed_files(root: Path) -> list[str]:
+    files = []
+    for name in DEPLOY_PATHS:
+        path = root / name
+        if path.is_file():
+            files.append(name)
+        elif path.is_dir():
+            files.extend(
+                candidate.relative_to(root).as_posix()
+                for candidate in path.rglob("*")
+                if candidate.is_file() and not candidate.name.startswith(".")
+            )
+    return sorted(files)
+
+
+def inventory(root: Path, jobs: int, cache: dict | None = None) -> tuple[dict[str, str], dict]:
+    """Hash the managed files of ``root``, reusing ``cache`` entries whose stat matches."""
+    cache = cache or {}
+    stats = {relative: (root / relative).stat() for relative in _managed_files(root)}
+    hashes: dict[str, str] = {}
+    todo = []
+    for relative, stat in stats.items():
+        known = cache.get(relative)
+        if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+            hashes[relative] = known["sha256"]
+        else:
+            todo.append(relative)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        hashes.update(zip(todo, pool.map(lambda relative: _hash_file(root / relative), todo)))
+    entries = {
+        relative: {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": hashes[relative]}
+        for relative, stat in stats.items()
+    }
+    return hashes, entries
+
+
+@dataclass
+class DeployPlan:
+    new: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    orphans: list[str] = field(default_factory=list)
+
+    @property
+    def copies(self) -> list[str]:
+        return sorted(self.new + self.changed)
+
+
+def plan_deploy(source: dict[str, str], target: dict[str, str]) -> DeployPlan:
+    plan = DeployPlan()
+    for relative, digest in source.items():
+        if relative not in target:
+            plan.new.append(relative)
+        elif target[relative] != digest:
+            plan.changed.append(relative)
+        else:
+            plan.unchanged.append(relative)
+    plan.orphans = sorted(set(target) - set(source))
+    return plan
+
+
+def _copy(source: Path, target: Path) -> int:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temporary = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+    shutil.copy2(source, temporary)
+    os.replace(temporary, target)
+    return source.stat().st_size
+
+
+@dataclass
+class DeployReport:
+    plan: DeployPlan
+    copied_bytes: int = 0
+    seconds: float = 0.0
+    dry_run: bool = False
+
+    def format(self) -> str:
+        plan = self.plan
+        lines = [f"{'would copy' if self.dry_run else 'copy'}   {path}" for path in plan.copies]
+        lines.extend(f"{'would delete' if self.dry_run else 'delete'} {path}" for path in plan.orphans)
+        lines.append(
+            f"deploy: {len(plan.new)} new, {len(plan.changed)} changed, {len(plan.unchanged)} unchanged, "
+            f"{len(plan.orphans)} orphan(s) {'to delete' if self.dry_run else 'deleted'}; "
+            f"{self.copied_bytes / 1024:.1f} KiB {'to copy' if self.dry_run else 'copied'} "
+            f"in {self.seconds:.2f}s"
+        )
+        return "\n".join(lines)
+
+
+def deploy(root: Path, target: Path, jobs: int, dry_run: bool = False) -> DeployReport:
+    started = time.perf_counter()
+    target.mkdir(parents=True, exist_ok=True)
+    inventory_path = target / INVENTORY_NAME
+    try:
+        cache = json.loads(inventory_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+
+    source_hashes, _ = inventory(root, jobs)
+    target_hashes, target_entries = inventory(target, jobs, cache)
+    plan = plan_deploy(source_hashes, target_hashes)
+    report = DeployReport(plan, dry_run=dry_run)
+    if dry_run:
+        report.copied_bytes = sum((root / relative).stat().st_size for relative in plan.copies)
+        report.seconds = time.perf_counter() - started
+        return report
+
+    pages = [relative for relative in plan.copies if relative not in MANIFEST_FILES]
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        report.copied_bytes = sum(
+            pool.map(lambda relative: _copy(root / relative, target / relative), pages)
+        )
+    for relative in MANIFEST_FILES:
+        if relative in plan.copies:
+            report.copied_bytes += _copy(root / relative, target / relative)
+
+    for relative in plan.orphans:
+        (target / relative).unlink(missing_ok=True)
+        target_entries.pop(relative, None)
+        parent = (target / relative).parent
+        while parent != target and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+    for relative in plan.copies:
+        stat = (target / relative).stat()
+        target_entries[relative] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": source_hashes[relative],
+        }
+    temporary = inventory_path.with_name(f"{INVENTORY_NAME}.{uuid.uuid4().hex}.tmp")
+    temporary.write_text(json.dumps(target_entries, sort_keys=True), encoding="utf-8")
+    os.replace(temporary, inventory_path)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser("deploy", help="copy the changed build outputs to a web root")
+    parser.add_argument("target", type=Path, help="web root to update (a local directory)")
+    parser.add_argument("--root", type=Path, default=Path("."), help="build directory (default: .)")
+    parser.add_argument("--jobs", type=int, default=8, help="parallel hashing and copy threads")
+    parser.add_argument("--dry-run", action="store_true", help="print the plan without touching the target")
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.target.resolve() == args.root.resolve():
+        raise SystemExit("deploy: the target must differ from the build directory")
+    print(deploy(args.root, args.target, args.jobs, args.dry_run).format())
+    return 0
@@ -0,0 +1,294 @@
+"""Streaming ingestion of Pre-Check results collected across the fleet.
+
+Result files are CSV or NDJSON (optionally gzip-compressed), one row per check
+run. Each row names its check either by identifier (``check_id``/``id``/
+``check``) or by script file (``script``), the site it ran on
+(``site``/``server``/``hostname``) and its outcome (``status``/``result``).
+Rows are joined against ``manifest.json`` through an in-memory index and
+aggregated in a single pass: memory grows with the catalogue and the number of
+sites, never with the number of rows.
+"""
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+import argparse
+import csv
+import gzip
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+
+CHECK_ID_FIELDS = ("check_id", "id", "check")
+SCRIPT_FIELDS = ("script", "script_name")
+SITE_FIELDS = ("site", "server", "hostname")
+STATUS_FIELDS = ("status", "result")
+
+PASS_STATUSES = frozenset({"pass", "passed", "ok", "success", "succeeded", "true"})
+SKIPPED_STATUSES = frozenset({"skip", "skipped", "n/a", "na", "not_applicable", ""})
+LEVELS = ("FATAL_ERROR", "ERROR", "WARNING", "INFORMATION")
+UNKNOWN_SITE = "(unknown)"
+
+
+class ManifestIndex:
+    """Lookup of manifest entries by identifier or script file name."""
+
+    def __init__(self, entries: Iterable[dict]) -> None:
+        self.entries: dict[str, dict] = {}
+        self._by_id: dict[str, str] = {}
+        self._by_script: dict[str, str | None] = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or not entry.get("id"):
+                continue
+            check_id = str(entry["id"])
+            self.entries[check_id] = entry
+            self._by_id[check_id.casefold()] = check_id
+            script = str(entry.get("script") or "")
+            if script and script != "N/A":
+                key = script.casefold()
+                # A script shared by several checks cannot identify a row.
+                self._by_script[key] = None if key in self._by_script else check_id
+
+    @classmethod
+    def from_file(cls, path: Path) -> "ManifestIndex":
+        return cls(json.loads(path.read_text(encoding="utf-8")))
+
+    def resolve(self, check: str | None, script: str | None) -> str | None:
+        if check:
+            found = self._by_id.get(check.strip().casefold())
+            if found:
+                return found
+        if script:
+            name = script.strip().replace("\\", "/").rsplit("/", 1)[-1]
+            return self._by_script.get(name.casefold())
+        return None
+
+
+@dataclass
+class FleetAggregate:
+    rows: int = 0
+    skipped: int = 0
+    # Rows whose check is not in the manifest are only counted, so arbitrary
+    # input cannot grow the aggregate.
+    unmatched: int = 0
+    runs_by_check: Counter = field(default_factory=Counter)
+    failures_by_check: Counter = field(default_factory=Counter)
+    failing_sites_by_check: defaultdict = field(default_factory=lambda: defaultdict(set))
+    runs_by_site: Counter = field(default_factory=Counter)
+    failures_by_site: Counter = field(default_factory=Counter)
+    failures_by_level: Counter = field(default_factory=Counter)
+
+    def add(self, index: ManifestIndex, row: dict) -> None:
+        self.rows += 1
+        status = str(_first(row, STATUS_FIELDS) or "").strip().casefold()
+        if status in SKIPPED_STATUSES:
+            self.skipped += 1
+            return
+
+        check = _first(row, CHECK_ID_FIELDS)
+        script = _first(row, SCRIPT_FIELDS)
+        check_id = index.resolve(check, script)
+        if check_id is None:
+            self.unmatched += 1
+            return
+
+        site = str(_first(row, SITE_FIELDS) or UNKNOWN_SITE).strip() or UNKNOWN_SITE
+        self.runs_by_check[check_id] += 1
+        self.runs_by_site[site] += 1
+        if status in PASS_STATUSES:
+            return
+
+        self.failures_by_check[check_id] += 1
+        self.failing_sites_by_check[check_id].add(site)
+        self.failures_by_site[site] += 1
+        self.failures_by_level[index.entries[check_id].get("level", "")] += 1
+
+    def to_dict(self, index: ManifestIndex) -> dict:
+        checks = []
+        for check_id, runs in self.runs_by_check.items():
+            entry = index.entries[check_id]
+            checks.append(
+                {
+                    "id": check_id,
+                    "level": entry.get("level", ""),
+                    "title_fr": entry.get("title_fr", ""),
+                    "title_en": entry.get("title_en", ""),
+                    "file": entry.get("file", ""),
+                    "runs": runs,
+                    "failures": self.failures_by_check[check_id],
+                    "sites_failing": len(self.failing_sites_by_check.get(check_id, ())),
+                }
+            )
+        checks.sort(key=lambda item: (-item["sites_failing"], -item["failures"], item["id"]))
+
+        levels = {}
+        for level in LEVELS:
+            level_checks = [item for item in checks if item["level"] == level and item["failures"]]
+            levels[level] = {
+                "failures": self.failures_by_level[level],
+                "checks_failing": len(level_checks),
+            }
+
+        return {
+            "rows": self.rows,
+            "skipped": self.skipped,
+            "unmatched": self.unmatched,
+            "sites": len(self.runs_by_site),
+            "levels": levels,
+            "checks": checks,
+            "sites_detail": [
+                {"site": site, "runs": runs, "failures": self.failures_by_site[site]}
+                for site, runs in sorted(self.runs_by_site.items())
+            ],
+        }
+
+
+def _first(row: dict, names: tuple[str, ...]) -> str | None:
+    for name in names:
+        value = row.get(name)
+        if value not in (None, ""):
+            return str(value)
+    return None
+
+
+def _open_text(path: Path) -> io.TextIOBase:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return path.open("r", encoding="utf-8", newline="")
+
+
+def detect_format(path: Path) -> str:
+    suffixes = [suffix.lower() for suffix in path.suffixes if suffix.lower() != ".gz"]
+    return "ndjson" if suffixes and suffixes[-1] in (".ndjson", ".jsonl", ".json") else "csv"
+
+
+def iter_rows(path: Path, file_format: str | None = None) -> Iterator[dict]:
+    """Yield result rows one at a time from a CSV or NDJSON file."""
+    file_format = file_format or detect_format(path)
+    with _open_text(path) as handle:
+        if file_format == "csv":
+            reader = csv.DictReader(handle)
+            if reader.fieldnames:
+                reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+            yield from reader
+            return
+        for line_number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({error.msg})") from error
+            if isinstance(row, dict):
+                yield {str(key).lower(): value for key, value in row.items()}
+
+
+def ingest(
+    paths: Iterable[Path], index: ManifestIndex, file_format: str | None = None
+) -> FleetAggregate:
+    aggregate = FleetAggregate()
+    for path in paths:
+        for row in iter_rows(path, file_format):
+            aggregate.add(index, row)
+    return aggregate
+
+
+def write_synthetic_results(
+    path: Path, index: ManifestIndex, rows: int, sites: int, seed: int = 0
+) -> None:
+    """Write ``rows`` random results over ``sites`` sites, for benchmarking."""
+    generator = random.Random(seed)
+    entries = list(index.entries.values())
+    file_format = detect_format(path)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle) if file_format == "csv" else None
+        if writer:
+            writer.writerow(["site", "check_id", "script", "status"])
+        for _ in range(rows):
+            entry = generator.choice(entries)
+            site = f"LAB-{generator.randrange(sites):04d}"
+            status = "FAIL" if generator.random() < 0.08 else "PASS"
+            by_script = entry.get("script", "N/A") != "N/A" and generator.random() < 0.5
+            check_id = "" if by_script else entry["id"]
+            script = entry.get("script", "") if by_script else ""
+            if writer:
+                writer.writerow([site, check_id, script, status])
+            else:
+                handle.write(
+                    json.dumps(
+                        {"site": site, "check_id": check_id, "script": script, "status": status}
+                    )
+                    + "\n"
+                )
+
+
+def _peak_memory_kib() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_benchmark(index: ManifestIndex, rows: int, sites: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("results.csv", "results.ndjson"):
+            path = Path(directory) / name
+            write_synthetic_results(path, index, rows, sites)
+            started = time.perf_counter()
+            aggregate = ingest([path], index)
+            elapsed = time.perf_counter() - started
+            peak = _peak_memory_kib()
+            print(
+                f"ingest {detect_format(path)}: {aggregate.rows:,} rows, "
+                f"{len(aggregate.runs_by_site)} sites in {elapsed:.2f}s "
+                f"({aggregate.rows / elapsed:,.0f} rows/s)"
+                + (f", peak RSS {peak:,} KiB" if peak is not None else "")
+            )
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "ingest", help="aggregate Pre-Check result files against the manifest"
+    )
+    parser.add_argument("results", nargs="*", type=Path, help="CSV or NDJSON result files")
+    parser.add_argument("--manifest", type=Path, default=Path("manifest.json"))
+    parser.add_argument("--format", choices=("csv", "ndjson"), help="override format detection")
+    parser.add_argument("--output", type=Path, help="write the aggregate JSON here instead of stdout")
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="ROWS",
+        help="ingest ROWS synthetic results in each format and report throughput",
+    )
+    parser.add_argument("--sites", type=int, default=500, help="sites used by --benchmark")
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    index = ManifestIndex.from_file(args.manifest)
+    if args.benchmark:
+        run_benchmark(index, args.benchmark, args.sites)
+        return 0
+    if not args.results:
+        print("docs-cc ingest: no result files given", file=sys.stderr)
+        return 2
+
+    aggregate = ingest(args.results, index, args.format)
+    payload = json.dumps(aggregate.to_dict(index), ensure_ascii=False, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+        print(
+            f"ingest: {aggregate.rows:,} rows, {len(aggregate.runs_by_site)} sites, "
+            f"{aggregate.unmatched:,} unmatched -> {args.output}"
+        )
+    else:
+        sys.stdout.write(payload)
+    return 0
@@ -0,0 +1,202 @@
+"""Compaction of the admin's manifest journal from Python.
+
+A save in ``admin/index.php`` appends one JSON operation per check to
+``manifest.json.journal`` and compacts it once the response is sent, unless
+another compaction holds the lock and will pick the operations up.
+``python -m docs_cc worker`` also calls :func:`compact_manifest` once a burst
+of saves has settled, in case a save was interrupted before compacting.
+
+This is the same procedure as ``compactManifest()`` in the admin, under the
+same ``manifest.json.lock``: operations are replayed on the manifest (matched
+by ``match_file``, then ``match_id``), the manifest is replaced atomically, its
+new version is published with deltas and title order like a build does (see
+:mod:`docs_cc.manifest_versions`), and only then is the consumed part of the
+journal truncated.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+import json
+import os
+import uuid
+
+from docs_cc.manifest_versions import dump_manifest, write_manifest_versions
+
+JOURNAL_SUFFIX = ".journal"
+LOCK_SUFFIX = ".lock"
+
+
+def _text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def _lock(handle, shared: bool = False) -> None:
+    """``flock`` the file, or lock its first byte with ``msvcrt`` on Windows."""
+    try:
+        import fcntl
+    except ImportError:
+        import msvcrt
+
+        # Windows has no shared locks: readers take the exclusive one too.
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        return
+    fcntl.flock(handle, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+
+
+def _unlock(handle) -> None:
+    try:
+        import fcntl
+    except ImportError:
+        import msvcrt
+
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        return
+    fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def read_journal(path: Path) -> tuple[list[dict], int]:
+    """Complete operations of the journal and the number of bytes they span."""
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return [], 0
+    with handle:
+        _lock(handle, shared=True)
+        contents = handle.read()
+        _unlock(handle)
+
+    end = contents.rfind(b"\n")
+    if end == -1:
+        return [], 0
+    operations = []
+    for line in contents[:end].split(b"\n"):
+        try:
+            operation = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(operation, dict) and isinstance(operation.get("entry"), dict):
+            operations.append(operation)
+    return operations, end + 1
+
+
+def _move_lookup(lookup: dict[str, int], old: str, new: str, index: int) -> None:
+    if old and lookup.get(old) == index:
+        del lookup[old]
+    if new:
+        lookup.setdefault(new, index)
+
+
+def apply_operations(manifest: list, operations: list[dict]) -> list:
+    """Replay journal operations on ``manifest``, like ``applyManifestOperations()``."""
+    manifest = list(manifest)
+    by_file: dict[str, int] = {}
+    by_id: dict[str, int] = {}
+    for index, entry in enumerate(manifest):
+        if not isinstance(entry, dict):
+            continue
+        if "file" in entry:
+            by_file.setdefault(_text(entry["file"]), index)
+        if _text(entry.get("id")):
+            by_id.setdefault(_text(entry["id"]), index)
+
+    for operation in operations:
+        match_file = _text(operation.get("match_file"))
+        match_id = _text(operation.get("match_id"))
+        index = by_file.get(match_file) if match_file else None
+        if index is None and match_id:
+            index = by_id.get(match_id)
+
+        previous = manifest[index] if index is not None and isinstance(manifest[index], dict) else {}
+        entry = {**previous, **operation["entry"]}
+        if index is None:
+            manifest.append(entry)
+            index = len(manifest) - 1
+        else:
+            manifest[index] = entry
+
+        _move_lookup(by_file, _text(previous.get("file")), _text(entry.get("file")), index)
+        _move_lookup(by_id, _text(previous.get("id")), _text(entry.get("id")), index)
+    return manifest
+
+
+def truncate_journal(path: Path, consumed: int) -> None:
+    """Drop the first ``consumed`` bytes, keeping operations appended meanwhile."""
+    try:
+        handle = path.open("r+b")
+    except FileNotFoundError:
+        return
+    with handle:
+        _lock(handle)
+        handle.seek(consumed)
+        remaining = handle.read()
+        handle.seek(0)
+        handle.truncate()
+        handle.write(remaining)
+        handle.flush()
+        _unlock(handle)
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    temporary = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    temporary.write_bytes(data)
+    if path.exists():
+        os.chmod(temporary, path.stat().st_mode & 0o777)
+    os.replace(temporary, path)
+
+
+def _read_manifest(path: Path) -> list:
+    """The manifest to replay the journal on; only a missing file counts as empty.
+
+    An unreadable manifest raises instead of being replaced by the journal
+    alone, which would drop every other check from the catalogue.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+    try:
+        manifest = json.loads(text)
+    except ValueError as error:
+        raise ValueError(f"{path} is not valid JSON, journal left untouched: {error}") from None
+    if not isinstance(manifest, list):
+        raise ValueError(f"{path} is not a JSON list, journal left untouched")
+    return manifest
+
+
+def journal_pending(root: Path) -> bool:
+    journal = root / f"manifest.json{JOURNAL_SUFFIX}"
+    return journal.is_file() and journal.stat().st_size > 0
+
+
+def compact_manifest(root: Path) -> int:
+    """Apply the pending journal to ``root/manifest.json``; return the operation count.
+
+    Raises ``ValueError``, keeping the journal, when ``manifest.json`` exists
+    but cannot be parsed.
+    """
+    manifest_path = root / "manifest.json"
+    journal_path = root / f"manifest.json{JOURNAL_SUFFIX}"
+    applied = 0
+    with (root / f"manifest.json{LOCK_SUFFIX}").open("ab") as lock:
+        # A save that found the lock taken leaves its operations to us: look at
+        # the journal again once the lock is released.
+        while True:
+            _lock(lock)
+            try:
+                while True:
+                    operations, consumed = read_journal(journal_path)
+                    if not consumed:
+                        break
+                    if operations:
+                        manifest = apply_operations(_read_manifest(manifest_path), operations)
+                        data = dump_manifest(manifest).encode("utf-8")
+                        _write_atomically(manifest_path, data)
+                        write_manifest_versions(root)
+                        applied += len(operations)
+                    truncate_journal(journal_path, consumed)
+            finally:
+                _unlock(lock)
+            if not read_journal(journal_path)[1]:
+                return applied
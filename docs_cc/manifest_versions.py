@@ -0,0 +1,162 @@
+"""Versioned ``manifest.json`` with deltas for repeat visits of ``index.html``.
+
+The version of the manifest is the start of the SHA-256 of its bytes.
+``manifest.version.json`` names the current version and, for each of the last
+few versions, a delta file ``manifest-versions/<from>-<to>.json`` listing the
+entries added, changed and removed since then (keyed by ``file``, the one
+field that is unique in the manifest). Delta names are immutable, so browsers
+may cache them; only the small version file has to be revalidated.
+
+A snapshot of each recent manifest is kept in ``manifest-versions/<version>.json``
+so the next build can diff against it; older snapshots and deltas are pruned.
+
+``manifest-versions/<version>.order.json`` lists the files of the manifest by
+title, per language and per level group, so the index never sorts the
+catalogue itself: its sidebar only walks the list of the group being opened.
+Compactions of the admin journal publish their version the same way:
+``updateManifestVersion()`` in ``admin/index.php`` mirrors
+:func:`write_manifest_versions`, and only leaves the ``order`` out when PHP lacks
+the intl extension, in which case the index sorts in the browser.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import hashlib
+import json
+import unicodedata
+
+VERSIONS_DIR = Path("manifest-versions")
+VERSION_NAME = "manifest.version.json"
+DEFAULT_HISTORY = 5
+ORDER_LANGUAGES = ("fr", "en")
+# Same grouping as getLevelGroup() in assets/js/script.js.
+LEVEL_GROUPS = {
+    "FATAL": "fatal_error",
+    "FATAL_ERROR": "fatal_error",
+    "ERROR": "error",
+    "WARNING": "warning",
+    "INFO": "information",
+    "INFORMATION": "information",
+}
+
+
+def dump_manifest(manifest: list) -> str:
+    """``manifest.json`` as written by the generator and by journal compactions.
+
+    The version is a hash of these bytes, so every writer must serialize the
+    same way: a rewrite of an unchanged manifest then keeps its version.
+    ``encodeManifest()`` in ``admin/index.php`` produces the same text.
+    """
+    return json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
+
+
+def manifest_version(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def compute_delta(old: list[dict], new: list[dict]) -> dict:
+    """Entries of ``new`` added or changed since ``old``, and the files removed."""
+    before = {entry.get("file"): entry for entry in old if isinstance(entry, dict)}
+    after = {entry.get("file"): entry for entry in new if isinstance(entry, dict)}
+    return {
+        "added": [entry for file, entry in after.items() if file not in before],
+        "changed": [
+            entry for file, entry in after.items() if file in before and before[file] != entry
+        ],
+        "removed": [file for file in before if file not in after],
+        "count": len(after),
+    }
+
+
+def title_key(title: str) -> tuple[str, str]:
+    """Accent- and case-insensitive sort key, close to ``localeCompare``."""
+    decomposed = unicodedata.normalize("NFKD", title)
+    folded = "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    return folded, title
+
+
+def compute_order(manifest: list[dict], version: str) -> dict:
+    """Files of ``manifest`` by title, for each language and level group."""
+    entries = [entry for entry in manifest if isinstance(entry, dict) and entry.get("file")]
+    order: dict = {"version": version}
+    for lang in ORDER_LANGUAGES:
+        ordered = sorted(
+            entries,
+            key=lambda entry: (title_key(str(entry.get(f"title_{lang}") or "")), entry["file"]),
+        )
+        groups: dict[str, list[str]] = {"all": [entry["file"] for entry in ordered]}
+        for entry in ordered:
+            level = str(entry.get("level") or "")
+            groups.setdefault(LEVEL_GROUPS.get(level, level.lower()), []).append(entry["file"])
+        order[lang] = groups
+    return order
+
+
+@dataclass
+class ManifestVersionReport:
+    version: str
+    deltas: int
+    largest_delta: int
+    manifest_size: int
+
+    def format(self) -> str:
+        return (
+            f"manifest {self.version}: {self.deltas} delta(s), largest {self.largest_delta} bytes "
+            f"instead of {self.manifest_size} bytes"
+        )
+
+
+def write_manifest_versions(root: Path, history: int = DEFAULT_HISTORY) -> ManifestVersionReport:
+    """Snapshot ``root/manifest.json`` and write the deltas from recent versions."""
+    data = (root / "manifest.json").read_bytes()
+    version = manifest_version(data)
+    manifest = json.loads(data)
+    versions_dir = root / VERSIONS_DIR
+    versions_dir.mkdir(exist_ok=True)
+    (versions_dir / f"{version}.json").write_bytes(data)
+    order_path = versions_dir / f"{version}.order.json"
+    order_path.write_text(
+        json.dumps(compute_order(manifest, version), ensure_ascii=False, separators=(",", ":")) + "\n",
+        encoding="utf-8",
+    )
+
+    version_path = root / VERSION_NAME
+    try:
+        previous = json.loads(version_path.read_text(encoding="utf-8")).get("history", [])
+    except (OSError, ValueError, AttributeError):
+        previous = []
+    older = [
+        old
+        for old in dict.fromkeys(previous)
+        if old != version and (versions_dir / f"{old}.json").is_file()
+    ][:history]
+
+    deltas = {}
+    sizes = []
+    for old in older:
+        name = f"{old}-{version}.json"
+        path = versions_dir / name
+        if not path.is_file():
+            old_manifest = json.loads((versions_dir / f"{old}.json").read_text(encoding="utf-8"))
+            delta = {"from": old, "to": version, **compute_delta(old_manifest, manifest)}
+            path.write_text(
+                json.dumps(delta, ensure_ascii=False, separators=(",", ":")) + "\n", encoding="utf-8"
+            )
+        deltas[old] = (VERSIONS_DIR / name).as_posix()
+        sizes.append(path.stat().st_size)
+
+    kept = {f"{name}.json" for name in [version, *older]} | {Path(path).name for path in deltas.values()}
+    kept.add(order_path.name)
+    for path in versions_dir.glob("*.json"):
+        if path.name not in kept:
+            path.unlink()
+
+    info = {
+        "version": version,
+        "history": [version, *older],
+        "deltas": deltas,
+        "order": (VERSIONS_DIR / order_path.name).as_posix(),
+    }
+    version_path.write_text(json.dumps(info, indent=2) + "\n", encoding="utf-8")
+    return ManifestVersionReport(version, len(deltas), max(sizes, default=0), len(data))
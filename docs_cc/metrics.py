@@ -0,0 +1,189 @@
+"""Collector for the performance spans sent by ``assets/js/script.js``.
+
+``index.html`` reports its phases (``manifest-load``, ``manifest-parse``,
+``render``, ``sidebar``, ``first-filter``, ``ready``, ``language-switch``,
+``filter-input``, ``filter-toggle``) with ``navigator.sendBeacon`` to the URL
+in ``<body data-metrics-endpoint>``. ``python -m docs_cc metrics`` receives
+them on ``POST /metrics``, appends one NDJSON line per span to the log and
+serves the aggregate (p50/p95/p99 per phase and catalogue size) on
+``GET /report``; ``--report`` prints the same table from the log and exits.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import argparse
+import json
+import math
+import threading
+import time
+
+DEFAULT_LOG = Path("metrics.ndjson")
+DEFAULT_PORT = 8099
+MAX_BODY = 64 * 1024
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(ordered: list[float], rank: int) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return ordered[max(0, math.ceil(rank / 100 * len(ordered)) - 1)]
+
+
+def parse_beacon(body: bytes) -> list[dict]:
+    """Flatten a beacon into one record per span; invalid spans are dropped."""
+    payload = json.loads(body)
+    page = str(payload.get("page") or "")
+    checks = int(payload.get("checks") or 0)
+    records = []
+    for metric in payload.get("metrics") or []:
+        try:
+            phase, duration = str(metric["phase"]), float(metric["ms"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if phase and math.isfinite(duration) and duration >= 0:
+            records.append({"page": page, "checks": checks, "phase": phase, "ms": duration})
+    return records
+
+
+def aggregate(records) -> list[dict]:
+    samples: defaultdict[tuple[str, int], list[float]] = defaultdict(list)
+    for record in records:
+        samples[(record["phase"], record["checks"])].append(record["ms"])
+    rows = []
+    for (phase, checks), durations in sorted(samples.items()):
+        durations.sort()
+        rows.append(
+            {
+                "phase": phase,
+                "checks": checks,
+                "count": len(durations),
+                **{f"p{rank}": percentile(durations, rank) for rank in PERCENTILES},
+            }
+        )
+    return rows
+
+
+def read_log(path: Path):
+    try:
+        handle = path.open(encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            # Hand edits and truncated appends must not break the report.
+            if (
+                isinstance(record, dict)
+                and isinstance(record.get("phase"), str)
+                and isinstance(record.get("checks"), int)
+                and isinstance(record.get("ms"), (int, float))
+                and not isinstance(record["ms"], bool)
+            ):
+                yield record
+
+
+def format_report(rows: list[dict]) -> str:
+    header = f"{'phase':<16} {'checks':>7} {'count':>7}" + "".join(
+        f" {f'p{rank} ms':>9}" for rank in PERCENTILES
+    )
+    lines = [header]
+    for row in rows:
+        lines.append(
+            f"{row['phase']:<16} {row['checks']:>7} {row['count']:>7}"
+            + "".join(f" {row[f'p{rank}']:>9.1f}" for rank in PERCENTILES)
+        )
+    return "\n".join(lines)
+
+
+class MetricsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], log_path: Path) -> None:
+        super().__init__(address, MetricsRequestHandler)
+        self.log_path = log_path
+        self.lock = threading.Lock()
+
+    def append(self, records: list[dict]) -> None:
+        received_at = round(time.time(), 3)
+        lines = "".join(
+            json.dumps({"received_at": received_at, **record}, ensure_ascii=False) + "\n"
+            for record in records
+        )
+        with self.lock, self.log_path.open("a", encoding="utf-8") as handle:
+            handle.write(lines)
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    server: MetricsServer
+    server_version = "docs-cc-metrics"
+
+    def _send(self, status: HTTPStatus, body: bytes = b"", content_type: str = "text/plain") -> None:
+        self.send_response(status)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_OPTIONS(self) -> None:
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "POST, GET")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.end_headers()
+
+    def do_POST(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self._send(HTTPStatus.NOT_FOUND)
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            self._send(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return
+        try:
+            records = parse_beacon(self.rfile.read(length))
+        except (ValueError, TypeError, AttributeError):
+            self._send(HTTPStatus.BAD_REQUEST)
+            return
+        if records:
+            self.server.append(records)
+        self._send(HTTPStatus.NO_CONTENT)
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/report":
+            self._send(HTTPStatus.NOT_FOUND)
+            return
+        body = json.dumps(aggregate(read_log(self.server.log_path)), indent=2).encode("utf-8")
+        self._send(HTTPStatus.OK, body, "application/json")
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # one line per beacon would drown the console
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser("metrics", help="collect and summarize index.html performance spans")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--log", type=Path, default=DEFAULT_LOG, help="NDJSON file of received spans")
+    parser.add_argument("--report", action="store_true", help="print p50/p95/p99 from the log and exit")
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.report:
+        print(format_report(aggregate(read_log(args.log))))
+        return 0
+    server = MetricsServer((args.host, args.port), args.log)
+    print(f"docs-cc metrics: POST http://{args.host}:{server.server_address[1]}/metrics")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
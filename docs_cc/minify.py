@@ -0,0 +1,284 @@
+"""Conservative, standard-library minification of the generated site.
+
+Generated pages are minified in place; ``style.css`` and ``script.js`` are kept
+readable and written next to themselves as ``style.min.css``/``script.min.js``.
+Building without ``--minify`` keeps every page on the readable assets, which is
+the debug mode.
+
+Only whitespace and comments are removed: attribute values (``data-fr``,
+``data-en``, ``data-*-html``) are copied verbatim and the content of ``pre``,
+``textarea`` and ``script`` elements is never touched.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import re
+
+PRESERVED_ELEMENTS = ("pre", "textarea", "script")
+# Whitespace next to these tags never renders, so it can be dropped entirely.
+BLOCK_ELEMENTS = frozenset(
+    {
+        "!doctype", "html", "head", "body", "meta", "link", "title", "style", "script",
+        "noscript", "header", "main", "footer", "nav", "section", "article", "aside",
+        "div", "p", "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "li", "table",
+        "thead", "tbody", "tfoot", "tr", "th", "td", "form", "label", "br", "hr", "pre",
+    }
+)
+
+_TAG_RE = re.compile(
+    r"<(?P<close>/)?(?P<name>!?[A-Za-z][^\s/>]*)"
+    r"(?P<attributes>(?:\s+[^\s\"'=<>`/]+(?:\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s\"'>]+))?)*)"
+    r"\s*(?P<self>/)?>"
+)
+_ATTRIBUTE_RE = re.compile(r"([^\s\"'=<>`/]+)(?:\s*=\s*(\"[^\"]*\"|'[^']*'|[^\s\"'>]+))?")
+_COMMENT_RE = re.compile(r"<!--(?!\[).*?-->", re.S)
+_PRESERVED_RE = re.compile(
+    r"<(?P<name>" + "|".join(PRESERVED_ELEMENTS) + r")\b[^>]*>.*?</(?P=name)\s*>", re.S | re.I
+)
+_STYLE_RE = re.compile(r"(<style\b[^>]*>)(.*?)(</style\s*>)", re.S | re.I)
+_ASSET_RE = re.compile(r"(assets/(?:css/style|js/script))(?:\.min)?\.(css|js)\b")
+_CSS_STRING_RE = re.compile(r"\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'")
+_JS_REGEX_PRECEDERS = frozenset("(,=:[!&|?{};+-*%<>~^")
+# After these keywords an expression starts, so ``/`` opens a regular expression.
+_JS_REGEX_KEYWORDS = frozenset(
+    {
+        "return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw",
+        "case", "do", "else", "yield", "await",
+    }
+)
+
+
+@dataclass
+class MinifyReport:
+    artifact: str
+    files: int
+    original_bytes: int
+    minified_bytes: int
+
+    def format(self) -> str:
+        saved = self.original_bytes - self.minified_bytes
+        ratio = saved / self.original_bytes * 100 if self.original_bytes else 0.0
+        return (
+            f"minify {self.artifact}: {self.files} file(s), {self.original_bytes:,} B -> "
+            f"{self.minified_bytes:,} B (saved {saved:,} B, {ratio:.1f}%)"
+        )
+
+
+def use_minified_assets(markup: str, enabled: bool) -> str:
+    """Point ``style.css``/``script.js`` references at the minified copies, or back."""
+    suffix = ".min" if enabled else ""
+    return _ASSET_RE.sub(lambda match: f"{match.group(1)}{suffix}.{match.group(2)}", markup)
+
+
+def _rebuild_tag(match: re.Match[str]) -> str:
+    if match.group("close"):
+        return f"</{match.group('name')}>"
+    parts = [match.group("name")]
+    for name, value in _ATTRIBUTE_RE.findall(match.group("attributes") or ""):
+        parts.append(f"{name}={value}" if value else name)
+    closing = " />" if match.group("self") else ">"
+    return "<" + " ".join(parts) + closing
+
+
+def _is_block(tag: str | None) -> bool:
+    if tag is None:
+        return True
+    match = _TAG_RE.match(tag)
+    return bool(match) and match.group("name").lower() in BLOCK_ELEMENTS
+
+
+def _minify_markup(markup: str) -> str:
+    tags = _TAG_RE.finditer(markup)
+    output: list[str] = []
+    previous_tag: str | None = None
+    position = 0
+    for match in tags:
+        text = markup[position:match.start()]
+        current_tag = match.group(0)
+        if text:
+            collapsed = re.sub(r"\s+", " ", text)
+            if _is_block(previous_tag):
+                collapsed = collapsed.lstrip()
+            if _is_block(current_tag):
+                collapsed = collapsed.rstrip()
+            output.append(collapsed)
+        output.append(_rebuild_tag(match))
+        previous_tag = current_tag
+        position = match.end()
+    tail = re.sub(r"\s+", " ", markup[position:]).strip()
+    output.append(tail)
+    return "".join(output)
+
+
+def minify_html(markup: str) -> str:
+    """Collapse insignificant whitespace and drop comments, keeping values verbatim."""
+    markup = _STYLE_RE.sub(
+        lambda match: match.group(1) + minify_css(match.group(2)) + match.group(3), markup
+    )
+    preserved: list[str] = []
+
+    def stash(match: re.Match[str]) -> str:
+        preserved.append(match.group(0))
+        return f"<pre data-minify-slot=\"{len(preserved) - 1}\"></pre>"
+
+    markup = _PRESERVED_RE.sub(stash, markup)
+    markup = _COMMENT_RE.sub("", markup)
+    markup = _minify_markup(markup)
+
+    def restore(match: re.Match[str]) -> str:
+        return preserved[int(match.group(1))]
+
+    return re.sub(r'<pre data-minify-slot="(\d+)"></pre>', restore, markup) + "\n"
+
+
+def minify_css(css: str) -> str:
+    strings: list[str] = []
+
+    def stash(match: re.Match[str]) -> str:
+        strings.append(match.group(0))
+        return f"\0{len(strings) - 1}\0"
+
+    css = _CSS_STRING_RE.sub(stash, css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r"\s*:\s*(?=[^{}]*(?:;|}))", ":", css)
+    css = css.replace(";}", "}").strip()
+    return re.sub(r"\0(\d+)\0", lambda match: strings[int(match.group(1))], css)
+
+
+def _js_regex_allowed(last_token: str) -> bool:
+    """Whether a ``/`` after ``last_token`` starts a regular expression, not a division."""
+    if not last_token or last_token in _JS_REGEX_KEYWORDS:
+        return True
+    return len(last_token) == 1 and last_token in _JS_REGEX_PRECEDERS
+
+
+def _template_end(script: str, position: int) -> tuple[int, bool]:
+    """End of the template literal text at ``position`` and whether it stops at ``${``."""
+    length = len(script)
+    while position < length:
+        if script[position] == "\\":
+            position += 2
+        elif script[position] == "`":
+            return position + 1, False
+        elif script.startswith("${", position):
+            return position + 2, True
+        else:
+            position += 1
+    return length, False
+
+
+def minify_js(script: str) -> str:
+    """Remove comments, indentation and blank lines.
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly as in
+    the source; strings, template literals and regular expressions are copied
+    untouched. A ``/`` opens a regular expression after an operator, an opening
+    bracket or a keyword such as ``return`` or ``typeof``, and is a division
+    otherwise. The ``${}`` expressions of template literals are minified as
+    code, nested templates included.
+    """
+    output: list[str] = []
+    length = len(script)
+    position = 0
+    last_token = ""
+    in_word = False
+    # Brace depth inside each enclosing ``${`` expression, innermost last.
+    templates: list[int] = []
+    while position < length:
+        char = script[position]
+        pair = script[position:position + 2]
+        if pair == "//":
+            end = script.find("\n", position)
+            position = length if end == -1 else end
+            continue
+        if pair == "/*":
+            end = script.find("*/", position + 2)
+            position = length if end == -1 else end + 2
+            continue
+        if char in "'\"":
+            end = position + 1
+            while end < length and script[end] != char:
+                end += 2 if script[end] == "\\" else 1
+            output.append(script[position:end + 1])
+            position = end + 1
+            last_token, in_word = char, False
+            continue
+        if char == "`" or (char == "}" and templates and templates[-1] == 0):
+            if char == "}":
+                templates.pop()
+            end, opened = _template_end(script, position + 1)
+            output.append(script[position:end])
+            position = end
+            if opened:
+                templates.append(0)
+            last_token, in_word = ("{" if opened else "`"), False
+            continue
+        if char == "/" and _js_regex_allowed(last_token):
+            end = position + 1
+            in_class = False
+            while end < length and (in_class or script[end] != "/"):
+                if script[end] == "\\":
+                    end += 1
+                elif script[end] == "[":
+                    in_class = True
+                elif script[end] == "]":
+                    in_class = False
+                end += 1
+            end += 1
+            while end < length and script[end].isalpha():
+                end += 1
+            output.append(script[position:end])
+            position = end
+            last_token, in_word = "/", False
+            continue
+        if char == "\n":
+            if output and output[-1] == " ":
+                output.pop()
+            if output and output[-1] != "\n":
+                output.append("\n")
+            in_word = False
+        elif char.isspace():
+            if output and output[-1] not in (" ", "\n"):
+                output.append(" ")
+            in_word = False
+        else:
+            if templates and char == "{":
+                templates[-1] += 1
+            elif templates and char == "}":
+                templates[-1] -= 1
+            output.append(char)
+            word = char.isalnum() or char in "_$"
+            last_token = last_token + char if word and in_word else char
+            in_word = word
+        position += 1
+
+    return "".join(output).strip() + "\n"
+
+
+def minify_asset(source: Path, minifier) -> tuple[Path, int, int]:
+    target = source.with_name(f"{source.stem}.min{source.suffix}")
+    original = source.read_text(encoding="utf-8")
+    minified = minifier(original)
+    target.write_text(minified, encoding="utf-8")
+    return target, len(original.encode("utf-8")), len(minified.encode("utf-8"))
+
+
+def apply_minification(pages: list[Path], stylesheet: Path, script: Path) -> list[MinifyReport]:
+    """Minify generated ``pages`` in place and write the minified assets."""
+    reports = []
+    for source, minifier in ((stylesheet, minify_css), (script, minify_js)):
+        target, original, minified = minify_asset(source, minifier)
+        reports.append(MinifyReport(target.as_posix(), 1, original, minified))
+
+    original_total = minified_total = 0
+    for page in pages:
+        markup = page.read_text(encoding="utf-8")
+        minified = minify_html(use_minified_assets(markup, True))
+        page.write_text(minified, encoding="utf-8")
+        original_total += len(markup.encode("utf-8"))
+        minified_total += len(minified.encode("utf-8"))
+    reports.append(MinifyReport("generated HTML", len(pages), original_total, minified_total))
+    return reports
@@ -0,0 +1,182 @@
+"""Read bilingual detail pages (``checks/<slug>.html``) back into records.
+
+The pages may have been rewritten by ``admin/index.php`` (DOMDocument output,
+``<p>`` turned into ``<div data-fr-html>``), so the parser only relies on the
+classes and ``data-fr``/``data-en`` attributes both writers keep: the
+``page-title`` heading, the ``info-table`` rows and the ``content-section``
+blocks titled "Explications" and "Résolution".
+"""
+from __future__ import annotations
+
+from html.parser import HTMLParser
+import re
+
+RECORD_FIELDS = (
+    "identifier",
+    "level",
+    "title_fr",
+    "title_en",
+    "status_fr",
+    "status_en",
+    "overview_fr",
+    "overview_en",
+    "overview_fr_html",
+    "overview_en_html",
+    "remediation_fr",
+    "remediation_en",
+    "remediation_fr_html",
+    "remediation_en_html",
+)
+
+RICH_FIELDS = ("overview_fr_html", "overview_en_html", "remediation_fr_html", "remediation_en_html")
+
+VOID_ELEMENTS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+)
+_TEXT_ATTRIBUTES = ("data-fr", "data-en", "data-fr-html", "data-en-html")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _strip_tags(markup: str) -> str:
+    return _normalize(_TAG_RE.sub(" ", markup))
+
+
+def _classes(attrs: dict[str, str | None]) -> set[str]:
+    return set((attrs.get("class") or "").split())
+
+
+class _Capture:
+    def __init__(self, key: str, depth: int, attrs: dict[str, str | None]) -> None:
+        self.key = key
+        self.depth = depth
+        self.attrs = attrs
+        self.parts: list[str] = []
+
+    @property
+    def text(self) -> str:
+        return _normalize("".join(self.parts))
+
+
+class _DetailPageParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.record: dict[str, str] = {}
+        self.stack: list[str] = []
+        self.captures: list[_Capture] = []
+        self.in_info_table = False
+        self.row_label = ""
+        self.section = ""
+        self.section_depth = -1
+        self.section_done = False
+
+    def handle_starttag(self, tag: str, attrs_list: list[tuple[str, str | None]]) -> None:
+        attrs = dict(attrs_list)
+        classes = _classes(attrs)
+        depth = len(self.stack)
+
+        if tag == "table" and "info-table" in classes:
+            self.in_info_table = True
+        elif tag == "section" and "content-section" in classes:
+            self.section = "pending"
+            self.section_depth = depth
+            self.section_done = False
+
+        if tag == "h1" and "page-title" in classes:
+            self._capture("title", depth, attrs)
+        elif self.in_info_table and tag == "th":
+            self.row_label = (attrs.get("data-fr") or attrs.get("data-en") or "").casefold()
+        elif self.in_info_table and tag == "span" and "level-pill" in classes:
+            self._capture("level", depth, attrs)
+        elif self.in_info_table and tag == "td":
+            if self.row_label.startswith(("identifiant", "identifier")):
+                self._capture("identifier", depth, attrs)
+            elif self.row_label.startswith(("statut", "status")):
+                self._capture("status", depth, attrs)
+        elif self.section == "pending" and tag == "h2":
+            label = f"{attrs.get('data-fr') or ''} {attrs.get('data-en') or ''}"
+            if "Explications" in label or "Overview" in label:
+                self.section = "overview"
+            elif "Résolution" in label or "Remediation" in label:
+                self.section = "remediation"
+            else:
+                self.section = ""
+        elif (
+            self.section in ("overview", "remediation")
+            and not self.section_done
+            and tag != "h2"
+            and any(name in attrs for name in _TEXT_ATTRIBUTES)
+        ):
+            self.section_done = True
+            self._capture(self.section, depth, attrs)
+
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(tag)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and self.stack and self.stack[-1] == tag:
+            self.stack.pop()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in VOID_ELEMENTS or tag not in self.stack:
+            return
+        while self.stack:
+            closed = self.stack.pop()
+            depth = len(self.stack)
+            while self.captures and self.captures[-1].depth >= depth:
+                self._finish(self.captures.pop())
+            if closed == "table":
+                self.in_info_table = False
+            elif closed == "tr":
+                self.row_label = ""
+            elif closed == "section" and depth <= self.section_depth:
+                self.section = ""
+                self.section_depth = -1
+            if closed == tag:
+                break
+
+    def handle_data(self, data: str) -> None:
+        for capture in self.captures:
+            capture.parts.append(data)
+
+    def close(self) -> None:
+        super().close()
+        while self.captures:
+            self._finish(self.captures.pop())
+
+    def _capture(self, key: str, depth: int, attrs: dict[str, str | None]) -> None:
+        self.captures.append(_Capture(key, depth, attrs))
+
+    def _finish(self, capture: _Capture) -> None:
+        attrs = capture.attrs
+        if capture.key in ("identifier", "level"):
+            self.record.setdefault(capture.key, capture.text)
+            return
+        if capture.key in self.record or f"{capture.key}_fr" in self.record:
+            return
+
+        fr_html = (attrs.get("data-fr-html") or "").strip()
+        en_html = (attrs.get("data-en-html") or "").strip()
+        fr = _normalize(attrs.get("data-fr") or "") or (_strip_tags(fr_html) if fr_html else capture.text)
+        en = _normalize(attrs.get("data-en") or "") or (_strip_tags(en_html) if en_html else fr)
+        self.record[f"{capture.key}_fr"] = fr
+        self.record[f"{capture.key}_en"] = en
+        if capture.key in ("overview", "remediation"):
+            self.record[f"{capture.key}_fr_html"] = fr_html
+            self.record[f"{capture.key}_en_html"] = en_html or fr_html
+
+
+def parse_detail_page(markup: str) -> dict[str, str]:
+    """Return the fields of :data:`RECORD_FIELDS` found in a detail page.
+
+    Missing parts come back as empty strings; English falls back to French as
+    ``admin/index.php`` does when only one language was filled in.
+    """
+    parser = _DetailPageParser()
+    parser.feed(markup)
+    parser.close()
+    return {field: parser.record.get(field, "") for field in RECORD_FIELDS}
@@ -0,0 +1,211 @@
+"""SQLite FTS5 index of the catalogue and the ``docs-cc query`` command.
+
+The generator writes ``catalogue.sqlite3`` next to ``manifest.json``: a
+``checks`` table with every bilingual field of the checks, remediation text
+included, and an external-content FTS5 table over the searchable ones.
+Diacritics are folded and prefixes of two and three characters are indexed,
+so ``python -m docs_cc query "postgre tablespace" --level ERROR`` answers in
+milliseconds without loading the manifest.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import json
+import os
+import re
+import sqlite3
+import time
+import uuid
+
+SEARCH_DB_PATH = Path("catalogue.sqlite3")
+LEVELS = ("FATAL_ERROR", "ERROR", "WARNING", "INFORMATION")
+DEFAULT_LIMIT = 20
+
+COLUMNS = (
+    "slug",
+    "identifier",
+    "level",
+    "script",
+    "file",
+    "title_fr",
+    "title_en",
+    "status_fr",
+    "status_en",
+    "overview_fr",
+    "overview_en",
+    "remediation_fr",
+    "remediation_en",
+)
+# Searchable columns and their bm25() weight: a hit in a title outranks one in
+# the remediation steps.
+FTS_WEIGHTS = {
+    "identifier": 8.0,
+    "script": 4.0,
+    "title_fr": 10.0,
+    "title_en": 10.0,
+    "overview_fr": 2.0,
+    "overview_en": 2.0,
+    "remediation_fr": 1.0,
+    "remediation_en": 1.0,
+}
+_TERM_RE = re.compile(r"\w+")
+
+SCHEMA = f"""
+CREATE TABLE checks (
+    {", ".join(f"{column} TEXT NOT NULL" for column in COLUMNS)},
+    level_rank INTEGER NOT NULL
+);
+CREATE INDEX checks_level ON checks (level_rank, identifier);
+CREATE VIRTUAL TABLE checks_fts USING fts5(
+    {", ".join(FTS_WEIGHTS)},
+    content='checks',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+"""
+
+
+def _row(payload: dict) -> tuple:
+    return (
+        *(str(payload.get(column) or "") for column in COLUMNS[:4]),
+        f"checks/{payload['slug']}.html",
+        *(str(payload.get(column) or "") for column in COLUMNS[5:]),
+        LEVELS.index(payload["level"]) if payload["level"] in LEVELS else len(LEVELS),
+    )
+
+
+_INSERT = f"INSERT INTO checks ({', '.join(COLUMNS)}, level_rank) VALUES ({', '.join('?' * (len(COLUMNS) + 1))})"
+
+
+def write_search_db(path: Path, payloads: list[dict]) -> int:
+    """Write the index of ``payloads`` to ``path`` atomically; return its size."""
+    temporary = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    connection = sqlite3.connect(temporary)
+    try:
+        connection.executescript(SCHEMA)
+        connection.executemany(_INSERT, [_row(payload) for payload in payloads])
+        connection.execute("INSERT INTO checks_fts (checks_fts) VALUES ('rebuild')")
+        connection.execute("INSERT INTO checks_fts (checks_fts) VALUES ('optimize')")
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(temporary, path)
+    return path.stat().st_size
+
+
+def update_search_db(path: Path, payloads: list[dict], removed: list[str] = ()) -> int:
+    """Replace the rows of ``payloads`` and drop the ``removed`` slugs, in one transaction.
+
+    Used by ``python -m docs_cc worker`` after admin saves; only the touched
+    rows are written to the index. Returns the number of rows written.
+    """
+    fts_columns = ", ".join(FTS_WEIGHTS)
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            for slug in [*(payload["slug"] for payload in payloads), *removed]:
+                for row in connection.execute(
+                    f"SELECT rowid, {fts_columns} FROM checks WHERE slug = ?", (slug,)
+                ).fetchall():
+                    # External-content FTS: the old values must be deleted explicitly.
+                    connection.execute(
+                        f"INSERT INTO checks_fts (checks_fts, rowid, {fts_columns}) "
+                        f"VALUES ('delete', {', '.join('?' * (len(FTS_WEIGHTS) + 1))})",
+                        row,
+                    )
+                    connection.execute("DELETE FROM checks WHERE rowid = ?", (row[0],))
+            for payload in payloads:
+                rowid = connection.execute(_INSERT, _row(payload)).lastrowid
+                connection.execute(
+                    f"INSERT INTO checks_fts (rowid, {fts_columns}) "
+                    f"SELECT rowid, {fts_columns} FROM checks WHERE rowid = ?",
+                    (rowid,),
+                )
+    finally:
+        connection.close()
+    return len(payloads)
+
+
+def match_expression(text: str) -> str:
+    """Turn free text into an FTS5 query: every word must prefix a token."""
+    return " ".join(f'"{term}"*' for term in _TERM_RE.findall(text))
+
+
+def search(
+    connection: sqlite3.Connection,
+    text: str,
+    levels: list[str] | None = None,
+    lang: str = "fr",
+    limit: int = DEFAULT_LIMIT,
+) -> list[dict]:
+    """Ranked checks matching ``text`` (all checks of ``levels`` when empty)."""
+    level_filter = ""
+    parameters: list = []
+    if levels:
+        level_filter = f" AND checks.level IN ({', '.join('?' * len(levels))})"
+        parameters.extend(levels)
+
+    expression = match_expression(text)
+    if not expression:
+        rows = connection.execute(
+            f"SELECT identifier, level, script, file, title_{lang}, '' FROM checks "
+            f"WHERE 1{level_filter} ORDER BY level_rank, identifier LIMIT ?",
+            [*parameters, limit],
+        )
+    else:
+        weights = ", ".join(str(weight) for weight in FTS_WEIGHTS.values())
+        rows = connection.execute(
+            f"SELECT checks.identifier, checks.level, checks.script, checks.file, "
+            f"checks.title_{lang}, snippet(checks_fts, -1, '[', ']', '…', 12) "
+            f"FROM checks_fts JOIN checks ON checks.rowid = checks_fts.rowid "
+            f"WHERE checks_fts MATCH ?{level_filter} "
+            f"ORDER BY bm25(checks_fts, {weights}), checks.level_rank LIMIT ?",
+            [expression, *parameters, limit],
+        )
+    keys = ("id", "level", "script", "file", "title", "snippet")
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser("query", help="full-text search of the checks")
+    parser.add_argument("text", nargs="*", help="words to look for (prefixes match)")
+    parser.add_argument(
+        "--level",
+        action="append",
+        choices=LEVELS,
+        type=str.upper,
+        help="restrict to a level (repeatable)",
+    )
+    parser.add_argument("--lang", choices=("fr", "en"), default="fr", help="language of the titles")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=SEARCH_DB_PATH,
+        help=f"index written by generate_checks_docs.py (default: {SEARCH_DB_PATH})",
+    )
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    if not args.db.is_file():
+        raise SystemExit(f"{args.db}: not found, run generate_checks_docs.py first")
+    started = time.perf_counter()
+    connection = sqlite3.connect(f"{args.db.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        results = search(connection, " ".join(args.text), args.level, args.lang, args.limit)
+    finally:
+        connection.close()
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return 0
+    for result in results:
+        print(f"{result['level']:<12} {result['id']:<12} {result['title']}  ({result['file']})")
+        if result["snippet"]:
+            print(f"{'':<25} {result['snippet']}")
+    print(f"{len(results)} result(s) in {elapsed:.1f} ms")
+    return 0
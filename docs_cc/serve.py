@@ -0,0 +1,336 @@
+"""Local preview server rendering the catalogue from memory.
+
+``checks/<slug>.html`` (and its ``fr``/``en`` variants), ``checks/<slug>.json``
+and ``manifest.json`` are rendered on request from the check definitions of
+``generate_checks_docs.py``, without writing anything to disk. Other paths are
+served from the project directory. Every response carries a strong ``ETag``
+so conditional requests are answered with ``304``, and bodies are kept
+gzip-compressed in an LRU cache for clients that accept it.
+
+When ``generate_checks_docs.py`` or the ``catalogue.json`` written by
+``python -m docs_cc sync`` changes, the catalogue is reloaded and only the
+pages whose check (or neighbours) changed are evicted.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+import argparse
+import gzip
+import hashlib
+import importlib
+import json
+import mimetypes
+import re
+import sys
+import threading
+
+from docs_cc.manifest_versions import manifest_version
+
+DEFAULT_CACHE_SIZE = 256
+_LOCALIZED_RE = re.compile(r"checks/(fr|en)/([\w-]+)\.html")
+_DETAIL_RE = re.compile(r"checks/([\w-]+)\.(html|json)")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    gzip_body: bytes
+    content_type: str
+    etag: str
+
+    @classmethod
+    def build(cls, body: bytes, content_type: str) -> "CachedResponse":
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        return cls(body, gzip.compress(body, mtime=0), content_type, digest)
+
+
+class LRUCache:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, keys: set[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class Catalogue:
+    """In-memory view of the generator's checks, reloaded when its source changes."""
+
+    def __init__(
+        self, cache: LRUCache, catalogue_path: Path, module_name: str = "generate_checks_docs"
+    ) -> None:
+        self.cache = cache
+        self.module = importlib.import_module(module_name)
+        self.source = Path(self.module.__file__)
+        self.catalogue_path = catalogue_path
+        self._lock = threading.Lock()
+        self._mtime = self._source_mtimes()
+        self._load()
+
+    def _source_mtimes(self) -> tuple[int, int | None]:
+        try:
+            synced = self.catalogue_path.stat().st_mtime_ns
+        except OSError:
+            synced = None
+        return self.source.stat().st_mtime_ns, synced
+
+    def _load(self) -> None:
+        generator = self.module
+        checks = generator.load_checks(self.catalogue_path)
+        payloads = [generator.build_payload(check) for check in checks]
+        self.payloads = {payload["slug"]: payload for payload in payloads}
+        self.neighbours = generator.compute_neighbours(payloads)
+        self.manifest = [generator.build_manifest_entry(payload) for payload in payloads]
+        self.templates = (generator.TEMPLATE, generator.LOCALIZED_TEMPLATE, generator.UI_LABELS)
+
+    def _signature(self, slug: str) -> str:
+        previous, following = self.neighbours[slug]
+        return json.dumps(
+            [
+                self.payloads[slug],
+                previous and [previous["slug"], previous["title_fr"], previous["title_en"]],
+                following and [following["slug"], following["title_fr"], following["title_en"]],
+            ],
+            sort_keys=True,
+        )
+
+    def refresh(self) -> set[str]:
+        """Reload the definitions if the source changed; return the evicted keys."""
+        try:
+            mtime = self._source_mtimes()
+        except OSError:
+            return set()
+        if mtime == self._mtime:
+            return set()
+
+        with self._lock:
+            if mtime == self._mtime:
+                return set()
+            old_templates = self.templates
+            old_manifest = self.manifest
+            old_signatures = {slug: self._signature(slug) for slug in self.payloads}
+            if mtime[0] != self._mtime[0]:
+                self.module = importlib.reload(self.module)
+            self._load()
+            self._mtime = mtime
+
+            if self.templates != old_templates:
+                self.cache.clear()
+                return {"*"}
+
+            changed = {
+                slug
+                for slug in set(old_signatures) | set(self.payloads)
+                if old_signatures.get(slug) != (
+                    self._signature(slug) if slug in self.payloads else None
+                )
+            }
+            keys = {
+                key
+                for slug in changed
+                for key in (
+                    f"checks/{slug}.html",
+                    f"checks/{slug}.json",
+                    f"checks/fr/{slug}.html",
+                    f"checks/en/{slug}.html",
+                )
+            }
+            if self.manifest != old_manifest:
+                keys.update(("manifest.json", "manifest.version.json"))
+            self.cache.discard(keys)
+            return keys
+
+    def render(self, key: str) -> tuple[bytes, str] | None:
+        generator = self.module
+        if key in ("manifest.json", "manifest.version.json"):
+            body = (json.dumps(self.manifest, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+            if key == "manifest.version.json":
+                # No deltas in preview: a changed catalogue means a full reload.
+                version = manifest_version(body)
+                body = json.dumps({"version": version, "history": [version], "deltas": {}}).encode("utf-8")
+            return body, "application/json; charset=utf-8"
+
+        match = _LOCALIZED_RE.fullmatch(key)
+        if match and match.group(2) in self.payloads:
+            lang, slug = match.groups()
+            previous, following = self.neighbours[slug]
+            body = generator.render_localized_detail(self.payloads[slug], lang, previous, following)
+            return body.encode("utf-8"), "text/html; charset=utf-8"
+
+        match = _DETAIL_RE.fullmatch(key)
+        if match and match.group(1) in self.payloads:
+            slug, extension = match.groups()
+            previous, following = self.neighbours[slug]
+            payload = self.payloads[slug]
+            if extension == "json":
+                fragment = generator.build_fragment(payload, previous, following)
+                body = json.dumps(fragment, ensure_ascii=False, separators=(",", ":")) + "\n"
+                return body.encode("utf-8"), "application/json; charset=utf-8"
+            body = generator.render_detail(payload, previous, following)
+            return body.encode("utf-8"), "text/html; charset=utf-8"
+        return None
+
+
+class PreviewServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], root: Path, cache_size: int) -> None:
+        super().__init__(address, PreviewRequestHandler)
+        self.root = root.resolve()
+        self.cache = LRUCache(cache_size)
+        # Render with the generator of --root, not whichever one the cwd holds.
+        sys.path.insert(0, str(self.root))
+        self.catalogue = Catalogue(self.cache, self.root / "catalogue.json")
+        self._static_mtimes: dict[str, int] = {}
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        self.catalogue.refresh()
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        rendered = self.catalogue.render(key)
+        if rendered is not None:
+            cached = CachedResponse.build(*rendered)
+            self.cache.put(key, cached)
+            return cached
+        return self._lookup_static(key)
+
+    def _lookup_static(self, key: str) -> CachedResponse | None:
+        path = (self.root / key).resolve()
+        if self.root not in path.parents and path != self.root:
+            return None
+        if path.is_dir():
+            path = path / "index.html"
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        cache_key = f"static:{path}"
+        cached = self.cache.get(cache_key)
+        if cached is not None and self._static_mtimes.get(cache_key) == mtime:
+            return cached
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+            content_type += "; charset=utf-8"
+        cached = CachedResponse.build(path.read_bytes(), content_type)
+        self.cache.put(cache_key, cached)
+        self._static_mtimes[cache_key] = mtime
+        return cached
+
+
+def _accepts_gzip(header: str | None) -> bool:
+    """Whether ``Accept-Encoding`` allows gzip, honouring ``q=0`` and ``*``."""
+    qualities: dict[str, float] = {}
+    for part in (header or "").split(","):
+        coding, *params = (item.strip() for item in part.split(";"))
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    if "gzip" in qualities:
+        return qualities["gzip"] > 0
+    return qualities.get("x-gzip", qualities.get("*", 0.0)) > 0
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return etag in candidates
+
+
+class PreviewRequestHandler(BaseHTTPRequestHandler):
+    server: PreviewServer
+    server_version = "docs-cc"
+
+    def do_HEAD(self) -> None:
+        self._respond(include_body=False)
+
+    def do_GET(self) -> None:
+        self._respond(include_body=True)
+
+    def _respond(self, include_body: bool) -> None:
+        key = unquote(urlsplit(self.path).path).lstrip("/") or "index.html"
+        cached = self.server.lookup(key)
+        if cached is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        accepts_gzip = _accepts_gzip(self.headers.get("Accept-Encoding"))
+        etag = f'"{cached.etag}-gz"' if accepts_gzip else f'"{cached.etag}"'
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        body = cached.gzip_body if accepts_gzip else cached.body
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", cached.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if accepts_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser("serve", help="preview the documentation from memory")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--root", type=Path, default=Path("."), help="directory of index.html and assets/")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE)
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    server = PreviewServer((args.host, args.port), args.root, args.cache_size)
+    print(f"docs-cc serve: http://{args.host}:{server.server_address[1]}/index.html")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
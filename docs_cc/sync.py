@@ -0,0 +1,264 @@
+"""Import admin-edited detail pages back into the catalogue.
+
+``admin/index.php`` rewrites ``checks/<slug>.html`` and ``manifest.json`` in
+place; the next ``generate_checks_docs.py`` run would overwrite those edits
+from the ``CHECKS`` literal. ``python -m docs_cc sync`` parses every detail
+page back into a record (titles, identifier, level, status, overview and
+remediation in both languages, ``data-*-html`` rich content included), joins
+the script and level kept in ``manifest.json`` and writes ``catalogue.json``,
+which the generator overlays on ``CHECKS``.
+
+Pages are parsed in a process pool. ``.cache/sync.json`` remembers the
+modification time, size and SHA-256 of each page with its parsed record, so a
+page is only read again when its stat changed and only parsed again when its
+content did. Differences with the current catalogue are reported field by
+field, as are the fields the generator cannot reproduce from the record.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+import uuid
+
+from docs_cc.pages import RICH_FIELDS, parse_detail_page
+
+STATE_PATH = Path(".cache") / "sync.json"
+CATALOGUE_NAME = "catalogue.json"
+PARALLEL_THRESHOLD = 32
+
+COMPARED_FIELDS = (
+    "identifier",
+    "level",
+    "script",
+    "title_fr",
+    "title_en",
+    "status_fr",
+    "status_en",
+    "overview_fr",
+    "overview_en",
+    "remediation_fr",
+    "remediation_en",
+)
+
+
+def _parse_page(path: str, known_digest: str | None) -> tuple[str, str, dict | None]:
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == known_digest:
+        return path, digest, None
+    return path, digest, parse_detail_page(data.decode("utf-8"))
+
+
+@dataclass
+class SyncReport:
+    pages: int = 0
+    parsed: int = 0
+    unchanged: int = 0
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: dict[str, list[tuple[str, str, str]]] = field(default_factory=dict)
+    lossy: dict[str, list[str]] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def has_diffs(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def format(self) -> str:
+        lines = [
+            f"sync: {self.pages} page(s), {self.parsed} parsed, {self.unchanged} unchanged; "
+            f"{len(self.changed)} changed, {len(self.added)} added, {len(self.removed)} removed "
+            f"in {self.seconds:.2f}s"
+        ]
+        lines.extend(f"+ {slug}" for slug in self.added)
+        lines.extend(f"- {slug}" for slug in self.removed)
+        for slug, diffs in sorted(self.changed.items()):
+            for name, before, after in diffs:
+                lines.append(f"~ {slug}.{name}: {_shorten(before)!r} -> {_shorten(after)!r}")
+        for slug, names in sorted(self.lossy.items()):
+            lines.append(f"! {slug}: not reproduced by the generator: {', '.join(names)}")
+        return "\n".join(lines)
+
+
+def _shorten(text: str, width: int = 60) -> str:
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def _load_json(path: Path, default):
+    try:
+        value = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return default
+    return value if isinstance(value, type(default)) else default
+
+
+def _write_atomically(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    temporary.write_text(text, encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def read_pages(checks_dir: Path, state: dict, jobs: int) -> tuple[dict[str, dict], dict, set[str]]:
+    """Return the parsed record of every page, the new state and the reparsed slugs."""
+    pages = sorted(checks_dir.glob("*.html"))
+    new_state: dict[str, dict] = {}
+    records: dict[str, dict] = {}
+    todo: list[tuple[str, str | None]] = []
+    stats = {}
+
+    for page in pages:
+        stat = page.stat()
+        stats[str(page)] = stat
+        known = state.get(page.name)
+        if known and known.get("mtime_ns") == stat.st_mtime_ns and known.get("size") == stat.st_size:
+            new_state[page.name] = known
+            records[page.stem] = known["record"]
+        else:
+            todo.append((str(page), known.get("sha256") if known else None))
+
+    if len(todo) >= PARALLEL_THRESHOLD and jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(
+                pool.map(_parse_page, *zip(*todo), chunksize=max(1, len(todo) // (jobs * 4)))
+            )
+    else:
+        results = [_parse_page(path, digest) for path, digest in todo]
+
+    parsed = set()
+    for path, digest, record in results:
+        page = Path(path)
+        if record is None:
+            record = state[page.name]["record"]
+        else:
+            parsed.add(page.stem)
+        stat = stats[path]
+        new_state[page.name] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "record": record,
+        }
+        records[page.stem] = record
+    return records, new_state, parsed
+
+
+def build_record(slug: str, page: dict, entry: dict, generator) -> dict:
+    """Turn a parsed page and its manifest entry into a ``CHECKS`` definition."""
+    level = str(entry.get("level") or page["level"])
+    record = {
+        "slug": slug,
+        "identifier": str(entry.get("id") or page["identifier"]),
+        "title_fr": page["title_fr"] or str(entry.get("title_fr", "")),
+        "title_en": page["title_en"] or str(entry.get("title_en", "")),
+        "level": level,
+        "overview_fr": page["overview_fr"],
+        "overview_en": page["overview_en"],
+        "remediation_fr": page["remediation_fr"],
+        "remediation_en": page["remediation_en"],
+        "script": str(entry.get("script") or "N/A"),
+    }
+    default_status = generator.STATUS_LABELS.get(level, {"fr": level, "en": level})
+    for lang in ("fr", "en"):
+        status = page[f"status_{lang}"]
+        if status and status != default_status[lang]:
+            record[f"status_{lang}"] = status
+    record.update({name: page[name] for name in RICH_FIELDS if page[name]})
+    return record
+
+
+def round_trip_losses(record: dict, page: dict, generator) -> list[str]:
+    """Fields of ``page`` that re-rendering ``record`` would not give back."""
+    rendered = parse_detail_page(generator.render_detail(generator.build_payload(record)))
+    return [
+        name
+        for name in COMPARED_FIELDS + RICH_FIELDS
+        if name in rendered and page[name] and rendered[name] != page[name]
+    ]
+
+
+def sync(root: Path, generator, jobs: int, state_path: Path) -> tuple[SyncReport, dict, dict]:
+    started = time.perf_counter()
+    manifest = _load_json(root / "manifest.json", [])
+    entries = {
+        Path(str(entry["file"])).stem: entry
+        for entry in manifest
+        if isinstance(entry, dict) and entry.get("file")
+    }
+    state = _load_json(state_path, {})
+    pages, new_state, parsed = read_pages(root / "checks", state, jobs)
+
+    literal = {check["slug"]: generator.build_payload(check) for check in generator.CHECKS}
+    current = {
+        check["slug"]: generator.build_payload(check)
+        for check in generator.load_checks(root / CATALOGUE_NAME)
+    }
+    report = SyncReport(pages=len(pages), parsed=len(parsed), unchanged=len(pages) - len(parsed))
+    overrides = []
+    for slug, page in sorted(pages.items()):
+        record = build_record(slug, page, entries.get(slug, {}), generator)
+        payload = generator.build_payload(record)
+        if literal.get(slug) != payload:
+            overrides.append(record)
+
+        before = current.get(slug)
+        if before is None:
+            report.added.append(slug)
+        else:
+            diffs = [
+                (name, str(before.get(name, "")), str(payload.get(name, "")))
+                for name in COMPARED_FIELDS + RICH_FIELDS
+                if before.get(name, "") != payload.get(name, "")
+            ]
+            if diffs:
+                report.changed[slug] = diffs
+        if slug in parsed or slug in report.changed or before is None:
+            losses = round_trip_losses(record, page, generator)
+            if losses:
+                report.lossy[slug] = losses
+
+    report.removed = sorted(set(current) - set(pages))
+    catalogue = {"checks": overrides, "removed": sorted(set(literal) - set(pages))}
+    report.seconds = time.perf_counter() - started
+    return report, catalogue, new_state
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "sync", help="import admin-edited checks/*.html into catalogue.json"
+    )
+    parser.add_argument("--root", type=Path, default=Path("."), help="directory of manifest.json and checks/")
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1, help="parser processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only report the differences; exit with status 1 if the catalogue is out of date",
+    )
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    sys.path.insert(0, str(args.root.resolve()))
+    generator = importlib.import_module("generate_checks_docs")
+    state_path = args.root / STATE_PATH
+    report, catalogue, state = sync(args.root, generator, args.jobs, state_path)
+    print(report.format())
+    _write_atomically(state_path, json.dumps(state, ensure_ascii=False))
+    if args.check:
+        return 1 if report.has_diffs else 0
+    if report.has_diffs or not (args.root / CATALOGUE_NAME).is_file():
+        _write_atomically(
+            args.root / CATALOGUE_NAME,
+            json.dumps(catalogue, indent=2, ensure_ascii=False) + "\n",
+        )
+    return 0
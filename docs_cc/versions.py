@@ -0,0 +1,233 @@
+"""Multi-version documentation built into a content-addressed store.
+
+Each MAESTRIA release is described by a catalogue overlay in
+``releases/<version>.json``, in the format ``docs-cc sync`` writes
+(``{"checks": [...], "removed": [...]}`` applied on top of ``CHECKS``).
+``python -m docs_cc versions`` renders every release into
+``OUTPUT/.store/objects/<hash[:2]>/<hash>``, where a file is named by the
+SHA-256 of its bytes, and materializes ``OUTPUT/<version>/`` with hardlinks to
+the blobs (or only writes ``OUTPUT/<version>/paths.json`` mapping each path to
+its hash with ``--link map``).
+
+``OUTPUT/.store/renders.json`` remembers which blob a given input (payload,
+neighbours and generator source) produced, so a page shared by several
+releases is rendered once, and a new release only renders its changed checks.
+Blobs no version refers to any more are removed at the end of the build.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import sys
+import uuid
+
+STORE_DIR = ".store"
+RENDERS_NAME = "renders.json"
+PATHS_NAME = "paths.json"
+STATIC_FILES = ("index.html", "assets/css/style.css", "assets/js/script.js")
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _neighbour_key(neighbour: dict | None) -> list | None:
+    return neighbour and [neighbour["slug"], neighbour["title_fr"], neighbour["title_en"]]
+
+
+class BlobStore:
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.objects = directory / "objects"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.renders_path = directory / RENDERS_NAME
+        try:
+            self.renders: dict[str, str] = json.loads(self.renders_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.renders = {}
+        self.written = 0
+
+    def path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest
+
+    def put(self, data: bytes) -> str:
+        digest = _digest(data)
+        path = self.path(digest)
+        if not path.is_file():
+            path.parent.mkdir(exist_ok=True)
+            temporary = path.with_name(f".{digest}.{uuid.uuid4().hex}.tmp")
+            temporary.write_bytes(data)
+            os.replace(temporary, path)
+            self.written += 1
+        return digest
+
+    def render(self, key_parts: list, render) -> tuple[str, bool]:
+        """Blob of ``render()``, reusing the blob of an identical earlier input."""
+        key = _digest(json.dumps(key_parts, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+        digest = self.renders.get(key)
+        if digest and self.path(digest).is_file():
+            return digest, False
+        digest = self.put(render().encode("utf-8"))
+        self.renders[key] = digest
+        return digest, True
+
+    def prune(self, referenced: set[str]) -> int:
+        removed = 0
+        for path in self.objects.glob("*/*"):
+            if path.name not in referenced and not path.name.startswith("."):
+                path.unlink()
+                removed += 1
+        self.renders = {key: digest for key, digest in self.renders.items() if digest in referenced}
+        return removed
+
+    def save(self) -> None:
+        temporary = self.renders_path.with_name(f".{RENDERS_NAME}.{uuid.uuid4().hex}.tmp")
+        temporary.write_text(json.dumps(self.renders, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, self.renders_path)
+
+
+def render_release(generator, overlay: Path, store: BlobStore, source_key: str) -> tuple[dict[str, str], int]:
+    """Map every output path of one release to its blob; return the render count."""
+    payloads = [generator.build_payload(check) for check in generator.load_checks(overlay)]
+    neighbours = generator.compute_neighbours(payloads)
+    paths: dict[str, str] = {}
+    rendered = 0
+    for payload in payloads:
+        slug = payload["slug"]
+        previous, following = neighbours[slug]
+        key = [source_key, payload, _neighbour_key(previous), _neighbour_key(following)]
+        outputs = {
+            f"checks/{slug}.html": lambda: generator.render_detail(payload, previous, following),
+            f"checks/{slug}.json": lambda: json.dumps(
+                generator.build_fragment(payload, previous, following),
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            + "\n",
+        }
+        for path, render in outputs.items():
+            paths[path], fresh = store.render([path, *key], render)
+            rendered += fresh
+
+    manifest = [generator.build_manifest_entry(payload) for payload in payloads]
+    paths["manifest.json"] = store.put(
+        (json.dumps(manifest, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    )
+    return paths, rendered
+
+
+def materialize(tree: Path, paths: dict[str, str], store: BlobStore, link: str) -> int:
+    """Point ``tree`` at the blobs of ``paths``; return the number of files changed."""
+    tree.mkdir(parents=True, exist_ok=True)
+    (tree / PATHS_NAME).write_text(json.dumps(paths, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if link == "map":
+        return 0
+
+    changed = 0
+    for relative, digest in paths.items():
+        blob = store.path(digest)
+        target = tree / relative
+        try:
+            if os.path.samefile(blob, target):
+                continue
+        except OSError:
+            pass
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            os.link(blob, temporary)
+        except OSError:  # other filesystem, or no hardlink support
+            shutil.copyfile(blob, temporary)
+        os.replace(temporary, target)
+        changed += 1
+
+    wanted = {tree / relative for relative in paths} | {tree / PATHS_NAME}
+    for path in sorted(tree.rglob("*"), reverse=True):
+        if path.is_file() and path not in wanted:
+            path.unlink()
+        elif path.is_dir() and not any(path.iterdir()):
+            path.rmdir()
+    return changed
+
+
+@dataclass
+class VersionsReport:
+    versions: int = 0
+    files: int = 0
+    rendered: int = 0
+    reused: int = 0
+    blobs: int = 0
+    blobs_written: int = 0
+    blobs_pruned: int = 0
+    linked: int = 0
+
+    def format(self) -> str:
+        return (
+            f"versions: {self.versions} release(s), {self.files} file(s) from {self.blobs} blob(s); "
+            f"{self.rendered} page(s) rendered, {self.reused} reused; "
+            f"{self.blobs_written} blob(s) written, {self.blobs_pruned} pruned, {self.linked} link(s) updated"
+        )
+
+
+def build_versions(root: Path, releases: Path, output: Path, link: str, generator) -> VersionsReport:
+    store = BlobStore(output / STORE_DIR)
+    source_key = _digest(Path(generator.__file__).read_bytes())
+    static = {
+        relative: store.put((root / relative).read_bytes())
+        for relative in STATIC_FILES
+        if (root / relative).is_file()
+    }
+
+    report = VersionsReport()
+    referenced: set[str] = set()
+    for overlay in sorted(releases.glob("*.json")):
+        paths, rendered = render_release(generator, overlay, store, source_key)
+        paths.update(static)
+        report.versions += 1
+        report.files += len(paths)
+        report.rendered += rendered
+        report.reused += sum(path.startswith("checks/") for path in paths) - rendered
+        report.linked += materialize(output / overlay.stem, paths, store, link)
+        referenced.update(paths.values())
+
+    report.blobs = len(referenced)
+    report.blobs_written = store.written
+    report.blobs_pruned = store.prune(referenced)
+    store.save()
+    return report
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "versions", help="build several releases into a shared content-addressed store"
+    )
+    parser.add_argument("--root", type=Path, default=Path("."), help="directory of generate_checks_docs.py and assets/")
+    parser.add_argument(
+        "--releases",
+        type=Path,
+        default=Path("releases"),
+        help="directory of <version>.json catalogue overlays (default: releases/)",
+    )
+    parser.add_argument("--output", type=Path, default=Path("site"), help="output directory (default: site/)")
+    parser.add_argument(
+        "--link",
+        choices=("hardlink", "map"),
+        default="hardlink",
+        help="materialize version trees with hardlinks, or only write paths.json",
+    )
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    if not args.releases.is_dir():
+        raise SystemExit(f"{args.releases}: no such directory")
+    sys.path.insert(0, str(args.root.resolve()))
+    generator = importlib.import_module("generate_checks_docs")
+    print(build_versions(args.root, args.releases, args.output, args.link, generator).format())
+    return 0
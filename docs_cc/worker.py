@@ -0,0 +1,367 @@
+"""Incremental rebuild of derived artifacts after admin saves.
+
+``admin/index.php`` drops one JSON job per save in ``.queue/pending/`` naming
+the pages it wrote (and the ones a rename removed). The worker waits until a
+burst of saves has settled, compacts the manifest journal the saves left
+behind (see :mod:`docs_cc.journal`), claims every pending job at once and
+rebuilds only what those pages affect:
+
+* the ``checks/<slug>.json`` fragment of each saved page;
+* the prev/next navigation and prefetch hints of every page whose neighbours
+  changed in the reading order (level or identifier edits move checks around);
+* ``checks/<lang>/<slug>.html`` when split-language pages were generated;
+* the rows of those checks in ``catalogue.sqlite3``, when the index exists;
+* ``manifest.version.json``, its delta files and the title order, when the
+  manifest changed since they were written.
+
+Page content is read back from the HTML the admin wrote, never from the
+generator's ``CHECKS`` literal, so admin edits survive. Progress is written to
+``.queue/status.json``, which the admin polls.
+
+The rest of the build (``dashboard.html``, the ``--bundle`` file, minified and
+critical-CSS pages) is left as it is: run ``generate_checks_docs.py`` again to
+refresh it.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+import argparse
+import importlib
+import json
+import os
+import re
+import sys
+import time
+import uuid
+
+from docs_cc.journal import JOURNAL_SUFFIX, compact_manifest, journal_pending
+from docs_cc.manifest_versions import VERSION_NAME, manifest_version, write_manifest_versions
+from docs_cc.pages import RICH_FIELDS, parse_detail_page
+from docs_cc.query import SEARCH_DB_PATH, update_search_db
+
+QUEUE_DIR = Path(".queue")
+STATUS_NAME = "status.json"
+STATE_NAME = "neighbours.json"
+DEFAULT_INTERVAL = 1.0
+DEFAULT_SETTLE = 0.5
+
+_PAGER_RE = re.compile(r'\s*<nav class="check-pager">.*?</nav>', re.S)
+_PAGER_ANCHOR_RE = re.compile(r'(\s*<a class="return-button")')
+_PREFETCH_RE = re.compile(r'\s*<link rel="prefetch" href="[^"]*"\s*/?>')
+_HEAD_END_RE = re.compile(r"(\s*</head>)")
+
+
+def _write_atomically(path: Path, text: str) -> None:
+    temporary = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    temporary.write_text(text, encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except FileNotFoundError:
+        pass
+    _write_atomically(path, text)
+    return True
+
+
+class RebuildQueue:
+    """Directory of JSON jobs: ``pending/`` → ``processing/`` → deleted."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.pending_dir = directory / "pending"
+        self.processing_dir = directory / "processing"
+        self.status_path = directory / STATUS_NAME
+        self.state_path = directory / STATE_NAME
+        for path in (self.pending_dir, self.processing_dir):
+            path.mkdir(parents=True, exist_ok=True)
+
+    def pending(self) -> list[Path]:
+        return sorted(self.pending_dir.glob("*.json"))
+
+    def enqueue(self, files: Sequence[str], removed: Sequence[str] = ()) -> Path:
+        job = {"files": list(files), "removed": list(removed), "queued_at": time.time()}
+        path = self.pending_dir / f"{time.time_ns()}-{uuid.uuid4().hex[:8]}.json"
+        _write_atomically(path, json.dumps(job))
+        return path
+
+    def claim(self) -> tuple[list[Path], list[dict]]:
+        claimed, jobs = [], []
+        for path in self.pending():
+            target = self.processing_dir / path.name
+            try:
+                os.replace(path, target)
+            except FileNotFoundError:
+                continue  # claimed by another worker
+            claimed.append(target)
+            try:
+                job = json.loads(target.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if isinstance(job, dict):
+                jobs.append(job)
+        return claimed, jobs
+
+    def release(self, claimed: list[Path]) -> None:
+        for path in claimed:
+            path.unlink(missing_ok=True)
+
+    def load_state(self) -> dict:
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def save_state(self, state: dict) -> None:
+        _write_atomically(self.state_path, json.dumps(state, ensure_ascii=False))
+
+    def write_status(self, status: dict) -> None:
+        status = {**status, "pending": len(self.pending()), "updated_at": time.time()}
+        _write_atomically(self.status_path, json.dumps(status, ensure_ascii=False))
+
+
+@dataclass
+class RebuildResult:
+    jobs: int = 0
+    files: list[str] = field(default_factory=list)
+    rebuilt: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    written: int = 0
+    indexed: int = 0
+    version: str | None = None
+    seconds: float = 0.0
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "jobs": self.jobs,
+            "files": self.files,
+            "rebuilt": self.rebuilt,
+            "removed": self.removed,
+            "written": self.written,
+            "indexed": self.indexed,
+            "version": self.version,
+            "seconds": round(self.seconds, 3),
+            "error": self.error,
+        }
+
+
+def _neighbour_key(previous: dict | None, following: dict | None) -> list:
+    return [
+        [neighbour["slug"], neighbour["title_fr"], neighbour["title_en"]] if neighbour else None
+        for neighbour in (previous, following)
+    ]
+
+
+def update_navigation(markup: str, previous: dict | None, following: dict | None, generator) -> str:
+    """Replace the pager and prefetch hints of a bilingual detail page."""
+    markup = _PREFETCH_RE.sub("", markup)
+    prefetch = generator.render_prefetch_links(previous, following)
+    if prefetch:
+        markup = _HEAD_END_RE.sub(lambda match: prefetch + match.group(1), markup, count=1)
+
+    pager = generator.render_pager(previous, following)
+    if _PAGER_RE.search(markup):
+        return _PAGER_RE.sub(lambda match: pager, markup, count=1)
+    return _PAGER_ANCHOR_RE.sub(lambda match: pager + match.group(1), markup, count=1)
+
+
+def rebuild(
+    root: Path,
+    files: set[str],
+    removed: set[str],
+    previous_state: dict,
+    generator,
+) -> tuple[RebuildResult, dict]:
+    """Rebuild the artifacts affected by ``files``; return the new neighbour state."""
+    started = time.perf_counter()
+    checks_dir = root / "checks"
+    manifest_data = (root / "manifest.json").read_bytes()
+    manifest = json.loads(manifest_data)
+    entries = {
+        Path(str(entry["file"])).stem: entry
+        for entry in manifest
+        if isinstance(entry, dict) and entry.get("file")
+    }
+    neighbours = generator.compute_neighbours(
+        [
+            {
+                "slug": slug,
+                "identifier": str(entry.get("id", "")),
+                "level": str(entry.get("level", "")),
+                "title_fr": str(entry.get("title_fr", "")),
+                "title_en": str(entry.get("title_en", "")),
+            }
+            for slug, entry in entries.items()
+        ]
+    )
+    state = {slug: _neighbour_key(*pair) for slug, pair in neighbours.items()}
+
+    saved = {Path(name).stem for name in files}
+    affected = (saved | {slug for slug, key in state.items() if previous_state.get(slug) != key}) & set(entries)
+    localized_dirs = [checks_dir / lang for lang in generator.UI_LABELS if (checks_dir / lang).is_dir()]
+
+    result = RebuildResult(files=sorted(files))
+    payloads = []
+    for slug in sorted(affected):
+        page = checks_dir / f"{slug}.html"
+        if not page.is_file():
+            continue
+        markup = page.read_text(encoding="utf-8")
+        record = parse_detail_page(markup)
+        entry = entries[slug]
+        payload = generator.build_payload(
+            {
+                "slug": slug,
+                "identifier": str(entry.get("id") or record["identifier"]),
+                "level": str(entry.get("level") or record["level"]),
+                "title_fr": str(entry.get("title_fr") or record["title_fr"]),
+                "title_en": str(entry.get("title_en") or record["title_en"]),
+                "overview_fr": record["overview_fr"],
+                "overview_en": record["overview_en"],
+                "remediation_fr": record["remediation_fr"],
+                "remediation_en": record["remediation_en"],
+                "script": str(entry.get("script") or "N/A"),
+                **{name: record[name] for name in RICH_FIELDS if record[name]},
+            }
+        )
+        payloads.append(payload)
+        previous, following = neighbours[slug]
+
+        fragment = generator.build_fragment(payload, previous, following)
+        outputs = [
+            (
+                checks_dir / f"{slug}.json",
+                json.dumps(fragment, ensure_ascii=False, separators=(",", ":")) + "\n",
+            ),
+            (page, update_navigation(markup, previous, following, generator)),
+        ]
+        outputs.extend(
+            (
+                directory / f"{slug}.html",
+                generator.render_localized_detail(payload, directory.name, previous, following),
+            )
+            for directory in localized_dirs
+        )
+        result.written += sum(_write_if_changed(path, text) for path, text in outputs)
+        result.rebuilt.append(slug)
+
+    for slug in sorted({Path(name).stem for name in removed} - set(entries)):
+        stale = [checks_dir / f"{slug}.json"] + [directory / f"{slug}.html" for directory in localized_dirs]
+        for path in stale:
+            if path.is_file():
+                path.unlink()
+        result.removed.append(slug)
+
+    search_db = root / SEARCH_DB_PATH
+    if search_db.is_file():
+        result.indexed = update_search_db(search_db, payloads, result.removed)
+
+    # A compaction by a PHP without intl publishes no order: fill it in.
+    try:
+        info = json.loads((root / VERSION_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        info = {}
+    if not isinstance(info, dict) or info.get("version") != manifest_version(manifest_data) or not info.get("order"):
+        result.version = write_manifest_versions(root).version
+
+    result.seconds = time.perf_counter() - started
+    return result, state
+
+
+def process_pending(queue: RebuildQueue, root: Path, generator, full: bool = False) -> RebuildResult | None:
+    claimed, jobs = queue.claim()
+    if not claimed and not full:
+        return None
+
+    files = {str(name) for job in jobs for name in job.get("files", [])}
+    removed = {str(name) for job in jobs for name in job.get("removed", [])}
+    queue.write_status({"state": "running", "files": sorted(files)})
+    try:
+        result, state = rebuild(root, files, removed, {} if full else queue.load_state(), generator)
+        queue.save_state(state)
+    except Exception as error:  # reported to the admin through status.json
+        result = RebuildResult(files=sorted(files), error=f"{type(error).__name__}: {error}")
+    finally:
+        queue.release(claimed)
+    result.jobs = len(claimed)
+    queue.write_status({"state": "idle", "last_run": result.to_dict(), "finished_at": time.time()})
+    return result
+
+
+def run_worker(
+    root: Path,
+    queue: RebuildQueue,
+    once: bool = False,
+    full: bool = False,
+    interval: float = DEFAULT_INTERVAL,
+    settle: float = DEFAULT_SETTLE,
+) -> int:
+    sys.path.insert(0, str(root.resolve()))
+    generator = importlib.import_module("generate_checks_docs")
+    try:
+        last_run = json.loads(queue.status_path.read_text(encoding="utf-8")).get("last_run")
+    except (OSError, ValueError, AttributeError):
+        last_run = None
+
+    journal = root / f"manifest.json{JOURNAL_SUFFIX}"
+    while True:
+        pending = queue.pending()
+        newest = max((path.stat().st_mtime for path in pending), default=0.0)
+        if journal_pending(root):
+            newest = max(newest, journal.stat().st_mtime)
+        settled = once or time.time() - newest >= settle
+        if settled and journal_pending(root):
+            try:
+                applied = compact_manifest(root)
+            except (OSError, ValueError) as error:
+                print(f"worker: manifest not compacted: {error}", file=sys.stderr)
+            else:
+                print(f"worker: {applied} manifest operation(s) compacted")
+        if (pending or full) and settled:
+            result = process_pending(queue, root, generator, full)
+            full = False
+            if result is not None:
+                last_run = result.to_dict()
+                print(
+                    f"worker: {result.jobs} job(s), {len(result.rebuilt)} page(s) rebuilt, "
+                    f"{result.written} file(s) written in {result.seconds:.2f}s"
+                    + (f" - {result.error}" if result.error else "")
+                )
+        else:
+            queue.write_status({"state": "idle", "last_run": last_run})
+        if once:
+            return 0
+        time.sleep(interval)
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "worker", help="rebuild fragments and navigation queued by admin saves"
+    )
+    parser.add_argument("--root", type=Path, default=Path("."), help="directory of manifest.json and checks/")
+    parser.add_argument("--queue", type=Path, help="queue directory (default: ROOT/.queue)")
+    parser.add_argument("--once", action="store_true", help="process pending jobs and exit")
+    parser.add_argument("--full", action="store_true", help="rebuild every page once, then follow the queue")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between polls")
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=DEFAULT_SETTLE,
+        help="wait until the newest job is this old so rapid saves are coalesced",
+    )
+    parser.set_defaults(handler=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    queue = RebuildQueue(args.queue or args.root / QUEUE_DIR)
+    try:
+        return run_worker(args.root, queue, args.once, args.full, args.interval, args.settle)
+    except KeyboardInterrupt:
+        return 0
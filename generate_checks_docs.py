@@ -1,10 +1,27 @@
 from __future__ import annotations
 
 from pathlib import Path
+import argparse
+import html
 import json
 
+from docs_cc.bundle import BUNDLE_PATH, write_bundle
+from docs_cc.critical_css import apply_critical_css, strip_inlined_css
+from docs_cc.dashboard import DEFAULT_TOP, write_dashboard
+from docs_cc.manifest_versions import (
+    DEFAULT_HISTORY,
+    compute_order,
+    dump_manifest,
+    write_manifest_versions,
+)
+from docs_cc.minify import apply_minification, use_minified_assets
+from docs_cc.query import SEARCH_DB_PATH, write_search_db
+
 OUTPUT_DIR = Path('checks')
-OUTPUT_DIR.mkdir(exist_ok=True)
+INDEX_PATH = Path('index.html')
+STYLESHEET_PATH = Path('assets') / 'css' / 'style.css'
+SCRIPT_PATH = Path('assets') / 'js' / 'script.js'
+CATALOGUE_PATH = Path('catalogue.json')
 
 TEMPLATE = """<!DOCTYPE html>
 <html lang=\"fr\">
@@ -12,7 +29,7 @@ TEMPLATE = """<!DOCTYPE html>
     <meta charset=\"utf-8\" />
     <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\" />
     <title>{title_fr} · Consistency Checker</title>
-    <link rel=\"stylesheet\" href=\"../assets/css/style.css\" />
+    <link rel=\"stylesheet\" href=\"../assets/css/style.css\" />{prefetch_links}
   </head>
   <body data-page=\"detail\">
     <header class=\"primary-header\" role=\"banner\">
@@ -31,48 +48,48 @@ TEMPLATE = """<!DOCTYPE html>
       </div>
     </header>
     <main>
-      <h1 class=\"page-title\" data-fr=\"{title_fr}\" data-en=\"{title_en}\"></h1>
+      <h1 class=\"page-title\" data-fr=\"{title_fr}\" data-en=\"{title_en}\">{title_fr}</h1>
       <table class=\"info-table\">
         <tbody>
           <tr>
-            <th data-fr=\"Identifiant\" data-en=\"Identifier\"></th>
+            <th data-fr=\"Identifiant\" data-en=\"Identifier\">Identifiant</th>
             <td>{identifier}</td>
           </tr>
           <tr>
-            <th data-fr=\"Niveau de criticité\" data-en=\"Criticality level\"></th>
+            <th data-fr=\"Niveau de criticité\" data-en=\"Criticality level\">Niveau de criticité</th>
             <td><span class=\"level-pill level-{level}\">{level}</span></td>
           </tr>
           <tr>
-            <th data-fr=\"Statut en cas d'échec\" data-en=\"Status if failed\"></th>
+            <th data-fr=\"Statut en cas d'échec\" data-en=\"Status if failed\">Statut en cas d'échec</th>
             <td data-fr=\"{status_fr}\" data-en=\"{status_en}\">{status_fr}</td>
           </tr>
         </tbody>
       </table>
       <section class=\"content-section\">
-        <h2 data-fr=\"Explications\" data-en=\"Overview\"></h2>
-        <p data-fr=\"{overview_fr}\" data-en=\"{overview_en}\"></p>
+        <h2 data-fr=\"Explications\" data-en=\"Overview\">Explications</h2>
+        {overview_block}
       </section>
       <section class=\"content-section\">
-        <h2 data-fr=\"Résolution\" data-en=\"Remediation\"></h2>
-        <p data-fr=\"{remediation_fr}\" data-en=\"{remediation_en}\"></p>
-      </section>
-      <a class=\"return-button\" href=\"../index.html\" data-fr=\"Retour à la liste\" data-en=\"Back to list\"></a>
+        <h2 data-fr=\"Résolution\" data-en=\"Remediation\">Résolution</h2>
+        {remediation_block}
+      </section>{pager}
+      <a class=\"return-button\" href=\"../index.html\" data-fr=\"Retour à la liste\" data-en=\"Back to list\">Retour à la liste</a>
     </main>
     <footer class=\"primary-footer\">
       <div class=\"footer-brand\">MAESTRIA</div>
       <div class=\"footer-links\">
         <div class=\"footer-column\">
-          <h3 data-fr=\"Support\" data-en=\"Support\"></h3>
+          <h3 data-fr=\"Support\" data-en=\"Support\">Support</h3>
           <ul>
-            <li><span data-fr=\"Centre de services\" data-en=\"Service desk\"></span></li>
-            <li><span data-fr=\"Documentation technique\" data-en=\"Technical documentation\"></span></li>
+            <li><span data-fr=\"Centre de services\" data-en=\"Service desk\">Centre de services</span></li>
+            <li><span data-fr=\"Documentation technique\" data-en=\"Technical documentation\">Documentation technique</span></li>
           </ul>
         </div>
         <div class=\"footer-column\">
-          <h3 data-fr=\"Mentions\" data-en=\"Legal\"></h3>
+          <h3 data-fr=\"Mentions\" data-en=\"Legal\">Mentions</h3>
           <ul>
-            <li><span data-fr=\"Mentions légales\" data-en=\"Legal notice\"></span></li>
-            <li><span data-fr=\"Politique de confidentialité\" data-en=\"Privacy policy\"></span></li>
+            <li><span data-fr=\"Mentions légales\" data-en=\"Legal notice\">Mentions légales</span></li>
+            <li><span data-fr=\"Politique de confidentialité\" data-en=\"Privacy policy\">Politique de confidentialité</span></li>
           </ul>
         </div>
       </div>
@@ -82,6 +99,125 @@ TEMPLATE = """<!DOCTYPE html>
 </html>
 """
 
+# Single-language variant of TEMPLATE used for checks/<lang>/<slug>.html. The text is
+# rendered inline and the language switch is a plain link to the sibling page.
+LOCALIZED_TEMPLATE = """<!DOCTYPE html>
+<html lang=\"{lang}\">
+  <head>
+    <meta charset=\"utf-8\" />
+    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\" />
+    <title>{title} · Consistency Checker</title>
+    <link rel=\"alternate\" hreflang=\"{other_lang}\" href=\"../{other_lang}/{slug}.html\" />
+    <link rel=\"stylesheet\" href=\"../../assets/css/style.css\" />{prefetch_links}
+  </head>
+  <body data-page=\"detail\" data-static-lang=\"{lang}\">
+    <header class=\"primary-header\" role=\"banner\">
+      <div class=\"header-content\">
+        <a class=\"brand\" href=\"../../index.html\">
+          <span class=\"brand-title\">Centre MAESTRIA</span>
+          <span class=\"brand-subtitle\">Consistency Checker</span>
+        </a>
+        <a\n          class=\"language-switch\"\n          href=\"../{other_lang}/{slug}.html\"\n          hreflang=\"{other_lang}\"\n          data-language-link=\"{other_lang}\"\n          data-active-lang=\"{lang}\"\n          aria-label=\"{switch_label}\"\n          title=\"{switch_label}\"\n        >
+          <span class=\"language-switch-track\">
+            <span class=\"language-switch-option language-switch-option--fr\">FR</span>
+            <span class=\"language-switch-option language-switch-option--en\">EN</span>
+            <span class=\"language-switch-thumb\" aria-hidden=\"true\"></span>
+          </span>
+        </a>
+      </div>
+    </header>
+    <main>
+      <h1 class=\"page-title\">{title}</h1>
+      <table class=\"info-table\">
+        <tbody>
+          <tr>
+            <th>{label_identifier}</th>
+            <td>{identifier}</td>
+          </tr>
+          <tr>
+            <th>{label_level}</th>
+            <td><span class=\"level-pill level-{level}\">{level}</span></td>
+          </tr>
+          <tr>
+            <th>{label_status}</th>
+            <td>{status}</td>
+          </tr>
+        </tbody>
+      </table>
+      <section class=\"content-section\">
+        <h2>{label_overview}</h2>
+        {overview_block}
+      </section>
+      <section class=\"content-section\">
+        <h2>{label_remediation}</h2>
+        {remediation_block}
+      </section>{pager}
+      <a class=\"return-button\" href=\"../../index.html\">{label_back}</a>
+    </main>
+    <footer class=\"primary-footer\">
+      <div class=\"footer-brand\">MAESTRIA</div>
+      <div class=\"footer-links\">
+        <div class=\"footer-column\">
+          <h3>{label_support}</h3>
+          <ul>
+            <li><span>{label_service_desk}</span></li>
+            <li><span>{label_technical_docs}</span></li>
+          </ul>
+        </div>
+        <div class=\"footer-column\">
+          <h3>{label_legal}</h3>
+          <ul>
+            <li><span>{label_legal_notice}</span></li>
+            <li><span>{label_privacy}</span></li>
+          </ul>
+        </div>
+      </div>
+    </footer>
+    <script src=\"../../assets/js/script.js\"></script>
+  </body>
+</html>
+"""
+
+UI_LABELS = {
+    "fr": {
+        "switch_label": "Passer l'interface en anglais",
+        "label_identifier": "Identifiant",
+        "label_level": "Niveau de criticité",
+        "label_status": "Statut en cas d'échec",
+        "label_overview": "Explications",
+        "label_remediation": "Résolution",
+        "label_back": "Retour à la liste",
+        "label_previous": "Contrôle précédent",
+        "label_next": "Contrôle suivant",
+        "label_support": "Support",
+        "label_service_desk": "Centre de services",
+        "label_technical_docs": "Documentation technique",
+        "label_legal": "Mentions",
+        "label_legal_notice": "Mentions légales",
+        "label_privacy": "Politique de confidentialité",
+    },
+    "en": {
+        "switch_label": "Switch interface to French",
+        "label_identifier": "Identifier",
+        "label_level": "Criticality level",
+        "label_status": "Status if failed",
+        "label_overview": "Overview",
+        "label_remediation": "Remediation",
+        "label_back": "Back to list",
+        "label_previous": "Previous check",
+        "label_next": "Next check",
+        "label_support": "Support",
+        "label_service_desk": "Service desk",
+        "label_technical_docs": "Technical documentation",
+        "label_legal": "Legal",
+        "label_legal_notice": "Legal notice",
+        "label_privacy": "Privacy policy",
+    },
+}
+
+# Reading order of the detail pages: by criticality, then by identifier.
+LEVEL_ORDER = ["FATAL_ERROR", "ERROR", "WARNING", "INFORMATION"]
+
 STATUS_LABELS = {
     "FATAL_ERROR": {
         "fr": "Blocage critique (FATAL_ERROR)",
@@ -1163,42 +1299,349 @@ CHECKS = [
     },
 ]
 
-if not CHECKS:
-    raise SystemExit("No checks defined")
 
-manifest_entries = []
+def load_checks(path: Path = CATALOGUE_PATH) -> list[dict]:
+    """Return ``CHECKS`` with the admin edits imported by ``python -m docs_cc sync``."""
+    try:
+        synced = json.loads(path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return list(CHECKS)
+    removed = set(synced.get("removed", []))
+    records = {record["slug"]: record for record in synced.get("checks", [])}
+    checks = [
+        records.pop(check["slug"], check) for check in CHECKS if check["slug"] not in removed
+    ]
+    return checks + list(records.values())
 
-for index, check in enumerate(CHECKS, start=1):
-    slug = check['slug']
-    path = OUTPUT_DIR / f"{slug}.html"
+
+def build_payload(check: dict) -> dict:
+    """Merge a check definition with its status labels and resolved script."""
+    slug = check["slug"]
     level = check["level"]
     status = STATUS_LABELS.get(level, {"fr": level, "en": level})
     script_name = check.get("script", "N/A")
     if script_name == "N/A":
         script_name = SCRIPT_FILES.get(slug, "N/A")
-    payload = {
+    return {
         **check,
         "status_fr": check.get("status_fr", status["fr"]),
         "status_en": check.get("status_en", status["en"]),
         "script": script_name,
     }
-    html = TEMPLATE.format(**payload)
-    path.write_text(html, encoding='utf-8')
 
-    manifest_entries.append(
-        {
-            "id": check["identifier"],
-            "script": script_name,
-            "level": check["level"],
-            "title_fr": check["title_fr"],
-            "title_en": check["title_en"],
-            "description_fr": check["overview_fr"],
-            "description_en": check["overview_en"],
-            "file": f"checks/{slug}.html",
-        }
+
+def build_manifest_entry(payload: dict) -> dict:
+    return {
+        "id": payload["identifier"],
+        "script": payload["script"],
+        "level": payload["level"],
+        "title_fr": payload["title_fr"],
+        "title_en": payload["title_en"],
+        "description_fr": payload["overview_fr"],
+        "description_en": payload["overview_en"],
+        "file": f"checks/{payload['slug']}.html",
+    }
+
+
+def reading_order_key(payload: dict) -> tuple[int, str]:
+    level = payload["level"]
+    rank = LEVEL_ORDER.index(level) if level in LEVEL_ORDER else len(LEVEL_ORDER)
+    return rank, payload["identifier"]
+
+
+def compute_neighbours(payloads: list[dict]) -> dict[str, tuple[dict | None, dict | None]]:
+    """Map each slug to its previous and next check in reading order."""
+    ordered = sorted(payloads, key=reading_order_key)
+    neighbours = {}
+    for index, payload in enumerate(ordered):
+        previous = ordered[index - 1] if index > 0 else None
+        following = ordered[index + 1] if index + 1 < len(ordered) else None
+        neighbours[payload["slug"]] = (previous, following)
+    return neighbours
+
+
+def render_prefetch_links(previous: dict | None, following: dict | None) -> str:
+    return "".join(
+        f'\n    <link rel="prefetch" href="{neighbour["slug"]}.html" />'
+        for neighbour in (previous, following)
+        if neighbour is not None
     )
 
-manifest_path = Path('manifest.json')
-manifest_path.write_text(
-    json.dumps(manifest_entries, indent=2, ensure_ascii=False) + "\n", encoding='utf-8'
-)
+
+def render_pager(previous: dict | None, following: dict | None, lang: str | None = None) -> str:
+    """Render the prev/next navigation, bilingual unless ``lang`` is given."""
+    if previous is None and following is None:
+        return ""
+
+    def text(fr: str, en: str) -> str:
+        # Neighbour titles may come from the admin, through the worker.
+        fr, en = escape_text(fr), escape_text(en)
+        if lang is None:
+            return f' data-fr="{fr}" data-en="{en}">{fr}'
+        return f'>{fr if lang == "fr" else en}'
+
+    links = []
+    for neighbour, rel, label_fr, label_en in (
+        (previous, "prev", UI_LABELS["fr"]["label_previous"], UI_LABELS["en"]["label_previous"]),
+        (following, "next", UI_LABELS["fr"]["label_next"], UI_LABELS["en"]["label_next"]),
+    ):
+        if neighbour is None:
+            continue
+        links.append(
+            f'\n        <a class="check-pager-link check-pager-link--{rel}" href="{escape_text(neighbour["slug"])}.html" rel="{rel}">'
+            f'\n          <span class="check-pager-label"{text(label_fr, label_en)}</span>'
+            f'\n          <span class="check-pager-title"{text(neighbour["title_fr"], neighbour["title_en"])}</span>'
+            '\n        </a>'
+        )
+    return '\n      <nav class="check-pager">' + "".join(links) + "\n      </nav>"
+
+
+def build_fragment(
+    payload: dict, previous: dict | None = None, following: dict | None = None
+) -> dict:
+    """Per-check JSON consumed by the detail view of index.html.
+
+    Rich content from the admin travels as ``<name>_<lang>_html``, only for the
+    checks that have some.
+    """
+    rich = {
+        f"{name}_{code}_html": html_value
+        for name in ("overview", "remediation")
+        for code, html_value in rich_text(payload, name).items()
+    }
+    return {
+        "id": payload["identifier"],
+        "slug": payload["slug"],
+        "level": payload["level"],
+        "script": payload["script"],
+        "title_fr": payload["title_fr"],
+        "title_en": payload["title_en"],
+        "status_fr": payload["status_fr"],
+        "status_en": payload["status_en"],
+        "overview_fr": payload["overview_fr"],
+        "overview_en": payload["overview_en"],
+        "remediation_fr": payload["remediation_fr"],
+        "remediation_en": payload["remediation_en"],
+        **rich,
+        "previous": previous["slug"] if previous else None,
+        "next": following["slug"] if following else None,
+    }
+
+
+def escape_text(value: str) -> str:
+    """Escape text interpolated into the templates' markup or attribute values."""
+    return html.escape(value, quote=False).replace('"', "&quot;")
+
+
+def escape_fields(payload: dict) -> dict:
+    return {
+        key: escape_text(value) if isinstance(value, str) else value
+        for key, value in payload.items()
+    }
+
+
+def rich_text(payload: dict, name: str) -> dict[str, str]:
+    """Per-language rich HTML of a block, the other language standing in for a missing one."""
+    rich = {code: payload.get(f"{name}_{code}_html", "") for code in UI_LABELS}
+    fallback = rich["fr"] or rich["en"]
+    return {code: value or fallback for code, value in rich.items()} if fallback else {}
+
+
+def render_text_block(payload: dict, name: str, lang: str | None = None) -> str:
+    """Render the overview or remediation block of a detail page.
+
+    Rich content imported from the admin (``<name>_fr_html``) is kept as the
+    ``data-*-html`` attributes the admin writes; plain text stays a paragraph.
+    """
+    rich = {code: payload.get(f"{name}_{code}_html", "") for code in UI_LABELS}
+    if lang is not None:
+        text = rich[lang] or rich["fr"]
+        if text:
+            return f"<div>{text}</div>"
+        return f"<p>{escape_text(payload[f'{name}_{lang}'])}</p>"
+
+    attributes = " ".join(
+        f'data-{code}="{escape_text(payload[f"{name}_{code}"])}"' for code in UI_LABELS
+    )
+    if not any(rich.values()):
+        return f"<p {attributes}>{escape_text(payload[f'{name}_fr'])}</p>"
+    fallback = rich["fr"] or rich["en"]
+    for code in UI_LABELS:
+        attributes += f' data-{code}-html="{escape_text(rich[code] or fallback)}"'
+    return f"<div {attributes}>{fallback}</div>"
+
+
+def render_detail(
+    payload: dict, previous: dict | None = None, following: dict | None = None
+) -> str:
+    return TEMPLATE.format(
+        **escape_fields(payload),
+        overview_block=render_text_block(payload, "overview"),
+        remediation_block=render_text_block(payload, "remediation"),
+        prefetch_links=render_prefetch_links(previous, following),
+        pager=render_pager(previous, following),
+    )
+
+
+def render_localized_detail(
+    payload: dict, lang: str, previous: dict | None = None, following: dict | None = None
+) -> str:
+    """Render a single-language detail page with its text already inline."""
+    other_lang = "en" if lang == "fr" else "fr"
+    labels = UI_LABELS[lang]
+    escaped = escape_fields(payload)
+    return LOCALIZED_TEMPLATE.format(
+        lang=lang,
+        other_lang=other_lang,
+        prefetch_links=render_prefetch_links(previous, following),
+        pager=render_pager(previous, following, lang),
+        slug=escaped["slug"],
+        identifier=escaped["identifier"],
+        level=escaped["level"],
+        title=escaped[f"title_{lang}"],
+        status=escaped[f"status_{lang}"],
+        overview_block=render_text_block(payload, "overview", lang),
+        remediation_block=render_text_block(payload, "remediation", lang),
+        **labels,
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate manifest.json and the checks/*.html detail pages."
+    )
+    parser.add_argument(
+        "--split-languages",
+        action="store_true",
+        help="also emit pre-rendered checks/fr/<slug>.html and checks/en/<slug>.html pages",
+    )
+    parser.add_argument(
+        "--critical-css",
+        action="store_true",
+        help="inline the critical rules of style.css in index.html and the detail pages",
+    )
+    parser.add_argument(
+        "--results",
+        type=Path,
+        metavar="AGGREGATE",
+        help="render dashboard.html/dashboard.json from a `python -m docs_cc ingest` aggregate",
+    )
+    parser.add_argument(
+        "--manifest-history",
+        type=int,
+        default=DEFAULT_HISTORY,
+        help="number of previous manifest versions index.html can update from with a delta",
+    )
+    parser.add_argument(
+        "--dashboard-top",
+        type=int,
+        default=DEFAULT_TOP,
+        help="number of failing checks listed per level on the dashboard",
+    )
+    parser.add_argument(
+        "--bundle",
+        type=Path,
+        nargs="?",
+        const=BUNDLE_PATH,
+        metavar="PATH",
+        help=f"also write a single-file offline bundle of the docs (default: {BUNDLE_PATH})",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="minify the generated pages and write style.min.css/script.min.js; "
+        "without it every page uses the readable assets",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    checks = load_checks()
+    if not checks:
+        raise SystemExit("No checks defined")
+
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    if args.split_languages:
+        for lang in UI_LABELS:
+            (OUTPUT_DIR / lang).mkdir(exist_ok=True)
+
+    manifest_entries = []
+    fragments = {}
+    pages = []
+
+    payloads = [build_payload(check) for check in checks]
+    neighbours = compute_neighbours(payloads)
+
+    for payload in payloads:
+        slug = payload["slug"]
+        previous, following = neighbours[slug]
+        path = OUTPUT_DIR / f"{slug}.html"
+        path.write_text(render_detail(payload, previous, following), encoding='utf-8')
+        pages.append(path)
+        fragment = build_fragment(payload, previous, following)
+        fragments[slug] = fragment
+        (OUTPUT_DIR / f"{slug}.json").write_text(
+            json.dumps(fragment, ensure_ascii=False, separators=(",", ":")) + "\n",
+            encoding='utf-8',
+        )
+
+        if args.split_languages:
+            for lang in UI_LABELS:
+                localized_path = OUTPUT_DIR / lang / f"{slug}.html"
+                localized_path.write_text(
+                    render_localized_detail(payload, lang, previous, following),
+                    encoding='utf-8',
+                )
+                pages.append(localized_path)
+
+        manifest_entries.append(build_manifest_entry(payload))
+
+    manifest_path = Path('manifest.json')
+    manifest_path.write_text(dump_manifest(manifest_entries), encoding='utf-8')
+    versions_report = write_manifest_versions(Path('.'), args.manifest_history)
+    print(versions_report.format())
+    size = write_search_db(SEARCH_DB_PATH, payloads)
+    print(f"{SEARCH_DB_PATH}: {len(payloads)} checks indexed, {size} bytes")
+
+    if args.results:
+        dashboard_path, _ = write_dashboard(
+            args.results, Path('.'), STATUS_LABELS, args.dashboard_top
+        )
+        pages.append(dashboard_path)
+
+    if INDEX_PATH.is_file():
+        index_html = INDEX_PATH.read_text(encoding='utf-8')
+        # Without --critical-css, a previous run's inline rules go back to a plain link.
+        updated_index_html = index_html if args.critical_css else strip_inlined_css(index_html)
+        updated_index_html = use_minified_assets(updated_index_html, args.minify)
+        if updated_index_html != index_html:
+            INDEX_PATH.write_text(updated_index_html, encoding='utf-8')
+
+    if args.bundle and INDEX_PATH.is_file():
+        report = write_bundle(
+            args.bundle,
+            INDEX_PATH,
+            STYLESHEET_PATH,
+            SCRIPT_PATH,
+            manifest_entries,
+            fragments,
+            args.minify,
+            compute_order(manifest_entries, versions_report.version),
+        )
+        print(report.format())
+
+    if args.critical_css:
+        targets = pages + [INDEX_PATH] if INDEX_PATH.is_file() else pages
+        for report in apply_critical_css(targets, STYLESHEET_PATH, SCRIPT_PATH):
+            print(report.format())
+
+    if args.minify:
+        for report in apply_minification(pages, STYLESHEET_PATH, SCRIPT_PATH):
+            print(report.format())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,8 @@
 from pathlib import Path
 import json
 
+from docs_cc.manifest_versions import write_manifest_versions
+
 checks = [
     {
         "id": "CHK001",
@@ -850,6 +852,7 @@ manifest_data = [
 ]
 
 (root / 'manifest.json').write_text(json.dumps(manifest_data, ensure_ascii=False, indent=2), encoding='utf-8')
+write_manifest_versions(root)
 
 detail_template = """<!DOCTYPE html>
 <html lang=\"fr\">
@@ -876,48 +879,48 @@ detail_template = """<!DOCTYPE html>
       </div>
     </header>
     <main>
-      <h1 class=\"page-title\" data-fr=\"{title_fr}\" data-en=\"{title_en}\"></h1>
+      <h1 class=\"page-title\" data-fr=\"{title_fr}\" data-en=\"{title_en}\">{title_fr}</h1>
       <table class=\"info-table\">
         <tbody>
           <tr>
-            <th data-fr=\"Identifiant\" data-en=\"Identifier\"></th>
+            <th data-fr=\"Identifiant\" data-en=\"Identifier\">Identifiant</th>
             <td>{id}</td>
           </tr>
           <tr>
-            <th data-fr=\"Script associé\" data-en=\"Associated script\"></th>
+            <th data-fr=\"Script associé\" data-en=\"Associated script\">Script associé</th>
             <td>{script}</td>
           </tr>
           <tr>
-            <th data-fr=\"Niveau de criticité\" data-en=\"Criticality level\"></th>
+            <th data-fr=\"Niveau de criticité\" data-en=\"Criticality level\">Niveau de criticité</th>
             <td><span class=\"level-pill level-{level}\">{level}</span></td>
           </tr>
         </tbody>
       </table>
       <section class=\"content-section\">
-        <h2 data-fr=\"Explications\" data-en=\"Overview\"></h2>
-        <p data-fr=\"{description_fr}\" data-en=\"{description_en}\"></p>
+        <h2 data-fr=\"Explications\" data-en=\"Overview\">Explications</h2>
+        <p data-fr=\"{description_fr}\" data-en=\"{description_en}\">{description_fr}</p>
       </section>
       <section class=\"content-section\">
-        <h2 data-fr=\"Résolution\" data-en=\"Remediation\"></h2>
-        <p data-fr=\"{resolution_fr}\" data-en=\"{resolution_en}\"></p>
+        <h2 data-fr=\"Résolution\" data-en=\"Remediation\">Résolution</h2>
+        <p data-fr=\"{resolution_fr}\" data-en=\"{resolution_en}\">{resolution_fr}</p>
       </section>
-      <a class=\"return-button\" href=\"../index.html\" data-fr=\"Retour à la liste\" data-en=\"Back to list\"></a>
+      <a class=\"return-button\" href=\"../index.html\" data-fr=\"Retour à la liste\" data-en=\"Back to list\">Retour à la liste</a>
     </main>
     <footer class=\"primary-footer\">
       <div class=\"footer-brand\">MAESTRIA</div>
       <div class=\"footer-links\">
         <div class=\"footer-column\">
-          <h3 data-fr=\"Support\" data-en=\"Support\"></h3>
+          <h3 data-fr=\"Support\" data-en=\"Support\">Support</h3>
           <ul>
-            <li><span data-fr=\"Centre de services\" data-en=\"Service desk\"></span></li>
-            <li><span data-fr=\"Documentation technique\" data-en=\"Technical documentation\"></span></li>
+            <li><span data-fr=\"Centre de services\" data-en=\"Service desk\">Centre de services</span></li>
+            <li><span data-fr=\"Documentation technique\" data-en=\"Technical documentation\">Documentation technique</span></li>
           </ul>
         </div>
         <div class=\"footer-column\">
-          <h3 data-fr=\"Mentions\" data-en=\"Legal\"></h3>
+          <h3 data-fr=\"Mentions\" data-en=\"Legal\">Mentions</h3>
           <ul>
-            <li><span data-fr=\"Mentions légales\" data-en=\"Legal notice\"></span></li>
-            <li><span data-fr=\"Politique de confidentialité\" data-en=\"Privacy policy\"></span></li>
+            <li><span data-fr=\"Mentions légales\" data-en=\"Legal notice\">Mentions légales</span></li>
+            <li><span data-fr=\"Politique de confidentialité\" data-en=\"Privacy policy\">Politique de confidentialité</span></li>
           </ul>
         </div>
       </div>
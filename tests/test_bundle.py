@@ -0,0 +1,71 @@
+from pathlib import Path
+
+from docs_cc.bundle import MANIFEST_DATA_ID, build_bundle
+from docs_cc.critical_css import inline_critical_css
+
+CSS = ".card{color:red}\n.unused{color:blue}\n"
+SCRIPT = "console.log('</script>');\n"
+INDEX = """<!DOCTYPE html>
+<html lang="fr">
+  <head>
+    <link rel="stylesheet" href="assets/css/style.css" />
+  </head>
+  <body data-page="index">
+    <div class="card"></div>
+    <script src="assets/js/script.js"></script>
+  </body>
+</html>
+"""
+MANIFEST = [{"id": "C1", "file": "checks/c1.html", "title_fr": "</script>"}]
+FRAGMENTS = {"c1": {"slug": "c1"}}
+
+
+def _assert_self_contained(bundle: str) -> None:
+    assert "assets/css" not in bundle
+    assert "assets/js" not in bundle
+    assert "data-critical-css" not in bundle
+    assert "<noscript>" not in bundle
+    assert bundle.count(".unused{color:blue}") == 1
+    assert "<html lang=\"fr\" data-bundle>" in bundle
+    assert f'id="{MANIFEST_DATA_ID}"' in bundle
+    assert 'data-fragment="c1"' in bundle
+    # Embedded data and script cannot close their <script> element early.
+    assert bundle.count("</script>") == bundle.count("<script")
+
+
+def test_bundle_inlines_full_stylesheet():
+    _assert_self_contained(build_bundle(INDEX, CSS, SCRIPT, MANIFEST, FRAGMENTS))
+
+
+def test_bundle_after_critical_css_inlines_full_stylesheet_once():
+    critical_index = inline_critical_css(INDEX, ".card{color:red}")
+    assert "data-critical-css" in critical_index
+    _assert_self_contained(build_bundle(critical_index, CSS, SCRIPT, MANIFEST, FRAGMENTS))
+
+
+def test_bundle_embeds_order_when_given():
+    bundle = build_bundle(INDEX, CSS, SCRIPT, MANIFEST, FRAGMENTS, {"version": "v"})
+    assert 'id="manifest-order">{"version":"v"}</script>' in bundle
+
+
+def test_generated_bundle_after_critical_css_run(tmp_path: Path, monkeypatch):
+    import generate_checks_docs
+
+    root = Path(generate_checks_docs.__file__).resolve().parent
+    for name in ("index.html", "assets/css/style.css", "assets/js/script.js"):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes((root / name).read_bytes())
+    monkeypatch.chdir(tmp_path)
+
+    assert generate_checks_docs.main(["--critical-css"]) == 0
+    assert "data-critical-css" in (tmp_path / "index.html").read_text(encoding="utf-8")
+    assert generate_checks_docs.main(["--critical-css", "--bundle"]) == 0
+    bundle = (tmp_path / "precheck-docs.html").read_text(encoding="utf-8")
+    assert "assets/css" not in bundle
+    assert "data-critical-css" not in bundle
+
+    assert generate_checks_docs.main([]) == 0
+    index = (tmp_path / "index.html").read_text(encoding="utf-8")
+    assert '<link rel="stylesheet" href="assets/css/style.css" />' in index
+    assert "data-critical-css" not in index
+
@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+from docs_cc.dashboard import build_dashboard_data, render_dashboard, write_dashboard
+
+
+def _check(check_id, level, sites_failing, failures, **fields):
+    return {
+        "id": check_id,
+        "level": level,
+        "title_fr": check_id.lower(),
+        "title_en": check_id.lower(),
+        "file": f"checks/{check_id.lower()}.html",
+        "runs": 100,
+        "sites_failing": sites_failing,
+        "failures": failures,
+        **fields,
+    }
+
+
+AGGREGATE = {
+    "rows": 1000,
+    "sites": 40,
+    "levels": {"ERROR": {"failures": 31}, "WARNING": {"failures": 2}},
+    "checks": [
+        _check("B", "ERROR", 10, 12),
+        _check("A", "ERROR", 10, 12),
+        _check("C", "ERROR", 4, 15),
+        _check("D", "ERROR", 12, 3),
+        _check("E", "ERROR", 0, 0),
+        _check("W", "WARNING", 1, 2),
+    ],
+}
+
+
+def test_top_checks_are_ranked_per_level():
+    data = build_dashboard_data(AGGREGATE, top=3)
+    error = data["levels"]["ERROR"]
+    assert [check["id"] for check in error["top"]] == ["D", "A", "B"]
+    assert (error["failures"], error["checks_failing"]) == (31, 4)
+    assert error["top"][0]["share"] == 30.0
+    assert [check["id"] for check in data["levels"]["WARNING"]["top"]] == ["W"]
+    assert data["levels"]["FATAL_ERROR"] == {"failures": 0, "checks_failing": 0, "top": []}
+
+
+def test_render_escapes_titles_and_labels():
+    aggregate = dict(
+        AGGREGATE,
+        checks=[_check("X", "ERROR", 1, 1, title_fr='<script>"fr"</script>', title_en="a & b", file='checks/x".html')],
+    )
+    page = render_dashboard(build_dashboard_data(aggregate), {"ERROR": {"fr": "Échec <majeur>", "en": "Major"}})
+    assert "<script>\"fr\"" not in page
+    assert 'data-fr="&lt;script&gt;&quot;fr&quot;&lt;/script&gt;"' in page
+    assert 'data-en="a &amp; b"' in page
+    assert 'href="checks/x&quot;.html"' in page
+    assert "Échec &lt;majeur&gt;" in page
+    assert "Aucun échec remonté." in page
+
+
+def test_write_dashboard(tmp_path: Path):
+    results = tmp_path / "aggregate.json"
+    results.write_text(json.dumps(AGGREGATE), encoding="utf-8")
+    page_path, data_path = write_dashboard(results, tmp_path, {}, top=1)
+    data = json.loads(data_path.read_text(encoding="utf-8"))
+    assert [check["id"] for check in data["levels"]["ERROR"]["top"]] == ["D"]
+    assert "checks/d.html" in page_path.read_text(encoding="utf-8")
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+
+from docs_cc.deploy import INVENTORY_NAME, deploy, plan_deploy
+
+
+def test_plan_deploy_classifies_files():
+    plan = plan_deploy(
+        {"index.html": "1", "checks/a.html": "2", "checks/b.html": "3"},
+        {"index.html": "1", "checks/a.html": "old", "checks/gone.html": "4"},
+    )
+    assert plan.new == ["checks/b.html"]
+    assert plan.changed == ["checks/a.html"]
+    assert plan.unchanged == ["index.html"]
+    assert plan.orphans == ["checks/gone.html"]
+    assert plan.copies == ["checks/a.html", "checks/b.html"]
+
+
+def _tree(root: Path, files: dict[str, str]) -> None:
+    for relative, text in files.items():
+        (root / relative).parent.mkdir(parents=True, exist_ok=True)
+        (root / relative).write_text(text, encoding="utf-8")
+
+
+def test_deploy_copies_changes_and_deletes_orphans(tmp_path: Path):
+    build, target = tmp_path / "build", tmp_path / "www"
+    _tree(build, {"index.html": "index", "manifest.json": "[1]", "checks/a.html": "a"})
+    _tree(target, {"checks/old/stale.html": "stale", "admin/index.php": "<?php"})
+
+    report = deploy(build, target, jobs=2)
+    assert sorted(report.plan.new) == ["checks/a.html", "index.html", "manifest.json"]
+    assert report.plan.orphans == ["checks/old/stale.html"]
+    assert (target / "checks/a.html").read_text() == "a"
+    assert not (target / "checks/old").exists()
+    assert (target / "admin/index.php").is_file()
+    assert set(json.loads((target / INVENTORY_NAME).read_text())) == {
+        "checks/a.html",
+        "index.html",
+        "manifest.json",
+    }
+
+    (build / "checks/a.html").write_text("a2", encoding="utf-8")
+    report = deploy(build, target, jobs=2)
+    assert report.plan.changed == ["checks/a.html"]
+    assert sorted(report.plan.unchanged) == ["index.html", "manifest.json"]
+    assert (target / "checks/a.html").read_text() == "a2"
+
+
+def test_dry_run_leaves_target_untouched(tmp_path: Path):
+    build, target = tmp_path / "build", tmp_path / "www"
+    _tree(build, {"index.html": "index"})
+    _tree(target, {"checks/gone.html": "gone"})
+
+    report = deploy(build, target, jobs=1, dry_run=True)
+    assert report.plan.new == ["index.html"]
+    assert report.plan.orphans == ["checks/gone.html"]
+    assert "would delete checks/gone.html" in report.format()
+    assert not (target / "index.html").exists()
+    assert (target / "checks/gone.html").exists()
+    assert not (target / INVENTORY_NAME).exists()
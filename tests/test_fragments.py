@@ -0,0 +1,29 @@
+import generate_checks_docs as generator
+
+
+def _payload(**fields):
+    check = dict(generator.CHECKS[0], **fields)
+    return generator.build_payload(check)
+
+
+def test_plain_fragment_has_no_rich_fields():
+    fragment = generator.build_fragment(_payload())
+    assert not [key for key in fragment if key.endswith("_html")]
+
+
+def test_fragment_keeps_rich_content_with_language_fallback():
+    rich = "<h3>Étapes</h3><ul><li>un</li></ul>"
+    fragment = generator.build_fragment(_payload(remediation_fr_html=rich))
+    assert fragment["remediation_fr_html"] == rich
+    assert fragment["remediation_en_html"] == rich
+    assert "overview_fr_html" not in fragment
+
+
+def test_pager_escapes_neighbour_titles():
+    neighbour = {"slug": "next", "title_fr": 'Clé "<b>" & co', "title_en": "<script>x</script>"}
+    for lang in (None, "fr", "en"):
+        pager = generator.render_pager(None, neighbour, lang)
+        assert "<b>" not in pager and "<script>" not in pager
+    pager = generator.render_pager(None, neighbour)
+    assert 'data-fr="Clé &quot;&lt;b&gt;&quot; &amp; co"' in pager
+    assert 'data-en="&lt;script&gt;x&lt;/script&gt;"' in pager
@@ -0,0 +1,88 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from docs_cc.ingest import FleetAggregate, ManifestIndex, detect_format, ingest, iter_rows
+
+MANIFEST = [
+    {"id": "DB_SIZE", "level": "ERROR", "script": "db_size.ps1", "file": "checks/db-size.html"},
+    {"id": "DISK", "level": "WARNING", "script": "shared.ps1", "file": "checks/disk.html"},
+    {"id": "RAM", "level": "WARNING", "script": "shared.ps1", "file": "checks/ram.html"},
+    {"id": "NOTE", "level": "INFORMATION", "script": "N/A", "file": "checks/note.html"},
+]
+
+
+def test_detect_format():
+    assert detect_format(Path("results.csv")) == "csv"
+    assert detect_format(Path("results.ndjson.gz")) == "ndjson"
+    assert detect_format(Path("results.JSONL")) == "ndjson"
+    assert detect_format(Path("results.txt")) == "csv"
+
+
+def test_iter_rows_reads_csv_and_gzip(tmp_path: Path):
+    text = " Site ,CHECK_ID,Status\nLAB-1,DB_SIZE,FAIL\nLAB-2,DISK,PASS\n"
+    (tmp_path / "results.csv").write_text(text, encoding="utf-8")
+    with gzip.open(tmp_path / "results.csv.gz", "wt", encoding="utf-8") as handle:
+        handle.write(text)
+
+    for name in ("results.csv", "results.csv.gz"):
+        assert list(iter_rows(tmp_path / name)) == [
+            {"site": "LAB-1", "check_id": "DB_SIZE", "status": "FAIL"},
+            {"site": "LAB-2", "check_id": "DISK", "status": "PASS"},
+        ]
+
+
+def test_iter_rows_reads_ndjson(tmp_path: Path):
+    path = tmp_path / "results.ndjson"
+    path.write_text('{"Site": "LAB-1", "ID": "RAM"}\n\n[1]\n{"site": "LAB-2"}\n', encoding="utf-8")
+    assert list(iter_rows(path)) == [{"site": "LAB-1", "id": "RAM"}, {"site": "LAB-2"}]
+
+    path.write_text('{"site": "LAB-1"}\n{"site": \n', encoding="utf-8")
+    with pytest.raises(ValueError, match="results.ndjson:2"):
+        list(iter_rows(path))
+
+
+def test_aggregate_joins_rows_on_the_manifest():
+    index = ManifestIndex(MANIFEST)
+    aggregate = FleetAggregate()
+    rows = [
+        {"site": "LAB-1", "check_id": "db_size", "status": "FAIL"},
+        {"site": "LAB-2", "script": "C:\\scripts\\DB_SIZE.ps1", "status": "error"},
+        {"site": "LAB-2", "check_id": "DB_SIZE", "status": "FAIL"},
+        {"site": "LAB-1", "check_id": "DISK", "status": "ok"},
+        {"site": "LAB-1", "script": "shared.ps1", "status": "FAIL"},
+        {"site": "LAB-3", "check_id": "GONE", "status": "FAIL"},
+        {"site": "LAB-3", "check_id": "NOTE", "status": "skipped"},
+        {"check_id": "NOTE", "result": "warn"},
+    ]
+    for row in rows:
+        aggregate.add(index, row)
+
+    result = aggregate.to_dict(index)
+    assert (result["rows"], result["skipped"], result["unmatched"], result["sites"]) == (8, 1, 2, 3)
+    assert [(item["id"], item["runs"], item["failures"], item["sites_failing"]) for item in result["checks"]] == [
+        ("DB_SIZE", 3, 3, 2),
+        ("NOTE", 1, 1, 1),
+        ("DISK", 1, 0, 0),
+    ]
+    assert result["levels"]["ERROR"] == {"failures": 3, "checks_failing": 1}
+    assert result["levels"]["WARNING"] == {"failures": 0, "checks_failing": 0}
+    assert {item["site"]: item["failures"] for item in result["sites_detail"]} == {
+        "(unknown)": 1,
+        "LAB-1": 1,
+        "LAB-2": 2,
+    }
+
+
+def test_unmatched_rows_do_not_grow_the_aggregate(tmp_path: Path):
+    index = ManifestIndex(MANIFEST)
+    path = tmp_path / "results.ndjson"
+    path.write_text(
+        "".join(json.dumps({"site": "LAB-1", "check_id": f"UNKNOWN_{n}", "status": "FAIL"}) + "\n" for n in range(500)),
+        encoding="utf-8",
+    )
+    aggregate = ingest([path], index)
+    assert aggregate.unmatched == 500
+    assert not aggregate.runs_by_check and not aggregate.runs_by_site
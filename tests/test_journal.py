@@ -0,0 +1,132 @@
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from docs_cc.journal import apply_operations, compact_manifest, journal_pending
+from docs_cc.manifest_versions import dump_manifest, manifest_version, write_manifest_versions
+
+
+def _operation(entry, match_file="", match_id=""):
+    return {"match_file": match_file, "match_id": match_id, "entry": entry}
+
+
+def test_apply_operations_matches_by_file_then_id_and_follows_renames():
+    manifest = [
+        {"id": "A", "file": "checks/a.html", "level": "ERROR"},
+        {"id": "B", "file": "checks/b.html", "level": "WARNING"},
+    ]
+    result = apply_operations(
+        manifest,
+        [
+            _operation({"level": "FATAL_ERROR"}, match_file="checks/a.html"),
+            _operation({"file": "checks/b2.html"}, match_id="B"),
+            _operation({"level": "ERROR"}, match_file="checks/b2.html"),
+            _operation({"id": "C", "file": "checks/c.html"}),
+        ],
+    )
+    assert result == [
+        {"id": "A", "file": "checks/a.html", "level": "FATAL_ERROR"},
+        {"id": "B", "file": "checks/b2.html", "level": "ERROR"},
+        {"id": "C", "file": "checks/c.html"},
+    ]
+    assert manifest[1]["file"] == "checks/b.html"
+
+
+def test_compact_manifest_applies_and_truncates(tmp_path: Path):
+    (tmp_path / "manifest.json").write_text(json.dumps([{"id": "A", "file": "checks/a.html"}]))
+    (tmp_path / "manifest.version.json").write_text(json.dumps({"version": "x", "history": ["x"], "deltas": {}}))
+    lines = [
+        json.dumps(_operation({"title_fr": "Titre"}, match_file="checks/a.html")),
+        "{not json",
+        json.dumps(_operation({"id": "B", "file": "checks/b.html"})),
+    ]
+    # The last line is incomplete: an admin is still writing it.
+    (tmp_path / "manifest.json.journal").write_text("\n".join(lines) + "\n" + '{"partial"')
+
+    assert compact_manifest(tmp_path) == 2
+    data = (tmp_path / "manifest.json").read_bytes()
+    assert data.decode("utf-8") == dump_manifest(
+        [
+            {"id": "A", "file": "checks/a.html", "title_fr": "Titre"},
+            {"id": "B", "file": "checks/b.html"},
+        ]
+    )
+    version = json.loads((tmp_path / "manifest.version.json").read_text())
+    assert version["version"] == manifest_version(data)
+    assert version["history"] == [version["version"]]
+    assert (tmp_path / version["order"]).is_file()
+    assert (tmp_path / "manifest.json.journal").read_text() == '{"partial"'
+    assert journal_pending(tmp_path)
+
+
+def test_compact_manifest_without_journal_is_a_no_op(tmp_path: Path):
+    (tmp_path / "manifest.json").write_text("[]\n")
+    assert compact_manifest(tmp_path) == 0
+    assert (tmp_path / "manifest.json").read_text() == "[]\n"
+    assert not journal_pending(tmp_path)
+
+
+def test_compact_manifest_locks_with_msvcrt_without_fcntl(tmp_path: Path, monkeypatch):
+    calls = []
+    msvcrt = types.SimpleNamespace(
+        LK_LOCK=1,
+        LK_UNLCK=0,
+        locking=lambda fd, mode, size: calls.append(mode),
+    )
+    monkeypatch.setitem(sys.modules, "fcntl", None)
+    monkeypatch.setitem(sys.modules, "msvcrt", msvcrt)
+    (tmp_path / "manifest.json").write_text("[]\n")
+    (tmp_path / "manifest.json.journal").write_text(json.dumps(_operation({"file": "checks/a.html"})) + "\n")
+
+    assert compact_manifest(tmp_path) == 1
+    assert json.loads((tmp_path / "manifest.json").read_text()) == [{"file": "checks/a.html"}]
+    assert calls and calls.count(1) == calls.count(0)
+
+
+@pytest.mark.parametrize("contents", ['[{"file": "checks/a.html"}', '{"file": "checks/a.html"}'])
+def test_compact_manifest_keeps_journal_when_manifest_is_unreadable(tmp_path: Path, contents):
+    (tmp_path / "manifest.json").write_text(contents)
+    journal = json.dumps(_operation({"file": "checks/b.html"})) + "\n"
+    (tmp_path / "manifest.json.journal").write_text(journal)
+
+    with pytest.raises(ValueError):
+        compact_manifest(tmp_path)
+    assert (tmp_path / "manifest.json").read_text() == contents
+    assert (tmp_path / "manifest.json.journal").read_text() == journal
+
+
+def test_compact_manifest_starts_from_empty_without_manifest(tmp_path: Path):
+    (tmp_path / "manifest.json.journal").write_text(json.dumps(_operation({"file": "checks/a.html"})) + "\n")
+    assert compact_manifest(tmp_path) == 1
+    assert json.loads((tmp_path / "manifest.json").read_text()) == [{"file": "checks/a.html"}]
+
+
+def test_compaction_keeps_the_generator_serialization(tmp_path: Path):
+    manifest = [{"id": "A", "file": "checks/a.html", "title_fr": "Élévation", "title_en": "a/b"}]
+    (tmp_path / "manifest.json").write_text(dump_manifest(manifest), encoding="utf-8")
+    before = (tmp_path / "manifest.json").read_bytes()
+    (tmp_path / "manifest.json.journal").write_text(
+        json.dumps(_operation({"title_fr": "Élévation"}, match_file="checks/a.html")) + "\n"
+    )
+
+    assert compact_manifest(tmp_path) == 1
+    assert (tmp_path / "manifest.json").read_bytes() == before
+    version = json.loads((tmp_path / "manifest.version.json").read_text())
+    assert version["version"] == manifest_version(before)
+
+
+def test_compaction_publishes_a_delta_from_the_built_version(tmp_path: Path):
+    (tmp_path / "manifest.json").write_text(dump_manifest([{"id": "A", "file": "checks/a.html"}]), encoding="utf-8")
+    built = write_manifest_versions(tmp_path).version
+    (tmp_path / "manifest.json.journal").write_text(
+        json.dumps(_operation({"level": "ERROR"}, match_file="checks/a.html")) + "\n"
+    )
+
+    assert compact_manifest(tmp_path) == 1
+    version = json.loads((tmp_path / "manifest.version.json").read_text())
+    assert version["history"] == [version["version"], built]
+    delta = json.loads((tmp_path / version["deltas"][built]).read_text())
+    assert delta["changed"] == [{"id": "A", "file": "checks/a.html", "level": "ERROR"}]
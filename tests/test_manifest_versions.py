@@ -0,0 +1,97 @@
+import json
+from pathlib import Path
+
+from docs_cc.manifest_versions import (
+    VERSION_NAME,
+    VERSIONS_DIR,
+    compute_delta,
+    compute_order,
+    dump_manifest,
+    manifest_version,
+    write_manifest_versions,
+)
+
+
+def _entry(name, level="ERROR", title=None):
+    return {
+        "id": name.upper(),
+        "level": level,
+        "title_fr": title or name,
+        "title_en": title or name,
+        "file": f"checks/{name}.html",
+    }
+
+
+def _apply(entries, delta):
+    """Same steps as applyManifestDelta() in assets/js/script.js."""
+    by_file = {entry["file"]: entry for entry in entries}
+    for file in delta["removed"]:
+        by_file.pop(file, None)
+    for entry in delta["changed"] + delta["added"]:
+        by_file[entry["file"]] = entry
+    assert len(by_file) == delta["count"]
+    return by_file
+
+
+def _write(root: Path, manifest, history=5):
+    (root / "manifest.json").write_text(dump_manifest(manifest), encoding="utf-8")
+    return write_manifest_versions(root, history)
+
+
+def test_delta_round_trip():
+    old = [_entry("a"), _entry("b"), _entry("c")]
+    new = [_entry("a"), _entry("b", level="WARNING"), _entry("d")]
+    delta = compute_delta(old, new)
+    assert [entry["file"] for entry in delta["added"]] == ["checks/d.html"]
+    assert [entry["file"] for entry in delta["changed"]] == ["checks/b.html"]
+    assert delta["removed"] == ["checks/c.html"]
+    assert _apply(old, delta) == {entry["file"]: entry for entry in new}
+
+
+def test_versions_deltas_lead_to_current_manifest(tmp_path: Path):
+    manifests = [
+        [_entry("a"), _entry("b")],
+        [_entry("a", title="A2"), _entry("b")],
+        [_entry("a", title="A2"), _entry("c")],
+    ]
+    versions = [_write(tmp_path, manifest).version for manifest in manifests]
+    info = json.loads((tmp_path / VERSION_NAME).read_text(encoding="utf-8"))
+    assert info["version"] == versions[-1]
+    assert info["history"] == list(reversed(versions))
+    assert info["version"] == manifest_version((tmp_path / "manifest.json").read_bytes())
+
+    for old_version, manifest in zip(versions[:-1], manifests):
+        delta = json.loads((tmp_path / info["deltas"][old_version]).read_text(encoding="utf-8"))
+        assert (delta["from"], delta["to"]) == (old_version, versions[-1])
+        assert _apply(manifest, delta) == {entry["file"]: entry for entry in manifests[-1]}
+
+
+def test_old_versions_are_pruned(tmp_path: Path):
+    for index in range(4):
+        report = _write(tmp_path, [_entry(f"check{index}")], history=1)
+    names = sorted(path.name for path in (tmp_path / VERSIONS_DIR).iterdir())
+    info = json.loads((tmp_path / VERSION_NAME).read_text(encoding="utf-8"))
+    previous = info["history"][1]
+    assert names == sorted(
+        [
+            f"{report.version}.json",
+            f"{report.version}.order.json",
+            f"{previous}.json",
+            f"{previous}-{report.version}.json",
+        ]
+    )
+
+
+def test_order_is_per_language_and_level():
+    manifest = [
+        {**_entry("b"), "title_fr": "Éclair", "title_en": "Zeta"},
+        {**_entry("a", level="FATAL_ERROR"), "title_fr": "alpha", "title_en": "Beta"},
+        {**_entry("c", level="INFO"), "title_fr": "Delta", "title_en": "Alpha"},
+    ]
+    order = compute_order(manifest, "v1")
+    assert order["version"] == "v1"
+    assert order["fr"]["all"] == ["checks/a.html", "checks/c.html", "checks/b.html"]
+    assert order["en"]["all"] == ["checks/c.html", "checks/a.html", "checks/b.html"]
+    assert order["fr"]["fatal_error"] == ["checks/a.html"]
+    assert order["fr"]["information"] == ["checks/c.html"]
+    assert order["en"]["error"] == ["checks/b.html"]
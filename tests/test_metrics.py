@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from docs_cc.metrics import aggregate, parse_beacon, percentile, read_log
+
+
+def test_percentile_is_nearest_rank():
+    ordered = [float(value) for value in range(1, 101)]
+    assert percentile(ordered, 50) == 50.0
+    assert percentile(ordered, 95) == 95.0
+    assert percentile(ordered, 99) == 99.0
+    assert percentile([7.0], 99) == 7.0
+
+
+def test_parse_beacon_drops_invalid_spans():
+    body = json.dumps(
+        {
+            "page": "index",
+            "checks": 84,
+            "metrics": [
+                {"phase": "render", "ms": 12.5},
+                {"phase": "ready", "ms": -1},
+                {"phase": "", "ms": 3},
+                {"phase": "sidebar", "ms": "nan"},
+                {"ms": 4},
+                {"phase": "sidebar", "ms": "2"},
+            ],
+        }
+    ).encode()
+    assert parse_beacon(body) == [
+        {"page": "index", "checks": 84, "phase": "render", "ms": 12.5},
+        {"page": "index", "checks": 84, "phase": "sidebar", "ms": 2.0},
+    ]
+
+
+def test_parse_beacon_rejects_non_json():
+    with pytest.raises(ValueError):
+        parse_beacon(b"not json")
+
+
+def test_aggregate_groups_by_phase_and_catalogue_size():
+    records = [{"phase": "render", "checks": 84, "ms": float(ms)} for ms in (30, 10, 20)]
+    records.append({"phase": "render", "checks": 500, "ms": 90.0})
+    rows = aggregate(records)
+    assert [(row["phase"], row["checks"], row["count"]) for row in rows] == [
+        ("render", 84, 3),
+        ("render", 500, 1),
+    ]
+    assert (rows[0]["p50"], rows[0]["p99"]) == (20.0, 30.0)
+
+
+def test_read_log_skips_records_of_another_shape(tmp_path):
+    log = tmp_path / "metrics.ndjson"
+    lines = [
+        json.dumps({"page": "index", "phase": "render", "checks": 84, "ms": 12.5}),
+        "[1, 2]",
+        json.dumps({"phase": "render", "checks": 84}),
+        json.dumps({"phase": "render", "checks": "84", "ms": 3}),
+        '{"phase": "render", "checks": 84, "ms": 1',
+        json.dumps({"phase": "render", "checks": 84, "ms": 7}),
+    ]
+    log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    rows = aggregate(read_log(log))
+    assert [(row["phase"], row["checks"], row["count"]) for row in rows] == [("render", 84, 2)]
+    assert list(read_log(tmp_path / "missing.ndjson")) == []
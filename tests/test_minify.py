@@ -0,0 +1,58 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from docs_cc.minify import minify_js
+
+ROOT = Path(__file__).resolve().parent.parent
+NODE = shutil.which("node")
+
+SNIPPETS = {
+    "return regex": "function f(s) {\n  return /[/]\\/\\/x  y/.test(s); // comment\n}\nf('//x  y')",
+    "typeof regex": "const t = typeof /a  b/;\nt",
+    "division": "const a = 8, b = 2, c = 2;\nconst d = a / b / c; /* comment */\n(d) / 2",
+    "nested templates": "const c = 1;\n`a ${`b ${c}  // not a comment`} d ${ {k: 2}.k /* x */ }`",
+    "regex in template": "`${ /\\/\\/  x/.source }`",
+    "strings": "'// kept' + \"/* kept */\" + `  ${'`'}  `",
+}
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("return /x  y/.test(s)", "return /x  y/.test(s)\n"),
+        ("x = typeof /x  y/", "x = typeof /x  y/\n"),
+        ("x = a / b // note\ny = (a) / 2 / c", "x = a / b\ny = (a) / 2 / c\n"),
+        ("s = `${`${a}  //x`}`", "s = `${`${a}  //x`}`\n"),
+        ("s = `${ a /* c */ }  ${ {b: 1}.b }`", "s = `${ a }  ${ {b: 1}.b }`\n"),
+        ("  if (a) {\n\n    b();\n  }\n", "if (a) {\nb();\n}\n"),
+    ],
+)
+def test_minify_js_keeps_tokens(source, expected):
+    assert minify_js(source) == expected
+
+
+def _evaluate(source: str) -> str:
+    result = subprocess.run(
+        [NODE, "-e", "process.stdout.write(JSON.stringify(require('vm').runInNewContext(process.argv[1])))", source],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+@pytest.mark.skipif(NODE is None, reason="node is not installed")
+@pytest.mark.parametrize("name", sorted(SNIPPETS))
+def test_minified_snippets_evaluate_the_same(name):
+    source = SNIPPETS[name]
+    assert _evaluate(minify_js(source)) == _evaluate(source)
+
+
+@pytest.mark.skipif(NODE is None, reason="node is not installed")
+def test_minified_script_parses(tmp_path: Path):
+    target = tmp_path / "script.min.js"
+    target.write_text(minify_js((ROOT / "assets/js/script.js").read_text(encoding="utf-8")), encoding="utf-8")
+    subprocess.run([NODE, "--check", str(target)], check=True)
@@ -0,0 +1,69 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from docs_cc.query import match_expression, search, update_search_db, write_search_db
+
+
+def _payload(slug, level, title_fr, title_en, **fields):
+    return {
+        "slug": slug,
+        "identifier": slug.upper(),
+        "level": level,
+        "script": f"{slug}.ps1",
+        "title_fr": title_fr,
+        "title_en": title_en,
+        **fields,
+    }
+
+
+PAYLOADS = [
+    _payload("espace", "ERROR", "Espace disque système", "System disk space"),
+    _payload("securite", "WARNING", "Sécurité des échanges", "Exchange security"),
+    _payload("sequence", "ERROR", "Séquences PostgreSQL", "PostgreSQL sequences"),
+    _payload("tablespace", "FATAL_ERROR", "Tablespace PostgreSQL", "PostgreSQL tablespace"),
+]
+
+
+@pytest.fixture
+def connection(tmp_path: Path):
+    path = tmp_path / "catalogue.sqlite3"
+    assert write_search_db(path, PAYLOADS) == path.stat().st_size
+    connection = sqlite3.connect(path)
+    yield connection
+    connection.close()
+
+
+def test_match_expression_prefixes_every_word():
+    assert match_expression("postgre, table-space") == '"postgre"* "table"* "space"*'
+    assert match_expression("  ") == ""
+
+
+def test_search_folds_accents_on_prefixes_and_filters_levels(connection):
+    assert {row["id"] for row in search(connection, "secu")} == {"SECURITE"}
+    assert [row["id"] for row in search(connection, "Séq", ["ERROR"])] == ["SEQUENCE"]
+    assert search(connection, "séq", ["WARNING"]) == []
+    assert {row["id"] for row in search(connection, "postgre", ["FATAL_ERROR", "ERROR"])} == {
+        "TABLESPACE",
+        "SEQUENCE",
+    }
+
+
+def test_search_without_words_lists_levels_in_order(connection):
+    rows = search(connection, "", ["ERROR", "FATAL_ERROR"], lang="en")
+    assert [(row["id"], row["title"]) for row in rows] == [
+        ("TABLESPACE", "PostgreSQL tablespace"),
+        ("ESPACE", "System disk space"),
+        ("SEQUENCE", "PostgreSQL sequences"),
+    ]
+
+
+def test_update_search_db_replaces_and_removes_rows(connection, tmp_path: Path):
+    changed = _payload("espace", "WARNING", "Quota de stockage", "Storage quota")
+    assert update_search_db(tmp_path / "catalogue.sqlite3", [changed], ["securite"]) == 1
+
+    assert search(connection, "disque") == []
+    assert search(connection, "secu") == []
+    assert [(row["id"], row["level"]) for row in search(connection, "quota")] == [("ESPACE", "WARNING")]
+    assert connection.execute("SELECT count(*) FROM checks").fetchone() == (3,)
@@ -0,0 +1,55 @@
+import gzip
+
+import pytest
+
+from docs_cc.serve import CachedResponse, LRUCache, _accepts_gzip, _etag_matches
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ("gzip", True),
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.8", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.000", False),
+        ("deflate", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip;q=0, *", False),
+        ("identity, *;q=0.5", True),
+        ("x-gzip", True),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    assert _accepts_gzip(header) is expected
+
+
+def test_cached_response_etag_follows_body():
+    first = CachedResponse.build(b"<p>a</p>", "text/html")
+    assert gzip.decompress(first.gzip_body) == b"<p>a</p>"
+    assert first.etag == CachedResponse.build(b"<p>a</p>", "text/html").etag
+    assert first.etag != CachedResponse.build(b"<p>b</p>", "text/html").etag
+
+
+def test_etag_matches():
+    assert _etag_matches('"abc", W/"def"', '"def"')
+    assert _etag_matches("*", '"abc"')
+    assert not _etag_matches(None, '"abc"')
+    assert not _etag_matches('"abc-gz"', '"abc"')
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    entries = {key: CachedResponse.build(key.encode(), "text/plain") for key in "abc"}
+    cache.put("a", entries["a"])
+    cache.put("b", entries["b"])
+    assert cache.get("a") is entries["a"]
+    cache.put("c", entries["c"])
+    assert cache.get("b") is None
+    assert cache.get("a") is entries["a"]
+    cache.discard({"a"})
+    assert cache.get("a") is None
+    assert cache.get("c") is entries["c"]
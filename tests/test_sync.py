@@ -0,0 +1,52 @@
+import os
+from pathlib import Path
+
+import generate_checks_docs as generator
+from docs_cc.pages import parse_detail_page
+from docs_cc.sync import build_record, read_pages
+
+
+def _check(**fields):
+    return dict(generator.CHECKS[0], **fields)
+
+
+def test_rendered_page_round_trips_to_the_same_payload():
+    check = _check(
+        title_fr='Clé "<PowerShell>" & co',
+        remediation_fr_html="<ol><li>un</li></ol>",
+        remediation_en_html="<ol><li>one</li></ol>",
+    )
+    payload = generator.build_payload(check)
+    page = parse_detail_page(generator.render_detail(payload))
+    entry = {"id": payload["identifier"], "level": payload["level"], "script": payload["script"]}
+
+    record = build_record(payload["slug"], page, entry, generator)
+    assert page["title_fr"] == 'Clé "<PowerShell>" & co'
+    assert "status_fr" not in record
+    assert generator.build_payload(record) == payload
+
+
+def test_read_pages_skips_pages_by_stat_then_by_digest(tmp_path: Path):
+    payload = generator.build_payload(_check())
+    page = tmp_path / f"{payload['slug']}.html"
+    page.write_text(generator.render_detail(payload), encoding="utf-8")
+
+    records, state, parsed = read_pages(tmp_path, {}, jobs=1)
+    assert parsed == {payload["slug"]}
+    assert records[payload["slug"]]["identifier"] == payload["identifier"]
+
+    # Same stat: the cached record is used without reading the page.
+    assert read_pages(tmp_path, state, jobs=1)[2] == set()
+
+    # New mtime, same bytes: the page is read but the SHA-256 spares the parse.
+    stat = page.stat()
+    os.utime(page, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    records, state, parsed = read_pages(tmp_path, state, jobs=1)
+    assert parsed == set()
+    assert state[page.name]["mtime_ns"] == page.stat().st_mtime_ns
+    assert records[payload["slug"]]["identifier"] == payload["identifier"]
+
+    page.write_text(generator.render_detail(generator.build_payload(_check(title_fr="Autre"))), encoding="utf-8")
+    records, _, parsed = read_pages(tmp_path, state, jobs=1)
+    assert parsed == {payload["slug"]}
+    assert records[payload["slug"]]["title_fr"] == "Autre"
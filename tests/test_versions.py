@@ -0,0 +1,47 @@
+from pathlib import Path
+
+from docs_cc.versions import BlobStore, materialize
+
+
+def test_blob_store_deduplicates_and_memoizes_renders(tmp_path: Path):
+    store = BlobStore(tmp_path / ".store")
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "<p>page</p>"
+
+    digest, fresh = store.render(["checks/a.html", "payload"], render)
+    assert fresh and store.path(digest).read_text() == "<p>page</p>"
+    assert store.render(["checks/a.html", "payload"], render) == (digest, False)
+    assert len(calls) == 1
+    assert store.put(b"<p>page</p>") == digest
+    assert store.written == 1
+
+    store.save()
+    reopened = BlobStore(tmp_path / ".store")
+    assert reopened.render(["checks/a.html", "payload"], render) == (digest, False)
+
+
+def test_prune_removes_unreferenced_blobs(tmp_path: Path):
+    store = BlobStore(tmp_path / ".store")
+    kept = store.put(b"kept")
+    dropped, _ = store.render(["key"], lambda: "dropped")
+    assert store.prune({kept}) == 1
+    assert not store.path(dropped).exists()
+    assert store.renders == {}
+    assert store.path(kept).is_file()
+
+
+def test_materialize_links_blobs_and_removes_stale_files(tmp_path: Path):
+    store = BlobStore(tmp_path / ".store")
+    digest = store.put(b"content")
+    tree = tmp_path / "1.0"
+    (tree / "checks").mkdir(parents=True)
+    (tree / "checks" / "stale.html").write_text("stale")
+
+    assert materialize(tree, {"checks/a.html": digest}, store, "hardlink") == 1
+    assert (tree / "checks" / "a.html").read_bytes() == b"content"
+    assert (tree / "checks" / "a.html").stat().st_ino == store.path(digest).stat().st_ino
+    assert not (tree / "checks" / "stale.html").exists()
+    assert materialize(tree, {"checks/a.html": digest}, store, "hardlink") == 0
@@ -0,0 +1,38 @@
+import json
+import sqlite3
+from pathlib import Path
+
+from docs_cc.manifest_versions import VERSION_NAME, manifest_version
+from docs_cc.query import search
+from docs_cc.worker import RebuildQueue, run_worker
+
+
+def test_worker_refreshes_search_index_and_manifest_versions(tmp_path: Path, monkeypatch):
+    import generate_checks_docs
+
+    monkeypatch.chdir(tmp_path)
+    assert generate_checks_docs.main([]) == 0
+    built = json.loads((tmp_path / VERSION_NAME).read_text(encoding="utf-8"))["version"]
+    entry = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))[0]
+
+    # What a save in admin/index.php leaves behind: a journal operation and a job.
+    operation = {"match_file": entry["file"], "match_id": entry["id"], "entry": {"title_fr": "Zymurgie"}}
+    (tmp_path / "manifest.json.journal").write_text(json.dumps(operation) + "\n", encoding="utf-8")
+    queue = RebuildQueue(tmp_path / ".queue")
+    queue.enqueue([Path(entry["file"]).name])
+
+    assert run_worker(tmp_path, queue, once=True) == 0
+
+    connection = sqlite3.connect(tmp_path / "catalogue.sqlite3")
+    try:
+        assert [row["file"] for row in search(connection, "zymurg")] == [entry["file"]]
+        assert connection.execute("SELECT count(*) FROM checks WHERE slug = ?", (Path(entry["file"]).stem,)).fetchone() == (1,)
+    finally:
+        connection.close()
+
+    info = json.loads((tmp_path / VERSION_NAME).read_text(encoding="utf-8"))
+    assert info["version"] == manifest_version((tmp_path / "manifest.json").read_bytes())
+    assert info["version"] != built
+    assert (tmp_path / info["order"]).is_file()
+    delta = json.loads((tmp_path / info["deltas"][built]).read_text(encoding="utf-8"))
+    assert [changed["title_fr"] for changed in delta["changed"]] == ["Zymurgie"]